@@ -0,0 +1,165 @@
+"""체크포인트 쓰기 증폭 측정 — 슈퍼스텝별 저장 vs 턴 경계만 저장(압축)
+
+실제 워크플로우와 같은 슈퍼스텝 구성(model_router → intent_router → agent →
+guardrail → fix_response → guardrail → memory)의 그래프를 AgentState로 실행하여
+턴당 저장소에 쓰인 바이트/체크포인트 수와 종료 시점 보유 크기를 비교한다.
+LLM 대신 고정 응답을 사용하므로 API 키 호출 없이 실행된다.
+
+사용법:
+    python scripts/benchmark_checkpoint_compaction.py [스레드 수] [턴 수]
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from langchain_core.messages import HumanMessage
+from langgraph.graph import END, StateGraph
+
+from src.graph.checkpointer import (
+    BoundedMemorySaver,
+    CompactingCheckpointSaver,
+    SQLiteCheckpointSaver,
+)
+from src.graph.nodes.memory import memory_node
+from src.graph.workflow import TURN_BOUNDARY_CHANNELS
+from src.models.state import AgentState
+
+QUESTION = "InBody 270S에서 E001 에러가 계속 나요. 전극을 닦았는데도 같은 문제가 반복됩니다."
+ANSWER = (
+    "전극 접촉 불량(E001)은 전극 표면 오염이나 손발 건조로 발생합니다. "
+    "1단계로 전극 표면을 부드러운 천으로 닦고, 2단계로 전해질 티슈를 사용해 주세요. "
+) * 6
+MANUAL_EXCERPT = (
+    "--- 결과 1 (InBody270S_manual.pdf, p.42) ---\n"
+    "측정 전 전극을 전해질 티슈로 닦고 맨발로 발 전극 위에 올라서십시오. "
+) * 8
+
+
+def _build_graph(saver):
+    async def model_router(state: AgentState) -> dict:
+        return {"identified_model": "270S", "model_tier": "entry"}
+
+    async def intent_router(state: AgentState) -> dict:
+        return {"intent": "troubleshoot", "error_code": "E001", "support_level": "level_1"}
+
+    async def agent(state: AgentState) -> dict:
+        return {
+            "answer": ANSWER,
+            "answer_source": "llm",
+            "retrieved_docs": [MANUAL_EXCERPT] * 3,
+            "guardrail_retry_count": 0,
+        }
+
+    async def guardrail(state: AgentState) -> dict:
+        # 첫 검증은 실패시켜 fix_response 재검증 루프까지 실행
+        passed = state.get("guardrail_retry_count", 0) > 0
+        return {
+            "guardrail_passed": passed,
+            "guardrail_violations": [] if passed else ["level_1 답변에 내부 부품 언급"],
+        }
+
+    async def fix_response(state: AgentState) -> dict:
+        return {"answer": ANSWER, "guardrail_retry_count": state["guardrail_retry_count"] + 1}
+
+    graph = StateGraph(AgentState)
+    for name, node in (
+        ("model_router", model_router),
+        ("intent_router", intent_router),
+        ("troubleshoot_agent", agent),
+        ("guardrail", guardrail),
+        ("fix_response", fix_response),
+        ("memory", memory_node),
+    ):
+        graph.add_node(name, node)
+    graph.set_entry_point("model_router")
+    graph.add_edge("model_router", "intent_router")
+    graph.add_edge("intent_router", "troubleshoot_agent")
+    graph.add_edge("troubleshoot_agent", "guardrail")
+    graph.add_conditional_edges(
+        "guardrail",
+        lambda state: "memory" if state["guardrail_passed"] else "fix_response",
+        {"memory": "memory", "fix_response": "fix_response"},
+    )
+    graph.add_edge("fix_response", "guardrail")
+    graph.add_edge("memory", END)
+    return graph.compile(checkpointer=saver)
+
+
+async def _sqlite_held(saver: SQLiteCheckpointSaver) -> int:
+    """SQLite에 남아 있는 체크포인트/쓰기 바이트 합계"""
+    conn = await saver._get_conn()
+    total = 0
+    for query in (
+        "SELECT SUM(LENGTH(checkpoint) + LENGTH(metadata)) FROM checkpoints",
+        "SELECT SUM(LENGTH(value)) FROM writes",
+    ):
+        async with conn.execute(query) as cursor:
+            row = await cursor.fetchone()
+        total += row[0] or 0
+    return total
+
+
+async def _run(label: str, saver, threads: int, turns: int, held) -> None:
+    graph = _build_graph(saver)
+    started = time.perf_counter()
+    for turn in range(turns):
+        await asyncio.gather(*(
+            graph.ainvoke(
+                {"messages": [HumanMessage(content=f"[{turn}] {QUESTION}")]},
+                config={"configurable": {"thread_id": f"bench-{t}"}},
+            )
+            for t in range(threads)
+        ))
+    elapsed = time.perf_counter() - started
+
+    stats = saver.stats
+    total_turns = threads * turns
+    written = stats["bytes_written"] / total_turns
+    print(
+        f"{label:<16} | 턴당 쓰기 {written:>9,.0f}B | "
+        f"보유 {await held():>11,}B | {elapsed * 1000 / total_turns:>6.2f}ms/턴"
+    )
+    if isinstance(saver, CompactingCheckpointSaver):
+        compaction = stats["compaction"]
+        print(
+            f"{'':<16} | 저장 체크포인트 {compaction['persisted_checkpoints']}개, "
+            f"스크래치 {compaction['scratch_checkpoints']}개"
+        )
+    if hasattr(saver, "aclose"):
+        await saver.aclose()
+
+
+async def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    turns = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    print("=" * 60)
+    print(f"체크포인트 쓰기 증폭 측정 (스레드 {threads}개 × {turns}턴)")
+    print("=" * 60)
+
+    for compact in (False, True):
+        memory = BoundedMemorySaver()
+        saver = CompactingCheckpointSaver(memory, TURN_BOUNDARY_CHANNELS) if compact else memory
+        label = f"memory{' + 압축' if compact else ''}"
+
+        async def _memory_held(m=memory) -> int:
+            return m.stats["bytes_held"]
+
+        await _run(label, saver, threads, turns, _memory_held)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for compact in (False, True):
+            sqlite = SQLiteCheckpointSaver(Path(tmp) / f"checkpoints-{compact}.db")
+            saver = CompactingCheckpointSaver(sqlite, TURN_BOUNDARY_CHANNELS) if compact else sqlite
+            label = f"sqlite{' + 압축' if compact else ''}"
+            await _run(label, saver, threads, turns, lambda s=sqlite: _sqlite_held(s))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,76 @@
+"""체크포인트 직렬화 비교 — 기본(msgpack) vs zstd vs zstd + 학습 사전
+
+seed 데이터로 만든 합성 세션을 학습용/측정용으로 나누어, 학습용으로 사전을 만든 뒤
+측정용 세션의 턴 종료 상태를 직렬화하여 세션당 바이트와 턴당 직렬화/역직렬화 시간을 비교한다.
+API 키 불필요 (zstandard 패키지 필요).
+
+사용법:
+    python scripts/benchmark_checkpoint_serde.py [세션 수] [턴 수]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from scripts.train_checkpoint_dict import session_samples, synthetic_sessions
+from src.graph.serde import ZstdSerializer, train_dictionary
+
+
+def _measure(label: str, serde, sessions: list[list[dict]], baseline: float | None) -> float:
+    session_bytes = []
+    dump_us = load_us = 0.0
+    turns = 0
+    for states in sessions:
+        written = 0
+        for state in states:
+            started = time.perf_counter()
+            typed = serde.dumps_typed(state)
+            dump_us += (time.perf_counter() - started) * 1e6
+            started = time.perf_counter()
+            serde.loads_typed(typed)
+            load_us += (time.perf_counter() - started) * 1e6
+            written += len(typed[1])
+            turns += 1
+        # 압축(턴 경계만 저장) 기준 세션 보유 크기 = 마지막 턴 상태
+        session_bytes.append((written, len(typed[1])))
+
+    avg_written = sum(w for w, _ in session_bytes) / len(sessions)
+    avg_held = sum(h for _, h in session_bytes) / len(sessions)
+    ratio = f"{avg_written / baseline:>5.1%}" if baseline else "  기준"
+    print(
+        f"{label:<18} | 세션당 쓰기 {avg_written:>8,.0f}B ({ratio}) | 보유 {avg_held:>7,.0f}B | "
+        f"직렬화 {dump_us / turns:>6.1f}µs | 역직렬화 {load_us / turns:>6.1f}µs"
+    )
+    return avg_written
+
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    turns = int(sys.argv[2]) if len(sys.argv) > 2 else 6
+
+    print("=" * 60)
+    print(f"체크포인트 직렬화 비교 (측정 세션 {sessions}개 × {turns}턴)")
+    print("=" * 60)
+
+    # 학습/측정 세션은 다른 시드로 생성 (학습 데이터로 측정하지 않도록)
+    train = synthetic_sessions(count=200, turns=turns, seed=1)
+    test = synthetic_sessions(count=sessions, turns=turns, seed=2)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dict_path = Path(tmp) / "checkpoint_zstd.dict"
+        dict_path.write_bytes(train_dictionary(session_samples(train)))
+        print(f"학습 사전: {dict_path.stat().st_size:,}B\n")
+
+        baseline = _measure("기본 (msgpack)", JsonPlusSerializer(), test, None)
+        _measure("zstd", ZstdSerializer(), test, baseline)
+        _measure("zstd + 사전", ZstdSerializer(dict_path=dict_path), test, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""인제스트 메모리 벤치마크 — 일괄 로드(list) vs 페이지 단위 스트리밍(iter_chunks)
+
+코퍼스 크기(파일 수)를 늘려가며 두 방식의 Python 힙 최대 사용량(tracemalloc)을
+비교한다. 배치 writer는 임베딩/쓰기 없이 배치를 소비만 한다.
+스트리밍 방식은 코퍼스 크기와 무관하게 최대 사용량이 일정해야 한다.
+
+사용법:
+    python scripts/benchmark_ingest_memory.py [매뉴얼 디렉토리] [배치 크기]
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.rag.ingest import iter_batches, iter_chunks, load_and_chunk_pdf
+
+
+def _consume(batches) -> int:
+    """배치 writer 대용 — 배치를 받아 버린다."""
+    return sum(len(batch) for batch in batches)
+
+
+def _eager(pdf_files: list[Path], model: str, batch_size: int) -> int:
+    """기존 방식: 모든 파일의 청크를 리스트로 모은 뒤 배치 처리"""
+    all_chunks = []
+    for pdf_path in pdf_files:
+        all_chunks.extend(load_and_chunk_pdf(pdf_path, model=model))
+    return _consume(iter_batches(all_chunks, batch_size))
+
+
+def _streaming(pdf_files: list[Path], model: str, batch_size: int) -> int:
+    """스트리밍 방식: 페이지 단위 제너레이터를 배치 writer에 바로 연결"""
+    chunks = (chunk for pdf_path in pdf_files for chunk in iter_chunks(pdf_path, model))
+    return _consume(iter_batches(chunks, batch_size))
+
+
+def _measure(fn, *args) -> tuple[int, float, float]:
+    """(청크 수, 최대 메모리 MB, 소요 시간 s)"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    count = fn(*args)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, peak / 1024 / 1024, elapsed
+
+
+def main():
+    manuals_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else (
+        Path(__file__).parent.parent / "data" / "manuals" / "270S"
+    )
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    model = manuals_dir.name
+    pdf_files = sorted(manuals_dir.glob("*.pdf"))
+
+    print("=" * 50)
+    print(f"인제스트 메모리 벤치마크 ({manuals_dir}, PDF {len(pdf_files)}개)")
+    print("=" * 50)
+
+    if not pdf_files:
+        print("PDF 파일이 없습니다.")
+        return
+
+    print(f"{'파일 수':>6} | {'청크':>6} | {'일괄 peak':>10} | {'스트리밍 peak':>12}")
+    for n in range(1, len(pdf_files) + 1):
+        subset = pdf_files[:n]
+        count, eager_peak, _ = _measure(_eager, subset, model, batch_size)
+        _, stream_peak, _ = _measure(_streaming, subset, model, batch_size)
+        print(f"{n:>6} | {count:>6} | {eager_peak:>8.1f}MB | {stream_peak:>10.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""세션당 대화 메모리 측정 — 무제한 누적 vs 윈도우 + 롤링 요약
+
+memory_node를 합성 대화에 턴마다 적용하여 체크포인트에 직렬화되는
+메시지 크기(pickle 바이트)를 메모리 관리 전/후로 비교한다. API 키 불필요.
+
+사용법:
+    python scripts/benchmark_memory.py [턴 수]
+"""
+
+import asyncio
+import pickle
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph.message import add_messages
+
+from src.config import settings
+from src.graph.context_budget import count_tokens
+from src.graph.memory import get_history_context
+from src.graph.nodes.memory import memory_node
+
+QUESTION = "InBody 270S에서 E001 에러가 계속 나요. 전극을 닦았는데도 같은 문제가 반복됩니다."
+ANSWER = (
+    "전극 접촉 불량(E001)은 전극 표면 오염이나 손발 건조로 발생합니다. "
+    "1단계로 전극 표면을 부드러운 천으로 닦고, 2단계로 전해질 티슈를 사용해 주세요. "
+) * 6
+
+
+async def main():
+    turns = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+    print("=" * 60)
+    print(
+        f"대화 메모리 측정 ({turns}턴, window={settings.memory_window_turns}턴, "
+        f"상한={settings.memory_max_state_bytes:,}B)"
+    )
+    print("=" * 60)
+
+    unbounded: list = []
+    state = {"messages": [], "conversation_summary": "", "history_bytes": 0}
+
+    for turn in range(1, turns + 1):
+        question = f"[{turn}] {QUESTION}"
+        unbounded = add_messages(
+            unbounded, [HumanMessage(content=question), AIMessage(content=ANSWER)]
+        )
+
+        state["messages"] = add_messages(state["messages"], [HumanMessage(content=question)])
+        state["answer"] = ANSWER
+        update = await memory_node(state)
+        state["messages"] = add_messages(state["messages"], update["messages"])
+        state["conversation_summary"] = update["conversation_summary"]
+        state["history_bytes"] = update["history_bytes"]
+
+        if turn in (1, 5, 10, 25, 50, 100) or turn == turns:
+            before = len(pickle.dumps(unbounded))
+            after = len(pickle.dumps((state["messages"], state["conversation_summary"])))
+            print(
+                f"턴 {turn:>4} | 무제한 {before:>9,}B | 관리 {after:>7,}B | "
+                f"메시지 {len(unbounded):>4} → {len(state['messages']):>2}"
+            )
+
+    context = get_history_context(
+        {**state, "messages": add_messages(state["messages"], [HumanMessage(content="다음 질문")])}
+    )
+    print(
+        f"\n에이전트 이전 대화 컨텍스트: {count_tokens(context)}토큰 "
+        f"(예산 {settings.memory_context_tokens}토큰)"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,84 @@
+"""라우팅 지연 비교 — model_router → intent_router 2단계 vs 통합 라우터 1회 호출
+
+기종명이 없는 메시지(사전 매칭 실패 → LLM 호출 경로)로 두 방식의
+턴당 라우팅 지연을 측정한다. OPENAI_API_KEY가 필요하다.
+
+사용법:
+    python scripts/benchmark_router.py [반복 횟수]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from langchain_core.messages import HumanMessage
+
+from src.config import settings
+from src.graph.nodes.combined_router import combined_router_node
+from src.graph.nodes.intent_router import intent_router_node
+from src.graph.nodes.model_router import model_router_node
+
+MESSAGES = [
+    "보급형 모델인데 프린터 연결이 안 돼요",
+    "병원에서 쓰는 기계인데 위상각이 뭔가요",
+    "체성분 분석기 설치 방법 알려주세요",
+    "측정하다가 화면이 멈췄어요",
+    "인바디 230 쓰는데 결과지 출력 방법",
+]
+
+
+async def _two_hop(message: str) -> dict:
+    state = {"messages": [HumanMessage(content=message)], "identified_model": None}
+    update = await model_router_node(state)
+    state.update(update)
+    if state.get("answer") or not state.get("identified_model"):
+        return state
+    state.update(await intent_router_node(state))
+    return state
+
+
+async def _combined(message: str) -> dict:
+    state = {"messages": [HumanMessage(content=message)], "identified_model": None}
+    state.update(await combined_router_node(state))
+    return state
+
+
+async def _measure(fn, iterations: int) -> list[float]:
+    latencies = []
+    for _ in range(iterations):
+        for message in MESSAGES:
+            started = time.perf_counter()
+            await fn(message)
+            latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    latencies = sorted(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(
+        f"{label:<10} 평균 {statistics.mean(latencies):7.1f}ms | "
+        f"p50 {statistics.median(latencies):7.1f}ms | p95 {p95:7.1f}ms"
+    )
+
+
+async def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    # 두 방식 모두 LLM 의도 분류 경로를 비교하도록 로컬 분류기 비활성화
+    settings.intent_classifier_enabled = False
+
+    print("=" * 50)
+    print(f"라우팅 지연 비교 (메시지 {len(MESSAGES)}개 × {iterations}회)")
+    print("=" * 50)
+
+    _report("2단계", await _measure(_two_hop, iterations))
+    _report("통합", await _measure(_combined, iterations))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+"""매뉴얼 검색 동시성 벤치마크 — 검색 중 이벤트 루프 지연(lag) 측정
+
+동기 경로(search_manual.invoke)와 비동기 경로(search_manual.ainvoke)로
+동시에 N건의 검색을 실행하면서, 10ms 주기 하트비트 코루틴의 지연을 측정한다.
+비동기 경로에서는 검색 수와 무관하게 지연이 평탄하게 유지되어야 한다.
+
+사용법:
+    python scripts/benchmark_search_concurrency.py [동시 검색 수] [기종]
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tools.manual_search_tool import search_manual
+
+HEARTBEAT_INTERVAL = 0.01
+
+QUERIES = [
+    "전원이 안 켜져요",
+    "E001 에러가 떠요",
+    "프린터 연결 방법",
+    "전극 청소 방법",
+    "측정 결과가 이상해요",
+]
+
+
+async def _heartbeat(stop: asyncio.Event, lags: list[float]) -> None:
+    """주기적으로 깨어나며 예정 시각 대비 지연(ms)을 기록한다."""
+    while not stop.is_set():
+        expected = time.perf_counter() + HEARTBEAT_INTERVAL
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        lags.append(max(0.0, time.perf_counter() - expected) * 1000)
+
+
+async def _run(concurrency: int, model: str, use_async: bool) -> tuple[float, list[float]]:
+    """검색 N건을 동시에 실행하고 (총 소요 시간, 지연 목록)을 반환한다."""
+
+    async def one(i: int) -> str:
+        payload = {"model": model, "query": QUERIES[i % len(QUERIES)]}
+        if use_async:
+            return await search_manual.ainvoke(payload)
+        # 기존 에이전트 방식: async 노드 안에서 동기 호출
+        return search_manual.invoke(payload)
+
+    stop = asyncio.Event()
+    lags: list[float] = []
+    beat = asyncio.create_task(_heartbeat(stop, lags))
+    await asyncio.sleep(HEARTBEAT_INTERVAL * 2)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await beat
+    return elapsed, lags
+
+
+def _report(label: str, elapsed: float, lags: list[float]) -> None:
+    lags = sorted(lags) or [0.0]
+    p50 = lags[len(lags) // 2]
+    p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+    print(
+        f"{label:<8} 총 {elapsed * 1000:8.1f}ms | 루프 지연 "
+        f"p50 {p50:6.2f}ms, p99 {p99:7.2f}ms, max {lags[-1]:7.2f}ms"
+    )
+
+
+async def main():
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    model = sys.argv[2] if len(sys.argv) > 2 else "270S"
+
+    print("=" * 50)
+    print(f"매뉴얼 검색 동시성 벤치마크 (동시 {concurrency}건, 기종 {model})")
+    print("=" * 50)
+
+    _report("sync", *await _run(concurrency, model, use_async=False))
+    _report("async", *await _run(concurrency, model, use_async=True))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,51 @@
+"""워크플로우 컴파일 벤치마크 — 요청마다 컴파일 vs 컴파일 레지스트리 재사용
+
+사용법:
+    python scripts/benchmark_workflow.py [반복 횟수]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.graph.workflow import (
+    compile_workflow,
+    create_workflow,
+    get_checkpointer,
+    get_compiled_workflow,
+)
+
+
+def main():
+    """요청 경로에서 그래프를 얻는 비용을 두 방식으로 측정"""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    print("=" * 50)
+    print("InBody Tech-Master 워크플로우 컴파일 벤치마크")
+    print("=" * 50)
+
+    # 기존 방식: 요청마다 StateGraph 생성 + 컴파일
+    started = time.perf_counter()
+    for _ in range(iterations):
+        create_workflow().compile(checkpointer=get_checkpointer())
+    per_request_ms = (time.perf_counter() - started) * 1000 / iterations
+
+    # 레지스트리 방식: 시작 시 1회 컴파일 후 재사용
+    startup_ms = compile_workflow()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        get_compiled_workflow()
+    cached_ms = (time.perf_counter() - started) * 1000 / iterations
+
+    print(f"\n반복 횟수: {iterations}")
+    print(f"시작 시 1회 컴파일: {startup_ms:.3f}ms")
+    print(f"요청마다 컴파일:    {per_request_ms:.3f}ms/요청")
+    print(f"레지스트리 재사용:  {cached_ms:.5f}ms/요청")
+    print(f"요청당 절감:        {per_request_ms - cached_ms:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,30 @@
 """PDF 매뉴얼 인제스트 스크립트 — data/manuals/{기종}/ 디렉토리 순회
 
+매니페스트(파일 해시 + 청크 해시)와 비교하여 새로 추가되거나 변경된 청크만
+임베딩하고, 삭제/변경된 파일의 사라진 청크는 컬렉션에서 제거한다.
+파싱(프로세스 풀) → 임베딩(동시 배치) → 쓰기 단계로 병렬 처리한 뒤
+처리량 리포트(pages/s, chunks/s, tokens/s)를 출력한다.
+
 사용법:
-    python scripts/ingest_manuals.py
+    python scripts/ingest_manuals.py          # 증분 인제스트
+    python scripts/ingest_manuals.py --full   # 매니페스트 무시하고 전체 재인제스트
+                                              # (현재 PDF에 없는 청크는 컬렉션에서 삭제)
+    python scripts/ingest_manuals.py --fake   # hashing 임베딩 + 임시 디렉토리 (오프라인 측정)
+    python scripts/ingest_manuals.py --stream # 페이지 단위 스트리밍 파싱 (메모리 상한 고정)
 """
 
+import asyncio
 import logging
 import sys
+import tempfile
 from pathlib import Path
 
 # 프로젝트 루트를 PYTHONPATH에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.rag.ingest import ingest_model_manuals
+from src.config import settings
+from src.rag.ingest import load_manifest, save_manifest
 from src.rag.metadata import VALID_MODELS
-from src.rag.vectorstore import add_documents_to_collection, init_collections
 
 logging.basicConfig(
     level=logging.INFO,
@@ -22,9 +33,27 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def main():
-    """전체 기종 매뉴얼 인제스트 실행"""
+async def main():
+    """전체 기종 매뉴얼 증분 인제스트 실행"""
     data_dir = Path(__file__).parent.parent / "data" / "manuals"
+    args = sys.argv[1:]
+    full = "--full" in args
+    fake = "--fake" in args
+    if "--stream" in args:
+        settings.ingest_streaming = True
+
+    if fake:
+        # 오프라인 실행: 실제 Chroma/색인/매니페스트를 건드리지 않도록 임시 디렉토리 사용
+        scratch = Path(tempfile.mkdtemp(prefix="inbody-ingest-"))
+        settings.chroma_persist_dir = str(scratch / "chroma")
+        settings.lexical_index_dir = str(scratch / "lexical")
+        settings.ingest_manifest_path = str(scratch / "ingest_manifest.json")
+        settings.embedding_cache_path = ""
+        settings.embedding_provider = "hashing"
+
+    # 설정 변경 이후에 임포트해야 임시 디렉토리가 적용된다
+    from src.rag.pipeline import run_ingest_pipeline
+    from src.rag.vectorstore import get_embeddings, init_collections
 
     print("=" * 50)
     print("InBody Tech-Master PDF 매뉴얼 인제스트")
@@ -35,26 +64,21 @@ def main():
     init_collections()
     print("   → 4개 컬렉션 초기화 완료")
 
-    # 기종별 인제스트
-    print("\n2. 기종별 PDF 인제스트 중...")
-    total = 0
-    for model in sorted(VALID_MODELS):
-        model_dir = data_dir / model
-        if not model_dir.exists():
-            print(f"   [{model}] 디렉토리 없음 — 건너뜀")
-            continue
+    if fake:
+        print(f"   (hashing 임베딩 사용, 임시 디렉토리: {scratch})")
+    embeddings = get_embeddings()
+
+    manifest = {} if full else load_manifest(settings.ingest_manifest_path)
 
-        chunks = ingest_model_manuals(model_dir, model)
-        if not chunks:
-            print(f"   [{model}] PDF 없음 — 건너뜀")
-            continue
+    # 기종별 인제스트
+    print(f"\n2. 기종별 PDF {'전체' if full else '증분'} 인제스트 중...")
+    report = await run_ingest_pipeline(data_dir, sorted(VALID_MODELS), manifest, embeddings)
 
-        count = add_documents_to_collection(model, chunks)
-        total += count
-        print(f"   [{model}] {count}개 청크 인제스트 완료")
+    # 컬렉션 반영이 끝난 뒤에만 매니페스트 갱신
+    save_manifest(settings.ingest_manifest_path, manifest)
 
-    print(f"\n인제스트 완료: 총 {total}개 청크")
+    print(f"\n인제스트 완료: {report.summary()}")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
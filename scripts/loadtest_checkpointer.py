@@ -0,0 +1,140 @@
+"""다중 프로세스 체크포인터 부하 테스트 — 스티키 세션 없는 세션 연속성 검증
+
+uvicorn --workers N 환경을 흉내 내어 워커 프로세스 N개가 같은 SQLite 체크포인트
+파일을 공유한다. 스레드의 연속된 턴은 매번 다른 프로세스가 처리하며(라운드 로빈),
+각 턴은 이전 턴까지의 상태(이력, identified_model)가 모두 보이는지 확인한다.
+OpenAI 호출 없이 4단계 그래프(router → agent → guardrail → memory)로 측정한다.
+
+사용법:
+    python scripts/loadtest_checkpointer.py [프로세스 수] [스레드 수] [턴 수]
+"""
+
+import asyncio
+import multiprocessing as mp
+import operator
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Annotated, TypedDict
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+class LoadTestState(TypedDict):
+    round: int
+    history: Annotated[list[int], operator.add]
+    identified_model: str | None
+    continuity_ok: bool
+
+
+def _build_graph(saver):
+    from langgraph.graph import END, StateGraph
+
+    async def router(state: LoadTestState) -> dict:
+        expected = list(range(state["round"]))
+        ok = state.get("history", []) == expected and (
+            state["round"] == 0 or state.get("identified_model") == "270S"
+        )
+        return {"identified_model": "270S", "continuity_ok": ok}
+
+    async def passthrough(state: LoadTestState) -> dict:
+        return {}
+
+    async def memory(state: LoadTestState) -> dict:
+        return {"history": [state["round"]]}
+
+    graph = StateGraph(LoadTestState)
+    graph.add_node("router", router)
+    graph.add_node("agent", passthrough)
+    graph.add_node("guardrail", passthrough)
+    graph.add_node("memory", memory)
+    graph.set_entry_point("router")
+    graph.add_edge("router", "agent")
+    graph.add_edge("agent", "guardrail")
+    graph.add_edge("guardrail", "memory")
+    graph.add_edge("memory", END)
+    return graph.compile(checkpointer=saver)
+
+
+async def _worker_main(worker_id: int, workers: int, threads: int, turns: int, db_path: str,
+                       barrier, results) -> None:
+    from src.graph.checkpointer import SQLiteCheckpointSaver
+
+    saver = SQLiteCheckpointSaver(db_path)
+    graph = _build_graph(saver)
+    latencies: list[float] = []
+    misses = 0
+
+    async def _turn(thread: int, round_: int) -> None:
+        nonlocal misses
+        config = {"configurable": {"thread_id": f"load-{thread}"}}
+        started = time.perf_counter()
+        result = await graph.ainvoke({"round": round_}, config=config)
+        latencies.append((time.perf_counter() - started) * 1000)
+        if not result["continuity_ok"]:
+            misses += 1
+
+    for round_ in range(turns):
+        # 같은 스레드의 연속 턴이 매번 다른 프로세스에 배정됨 (스티키 세션 없음)
+        mine = [t for t in range(threads) if (t + round_) % workers == worker_id]
+        await asyncio.gather(*(_turn(t, round_) for t in mine))
+        await asyncio.to_thread(barrier.wait)
+
+    await saver.aclose()
+    results.put({"latencies": latencies, "misses": misses, "stats": saver.stats})
+
+
+def _worker(*args) -> None:
+    asyncio.run(_worker_main(*args))
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 2
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    turns = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+
+    print("=" * 60)
+    print(f"체크포인터 부하 테스트: 프로세스 {workers}개 × 스레드 {threads}개 × {turns}턴")
+    print("=" * 60)
+
+    ctx = mp.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "checkpoints.db")
+        barrier = ctx.Barrier(workers)
+        results = ctx.Queue()
+        started = time.perf_counter()
+        procs = [
+            ctx.Process(
+                target=_worker,
+                args=(i, workers, threads, turns, db_path, barrier, results),
+            )
+            for i in range(workers)
+        ]
+        for proc in procs:
+            proc.start()
+        outputs = [results.get() for _ in procs]
+        for proc in procs:
+            proc.join()
+        elapsed = time.perf_counter() - started
+
+    latencies = sorted(lat for out in outputs for lat in out["latencies"])
+    misses = sum(out["misses"] for out in outputs)
+    commits = sum(out["stats"]["commits"] for out in outputs)
+    batched = sum(out["stats"]["batched_requests"] for out in outputs)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+
+    print(f"총 턴: {len(latencies)} ({len(latencies) / elapsed:.0f} 턴/초)")
+    print(
+        f"턴 지연: 평균 {statistics.mean(latencies):.1f}ms | "
+        f"p50 {statistics.median(latencies):.1f}ms | p95 {p95:.1f}ms"
+    )
+    print(f"group commit: 커밋 {commits}회, 평균 {batched / max(commits, 1):.1f}건/커밋")
+    print(f"세션 연속성 위반: {misses}건 {'✅' if misses == 0 else '❌'}")
+    sys.exit(1 if misses else 0)
+
+
+if __name__ == "__main__":
+    main()
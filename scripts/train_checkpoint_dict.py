@@ -0,0 +1,130 @@
+"""체크포인트 압축용 zstd 사전 학습
+
+기존 체크포인트 DB(settings.checkpoint_db_path)가 있으면 실제 대화 상태를,
+없으면 seed 데이터(에러 코드, 의도 예시)로 만든 합성 대화 상태를 샘플로 사용한다.
+학습된 사전은 settings.checkpoint_zstd_dict_path에 저장된다.
+
+주의: 사전을 교체하면 이전 사전으로 압축된 체크포인트는 읽을 수 없다.
+배포 전에 학습하고 같은 파일을 모든 워커에 배포할 것.
+
+사용법:
+    python scripts/train_checkpoint_dict.py [사전 크기(바이트)]
+"""
+
+import json
+import random
+import sqlite3
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from src.config import settings
+from src.graph.serde import DEFAULT_DICT_SIZE, ZstdSerializer, train_dictionary
+
+SEED_DIR = Path(__file__).parent.parent / "data" / "seed"
+
+
+def _render_answer(error: dict) -> str:
+    """에러 코드 템플릿 답변과 같은 형식의 합성 답변"""
+    steps = "\n".join(f"{i}. {step}" for i, step in enumerate(error["resolution_steps"], 1))
+    answer = (
+        f"**{error['code']} — {error['title']}**\n\n"
+        f"{error['description']}\n원인: {error['cause']}\n\n해결 방법:\n{steps}"
+    )
+    if error.get("escalation_note"):
+        answer += f"\n\n⚠️ {error['escalation_note']}"
+    return answer
+
+
+def synthetic_sessions(count: int, turns: int, seed: int = 0) -> list[list[dict]]:
+    """seed 데이터로 만든 합성 세션 목록 (세션 = 턴 종료 시점 상태 목록)"""
+    errors = json.loads((SEED_DIR / "error_codes.json").read_text(encoding="utf-8"))
+    examples = json.loads((SEED_DIR / "intent_examples.json").read_text(encoding="utf-8"))
+    rng = random.Random(seed)
+
+    sessions = []
+    for _ in range(count):
+        model = rng.choice(sorted({e["model_id"] for e in errors}))
+        model_errors = [e for e in errors if e["model_id"] == model]
+        messages: list = []
+        states = []
+        for _ in range(turns):
+            error = rng.choice(model_errors)
+            question = f"InBody {model} {error['code']} — {rng.choice(examples)['text']}"
+            answer = _render_answer(error)
+            messages = [*messages, HumanMessage(content=question), AIMessage(content=answer)]
+            messages = messages[-2 * settings.memory_window_turns:]
+            states.append({
+                "messages": messages,
+                "identified_model": model,
+                "intent": "troubleshoot",
+                "error_code": error["code"],
+                "support_level": error["support_level"],
+                "retrieved_docs": [f"{e['title']}: {e['description']}" for e in model_errors[:3]],
+                "answer": answer,
+                "answer_source": "template",
+                "guardrail_passed": True,
+                "guardrail_violations": [],
+            })
+        sessions.append(states)
+    return sessions
+
+
+def session_samples(sessions: list[list[dict]]) -> list[bytes]:
+    """세션 상태를 LangGraph 기본 직렬화기로 인코딩한 샘플 (상태 전체 + 채널별 값)"""
+    serde = JsonPlusSerializer()
+    samples = []
+    for states in sessions:
+        for state in states:
+            samples.append(serde.dumps_typed(state)[1])
+            samples.extend(serde.dumps_typed(value)[1] for value in state.values())
+    return samples
+
+
+def _db_samples(db_path: Path, limit: int = 5000) -> list[bytes]:
+    """기존 체크포인트 DB의 값을 압축 해제한 원본 바이트 샘플"""
+    serde = ZstdSerializer(dict_path=settings.checkpoint_zstd_dict_path)
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT type, checkpoint FROM checkpoints ORDER BY checkpoint_id DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+        rows += conn.execute(
+            "SELECT type, value FROM writes ORDER BY checkpoint_id DESC LIMIT ?", (limit,)
+        ).fetchall()
+    finally:
+        conn.close()
+    return [serde.inner.dumps_typed(serde.loads_typed((t, blob)))[1] for t, blob in rows]
+
+
+def main():
+    dict_size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DICT_SIZE
+
+    print("=" * 60)
+    print("체크포인트 zstd 사전 학습")
+    print("=" * 60)
+
+    db_path = Path(settings.checkpoint_db_path)
+    samples = _db_samples(db_path) if db_path.exists() else []
+    source = f"체크포인트 DB ({db_path})"
+    if len(samples) < 100:
+        samples += session_samples(synthetic_sessions(count=200, turns=6))
+        source = "seed 합성 대화" if not db_path.exists() else source + " + seed 합성 대화"
+
+    dictionary = train_dictionary(samples, size=dict_size)
+    out = Path(settings.checkpoint_zstd_dict_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_bytes(dictionary)
+
+    print(f"샘플: {len(samples):,}개 ({source}), 총 {sum(map(len, samples)):,}B")
+    print(f"사전 저장: {out} ({len(dictionary):,}B)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,18 +2,34 @@
 
 import json
 import logging
+from contextlib import aclosing
 
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 
+from src.config import settings
+from src.graph.nodes.guardrail import (
+    MAX_GUARDRAIL_RETRIES,
+    SAFE_FALLBACK_ANSWER,
+    repair_answer,
+)
+from src.graph.stream_guardrail import ANSWER_NODES, StreamGuardrail
 from src.graph.workflow import get_compiled_workflow
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1", tags=["chat"])
 
+# node_start 이벤트를 보내는 노드
+STREAM_NODES = {
+    "router", "model_router", "intent_router",
+    "troubleshoot_agent", "install_agent",
+    "connect_agent", "clinical_agent",
+    "placeholder_agent", "guardrail", "fix_response",
+}
+
 
 class ChatRequest(BaseModel):
     message: str
@@ -65,6 +81,7 @@ async def chat(request: ChatRequest):
             "support_level": None,
             "needs_disclaimer": False,
             "answer": None,
+            "answer_source": None,
             "guardrail_passed": None,
             "guardrail_retry_count": 0,
             "guardrail_violations": [],
@@ -112,6 +129,7 @@ async def chat_stream(request: ChatRequest):
                 "support_level": None,
                 "needs_disclaimer": False,
                 "answer": None,
+                "answer_source": None,
                 "guardrail_passed": None,
                 "guardrail_retry_count": 0,
                 "guardrail_violations": [],
@@ -120,61 +138,192 @@ async def chat_stream(request: ChatRequest):
 
             config = {"configurable": {"thread_id": request.thread_id}}
 
-            async for event in workflow.astream_events(
-                initial_state, config=config, version="v2"
-            ):
-                kind = event.get("event")
-
-                # LLM 토큰 스트리밍
-                if kind == "on_chat_model_stream":
-                    chunk = event.get("data", {}).get("chunk")
-                    if chunk and hasattr(chunk, "content") and chunk.content:
-                        payload = json.dumps(
-                            {"type": "token", "content": chunk.content},
-                            ensure_ascii=False,
-                        )
-                        yield f"data: {payload}\n\n"
-
-                # 노드 시작
-                elif kind == "on_chain_start" and event.get("name") in {
-                    "model_router", "intent_router",
-                    "troubleshoot_agent", "install_agent",
-                    "connect_agent", "clinical_agent",
-                    "placeholder_agent", "guardrail", "fix_response",
-                }:
-                    payload = json.dumps(
-                        {"type": "node_start", "node": event["name"]},
-                        ensure_ascii=False,
-                    )
-                    yield f"data: {payload}\n\n"
+            if settings.stream_guardrail_enabled:
+                events = _guarded_stream(workflow, initial_state, config)
+            else:
+                events = _raw_stream(workflow, initial_state, config)
+            async for payload in events:
+                yield _sse(payload)
 
             # 스트리밍 완료 후 체크포인터에서 최종 상태 조회
             snapshot = await workflow.aget_state(config)
             final = snapshot.values
-            done_payload = json.dumps(
-                {
-                    "type": "done",
-                    "response": final.get("answer", ""),
-                    "identified_model": final.get("identified_model"),
-                    "intent": final.get("intent"),
-                    "support_level": final.get("support_level"),
-                    "guardrail_passed": final.get("guardrail_passed"),
-                    "disclaimer_included": final.get("needs_disclaimer", False),
-                },
-                ensure_ascii=False,
-            )
-            yield f"data: {done_payload}\n\n"
+            yield _sse({
+                "type": "done",
+                "response": final.get("answer", ""),
+                "identified_model": final.get("identified_model"),
+                "intent": final.get("intent"),
+                "support_level": final.get("support_level"),
+                "guardrail_passed": final.get("guardrail_passed"),
+                "disclaimer_included": final.get("needs_disclaimer", False),
+            })
 
         except Exception:
             logger.exception("SSE 스트리밍 중 오류 발생")
-            error_payload = json.dumps(
-                {"type": "error", "content": "서버 오류가 발생했습니다"},
-                ensure_ascii=False,
-            )
-            yield f"data: {error_payload}\n\n"
+            yield _sse({"type": "error", "content": "서버 오류가 발생했습니다"})
 
     return StreamingResponse(
         event_generator(),
         media_type="text/event-stream",
         headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
+
+
+def _sse(payload: dict) -> str:
+    """SSE data 라인 직렬화"""
+    return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+async def _raw_stream(workflow, initial_state: dict, config: dict):
+    """검증 없이 모든 LLM 토큰과 노드 시작 이벤트를 전달한다."""
+    async for event in workflow.astream_events(initial_state, config=config, version="v2"):
+        kind = event.get("event")
+
+        # LLM 토큰 스트리밍
+        if kind == "on_chat_model_stream":
+            chunk = event.get("data", {}).get("chunk")
+            if chunk and hasattr(chunk, "content") and chunk.content:
+                yield {"type": "token", "content": chunk.content}
+
+        # 노드 시작
+        elif kind == "on_chain_start" and event.get("name") in STREAM_NODES:
+            yield {"type": "node_start", "node": event["name"]}
+
+
+async def _guarded_stream(workflow, initial_state: dict, config: dict):
+    """스트리밍 가드레일 모드.
+
+    응답 노드의 토큰만 StreamGuardrail로 검증하여 통과 구간만 전달한다.
+    hard-fail 위반이 감지되면 그래프 실행을 즉시 중단하고(correction 이벤트),
+    부분 응답을 fix_response와 같은 규칙으로 수정하여 guardrail부터 재개한다.
+    """
+    snapshot = await workflow.aget_state(config)
+    turn_state = {**snapshot.values, **initial_state}
+    graph_input: dict | None = initial_state
+
+    while True:
+        guard: StreamGuardrail | None = None
+        guard_node: str | None = None
+        cut: StreamGuardrail | None = None
+        flushed_any = False
+
+        async with aclosing(
+            workflow.astream_events(graph_input, config=config, version="v2")
+        ) as events:
+            async for event in events:
+                kind = event.get("event")
+                name = event.get("name")
+                metadata = event.get("metadata", {})
+                node = metadata.get("langgraph_node")
+
+                if kind == "on_chat_model_stream" and node in ANSWER_NODES:
+                    chunk = event.get("data", {}).get("chunk")
+                    if not (chunk and getattr(chunk, "content", None)):
+                        continue
+                    if guard is None:
+                        guard_node = node
+                        guard = StreamGuardrail(
+                            turn_state.get("identified_model"),
+                            metadata.get("support_level", turn_state.get("support_level")),
+                        )
+                    segment = guard.feed(chunk.content)
+                    if guard.violations:
+                        cut = guard
+                        break
+                    if segment:
+                        flushed_any = True
+                        yield {"type": "token", "content": segment}
+
+                elif kind == "on_chat_model_end" and guard is not None and node == guard_node:
+                    segment = guard.flush()
+                    if guard.violations:
+                        cut = guard
+                        break
+                    if segment:
+                        flushed_any = True
+                        yield {"type": "token", "content": segment}
+                    guard = None
+
+                elif kind == "on_chain_end" and name in STREAM_NODES:
+                    output = event.get("data", {}).get("output")
+                    if isinstance(output, dict):
+                        turn_state.update(output)
+
+                elif kind == "on_chain_start" and name in STREAM_NODES:
+                    # 최종 가드레일(LLM 검증) 실패로 재생성 → 이미 보낸 응답 폐기 안내
+                    if name == "fix_response" and flushed_any:
+                        yield {
+                            "type": "correction",
+                            "violations": turn_state.get("guardrail_violations", []),
+                        }
+                        flushed_any = False
+                    yield {"type": "node_start", "node": name}
+
+        if cut is None:
+            return
+
+        # 생성 중단 → 부분 응답을 수정(또는 위반으로 기록)하고 그래프 재개
+        logger.warning("스트리밍 가드레일 생성 중단 (%s): %s", guard_node, cut.violations)
+        yield {"type": "correction", "violations": cut.violations}
+
+        update, as_node = _cut_update(cut, guard_node, turn_state)
+        turn_state.update(update)
+        await workflow.aupdate_state(config, update, as_node=as_node)
+        graph_input = None
+
+
+def _cut_update(
+    cut: StreamGuardrail, guard_node: str | None, turn_state: dict
+) -> tuple[dict, str]:
+    """생성이 중단된 부분 응답으로 (상태 갱신, 기록할 노드)를 만든다.
+
+    비스트리밍 경로의 fix_response와 같이 위반 문장을 제거하고 고정 안내 문구
+    (하드웨어 면책, 서비스 센터, 의학적 면책)를 붙인다. 결정론적 수정이 불가능하면
+    위반으로 기록하여 fix_response의 전체 재작성으로 넘긴다.
+    """
+    retry_count = turn_state.get("guardrail_retry_count", 0)
+    if guard_node == "fix_response":
+        retry_count += 1
+    if retry_count >= MAX_GUARDRAIL_RETRIES:
+        update = {
+            "answer": SAFE_FALLBACK_ANSWER,
+            "guardrail_passed": True,
+            "guardrail_violations": cut.violations,
+            "guardrail_suggestion": None,
+        }
+        return update, "guardrail"
+
+    base = {
+        "answer_source": "llm",
+        "support_level": cut.support_level,
+        "guardrail_retry_count": retry_count,
+    }
+    repaired = repair_answer(
+        cut.text,
+        cut.identified_model,
+        cut.support_level,
+        bool(turn_state.get("needs_disclaimer")),
+    )
+    if repaired is not None:
+        # fix_response의 결정론적 수정과 같은 결과 → guardrail에서 재검증
+        update = {
+            **base,
+            "answer": repaired,
+            "guardrail_passed": None,
+            "guardrail_violations": [],
+            "guardrail_suggestion": None,
+        }
+        return update, "fix_response"
+
+    update = {
+        **base,
+        "answer": cut.text,
+        "guardrail_passed": False,
+        "guardrail_violations": cut.violations,
+        # 잘린 부분 응답은 문장 단위 수정이 아닌 전체 재작성 대상
+        "guardrail_suggestion": (
+            "스트리밍 중 생성이 중단된 부분 응답입니다. "
+            "위반 내용을 제외하고 전체 응답을 다시 작성하세요."
+        ),
+    }
+    return update, "guardrail"
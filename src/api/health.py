@@ -34,7 +34,9 @@ async def health_check():
     try:
         from openai import AsyncOpenAI
 
-        client = AsyncOpenAI(api_key=settings.openai_api_key)
+        from src.graph.llm import get_http_client
+
+        client = AsyncOpenAI(api_key=settings.openai_api_key, http_client=get_http_client())
         await client.models.list()
     except Exception:
         logger.warning("LLM 상태 확인 실패")
@@ -42,10 +44,9 @@ async def health_check():
 
     # Vector DB (Chroma) 상태 확인
     try:
-        import chromadb
+        from src.rag.vectorstore import get_chroma_client
 
-        chroma_client = chromadb.PersistentClient(path=settings.chroma_persist_dir)
-        chroma_client.heartbeat()
+        get_chroma_client().heartbeat()
     except Exception:
         logger.warning("Vector DB 상태 확인 실패")
         components.vector_db = "down"
@@ -0,0 +1,39 @@
+"""성능 메트릭 엔드포인트 — 캐시 적중률, 커넥션 풀 사용량 등"""
+
+import logging
+
+from fastapi import APIRouter
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/v1", tags=["metrics"])
+
+
+@router.get("/metrics")
+async def get_metrics():
+    """프로세스 내 성능 카운터를 반환한다 (uvicorn 워커별 값)."""
+    from src.graph.context_budget import get_prompt_token_stats
+    from src.graph.intent_classifier import get_intent_classifier_stats
+    from src.graph.llm import get_llm_pool_stats
+    from src.graph.memory import get_memory_stats
+    from src.graph.nodes.guardrail import get_guardrail_stats, get_repair_stats
+    from src.graph.nodes.troubleshoot_agent import get_template_stats
+    from src.graph.stream_guardrail import get_stream_guardrail_stats
+    from src.graph.workflow import get_checkpointer_stats
+    from src.rag.vectorstore import get_embedding_cache_stats, get_retriever_cache_stats
+    from src.tools.fanout import get_tool_latency_stats
+
+    return {
+        "llm_pool": get_llm_pool_stats(),
+        "retriever_cache": get_retriever_cache_stats(),
+        "embedding_cache": get_embedding_cache_stats(),
+        "intent_classifier": get_intent_classifier_stats(),
+        "tool_latency": get_tool_latency_stats(),
+        "error_code_templates": get_template_stats(),
+        "guardrail": get_guardrail_stats(),
+        "guardrail_repair": get_repair_stats(),
+        "stream_guardrail": get_stream_guardrail_stats(),
+        "conversation_memory": get_memory_stats(),
+        "prompt_tokens": get_prompt_token_stats(),
+        "checkpointer": get_checkpointer_stats(),
+    }
@@ -12,7 +12,7 @@ class SessionState(BaseModel):
     thread_id: str
     identified_model: str | None = None
     intent: str | None = None
-    message_count: int = 0
+    message_count: int = 0  # 세션 누적 사용자 메시지 수 (요약으로 접힌 턴 포함)
 
 
 @router.get("/sessions/{thread_id}", response_model=SessionState)
@@ -21,18 +21,22 @@ async def get_session(thread_id: str):
     checkpointer = get_checkpointer()
     config = {"configurable": {"thread_id": thread_id}}
 
-    checkpoint = checkpointer.get(config)
+    checkpoint = await checkpointer.aget(config)
     if not checkpoint:
         raise HTTPException(status_code=404, detail=f"세션 '{thread_id}'을(를) 찾을 수 없습니다")
 
     state = checkpoint.get("channel_values", {})
-    messages = state.get("messages", [])
+    message_count = state.get("turn_count")
+    if message_count is None:
+        # turn_count 도입 이전 세션 또는 첫 턴 진행 중
+        messages = state.get("messages", [])
+        message_count = sum(1 for m in messages if m.type == "human")
 
     return SessionState(
         thread_id=thread_id,
         identified_model=state.get("identified_model"),
         intent=state.get("intent"),
-        message_count=len(messages),
+        message_count=message_count,
     )
 
 
@@ -42,10 +46,10 @@ async def delete_session(thread_id: str):
     checkpointer = get_checkpointer()
     config = {"configurable": {"thread_id": thread_id}}
 
-    checkpoint = checkpointer.get(config)
+    checkpoint = await checkpointer.aget(config)
     if not checkpoint:
         raise HTTPException(status_code=404, detail=f"세션 '{thread_id}'을(를) 찾을 수 없습니다")
 
-    checkpointer.delete_thread(thread_id)
+    await checkpointer.adelete_thread(thread_id)
 
     return None
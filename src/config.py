@@ -11,8 +11,91 @@ class Settings(BaseSettings):
     openai_model: str = "gpt-4o"
     openai_mini_model: str = "gpt-4o-mini"
 
+    # LLM HTTP 커넥션 풀 (모든 노드 공유)
+    llm_max_connections: int = 20
+    llm_max_keepalive_connections: int = 10
+    llm_keepalive_expiry: float = 30.0  # 유휴 커넥션 유지 시간(초)
+    llm_timeout: float = 60.0
+    llm_connect_timeout: float = 5.0
+    llm_http2: bool = False  # h2 패키지 필요
+
+    # 로컬 의도 분류기 (신뢰도 미만이면 LLM 폴백)
+    intent_classifier_enabled: bool = True
+    intent_classifier_threshold: float = 0.85
+
+    # 대화 메모리: 최근 N턴 원문 + 롤링 요약, 스레드당 상한
+    memory_window_turns: int = 4
+    memory_max_state_bytes: int = 16_384
+    memory_summary_max_chars: int = 1500
+    memory_context_tokens: int = 400  # 에이전트 프롬프트에 넣을 이전 대화 토큰 예산
+
+    # 에이전트 프롬프트 컨텍스트 토큰 예산 (노드별, 미지정 노드는 기본값)
+    context_token_budgets: dict[str, int] = {
+        "troubleshoot_agent": 2500,
+        "install_agent": 2500,
+        "connect_agent": 2000,
+        "clinical_agent": 2500,
+    }
+    context_token_budget_default: int = 2000
+
+    # 체크포인터 (대화 상태 저장소): memory | sqlite | postgres
+    # 다중 워커(uvicorn --workers N)에서는 sqlite(단일 호스트) 또는 postgres 사용
+    checkpointer_backend: str = "memory"
+    checkpoint_db_path: str = "./data/checkpoints.db"
+    checkpoint_postgres_url: str = ""
+    checkpoint_flush_ms: float = 5.0  # group commit 쓰기 모음 대기 시간
+    checkpoint_batch_size: int = 64  # 이 개수만큼 모이면 즉시 커밋
+    # 턴 중간 슈퍼스텝은 프로세스 내 스크래치에만 두고 턴 종료 체크포인트만 저장
+    checkpoint_compaction_enabled: bool = True
+    # 체크포인트 값 zstd 압축 (zstandard 미설치 시 무압축), 학습 사전 파일 경로
+    checkpoint_compression_enabled: bool = True
+    checkpoint_zstd_level: int = 3
+    checkpoint_zstd_dict_path: str = "./data/checkpoint_zstd.dict"
+    # memory 백엔드 세션 상한: 유휴 TTL, 전체 바이트 상한(초과 시 LRU 퇴출), 스위퍼 주기
+    session_ttl_seconds: float = 1800.0
+    session_max_bytes: int = 64 * 1024 * 1024
+    session_sweep_interval_seconds: float = 60.0
+    # 종료 시 memory 세션 + 핫 캐시 스냅샷 저장, 시작 시 지연 복원 (예약 정지 후 웜 재시작)
+    session_snapshot_enabled: bool = True
+    session_snapshot_path: str = "./data/session_snapshot.bin"
+    session_snapshot_max_age_hours: float = 24.0
+
+    # 에이전트 도구 동시 호출 타임아웃(초)
+    tool_timeout_seconds: float = 8.0
+
+    # 에러 코드 정확 일치 시 템플릿 응답 (LLM 생성 생략)
+    error_code_template_enabled: bool = True
+
+    # 가드레일 LLM 검증 결과 캐시 항목 수
+    guardrail_cache_size: int = 1024
+    # /chat/stream 토큰 점진 검증 (위반 시 생성 중단 + correction 이벤트)
+    stream_guardrail_enabled: bool = True
+
+    # 기종+의도 통합 라우터 (구조화 출력 1회 호출)
+    combined_router_enabled: bool = False
+
     # Vector DB (Chroma)
     chroma_persist_dir: str = "./data/chroma"
+    rag_search_workers: int = 8  # Chroma 질의 오프로딩 스레드 풀 크기
+    rag_candidate_k: int = 20  # 카테고리 재정렬용 1회 검색 후보 수
+    rag_hybrid_search: bool = True  # BM25 어휘 검색 + 벡터 검색 RRF 융합
+    lexical_index_dir: str = "./data/lexical"  # 기종별 BM25 색인 저장 경로
+    ingest_manifest_path: str = "./data/ingest_manifest.json"  # 증분 인제스트 매니페스트
+    ingest_parse_workers: int = 4  # PDF 파싱 프로세스 수
+    ingest_streaming: bool = False  # 페이지 단위 스트리밍 파싱 (저메모리 인스턴스용)
+    ingest_embed_concurrency: int = 4  # 동시 임베딩 배치 요청 수
+    ingest_embed_batch_size: int = 64  # 임베딩 요청당 청크 수
+    ingest_embed_tpm: int = 1_000_000  # 임베딩 토큰/분 한도
+    ingest_embed_max_retries: int = 5
+
+    # 임베딩
+    embedding_provider: str = "openai"  # "openai" | "hashing" | "replay"
+    embedding_model: str = "text-embedding-ada-002"
+    embedding_dimensions: int = 1536  # hashing 제공자 차원
+    embedding_replay_path: str = "./data/embedding_replay.jsonl"
+    embedding_replay_record: bool = False  # replay 미스 시 OpenAI 호출 후 녹화
+    embedding_cache_size: int = 2048  # 질의 임베딩 메모리 LRU 항목 수
+    embedding_cache_path: str = "./data/embedding_cache.db"  # 빈 값이면 영속 계층 비활성화
 
     # Structured DB (SQLite / PostgreSQL)
     structured_db_url: str = "sqlite+aiosqlite:///./data/inbody.db"
@@ -0,0 +1,1183 @@
+"""LangGraph 체크포인터 백엔드 — memory / sqlite(WAL) / postgres
+
+uvicorn 다중 워커가 같은 스레드의 턴을 나눠 처리해도 상태가 이어지도록
+settings.checkpointer_backend로 프로세스 외부 저장소를 선택한다.
+
+- memory: 프로세스 내 BoundedMemorySaver (단일 워커 개발용). 유휴 TTL + 전역 바이트
+  상한 + LRU 퇴출로 세션이 무한히 상주하지 않도록 한다.
+- sqlite: WAL 모드 SQLite 파일 (단일 호스트 다중 워커). 동시 요청의 쓰기를
+  짧은 구간 모아 1개 트랜잭션으로 커밋한다 (group commit).
+- postgres: langgraph-checkpoint-postgres의 AsyncPostgresSaver
+  (파이프라인 모드로 쓰기 왕복을 묶음, prod extra 필요)
+
+CompactingCheckpointSaver로 감싸면 턴 중간 슈퍼스텝은 프로세스 내 스크래치 슬롯에만
+두고 턴 종료 체크포인트만 저장한다 (settings.checkpoint_compaction_enabled).
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Iterator, Sequence
+from contextlib import AsyncExitStack
+from pathlib import Path
+from typing import Any
+
+import aiosqlite
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+)
+from langgraph.checkpoint.memory import MemorySaver
+
+from src.graph.serde import create_serializer
+
+logger = logging.getLogger(__name__)
+
+VALID_BACKENDS = ("memory", "sqlite", "postgres")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    type TEXT,
+    checkpoint BLOB,
+    metadata_type TEXT,
+    metadata BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    type TEXT,
+    value BLOB,
+    task_path TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+"""
+
+_Statement = tuple[str, Sequence[Any]]
+
+
+class SQLiteCheckpointSaver(BaseCheckpointSaver):
+    """WAL 모드 SQLite 비동기 체크포인터 (group commit)
+
+    aput/aput_writes는 쓰기 구문을 큐에 넣고 커밋 완료까지 대기한다.
+    flush_interval 동안 모인 구문(최대 batch_size개 요청)을 1개 트랜잭션으로
+    커밋하므로, 반환 시점에는 다른 워커 프로세스에서도 바로 읽을 수 있다.
+
+    동기 API(get_tuple/put 등)는 연결을 연 이벤트 루프에 비동기 API를 위임하고
+    완료를 기다린다. 비동기 API를 쓴 적이 없으면 전용 루프 스레드를 띄운다.
+    연결을 연 루프 스레드 안에서 동기 API를 호출하면 교착되므로 오류를 낸다.
+
+    Args:
+        path: SQLite 파일 경로
+        flush_interval: 쓰기 모음 대기 시간(초)
+        batch_size: 이 개수만큼 모이면 대기 없이 즉시 커밋
+        serde: 체크포인트 직렬화기 (None이면 LangGraph 기본값)
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        flush_interval: float = 0.005,
+        batch_size: int = 64,
+        serde=None,
+    ):
+        super().__init__(serde=serde)
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._conn: aiosqlite.Connection | None = None
+        self._conn_lock = asyncio.Lock()
+        self._pending: list[tuple[list[_Statement], asyncio.Future]] = []
+        self._flush_task: asyncio.Task | None = None
+        self._flush_lock = asyncio.Lock()
+        # 연결을 연 이벤트 루프 (동기 API 위임 대상) / 동기 전용 루프
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._sync_loop: asyncio.AbstractEventLoop | None = None
+        self._sync_loop_lock = threading.Lock()
+        self.stats = {
+            "puts": 0,
+            "writes": 0,
+            "commits": 0,
+            "batched_requests": 0,
+            "bytes_written": 0,
+        }
+
+    # ── 연결 / 커밋 ──
+
+    async def _get_conn(self) -> aiosqlite.Connection:
+        """이벤트 루프 안에서 연결을 1회 연다 (WAL + busy_timeout)."""
+        if self._conn is None:
+            async with self._conn_lock:
+                if self._conn is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    conn = await aiosqlite.connect(self.path)
+                    await conn.execute("PRAGMA journal_mode=WAL")
+                    await conn.execute("PRAGMA synchronous=NORMAL")
+                    # 다른 워커 프로세스가 쓰기 중이면 최대 5초 대기
+                    await conn.execute("PRAGMA busy_timeout=5000")
+                    await conn.executescript(_SCHEMA)
+                    await conn.commit()
+                    self._conn = conn
+                    self._loop = asyncio.get_running_loop()
+        return self._conn
+
+    async def _submit(self, statements: list[_Statement]) -> None:
+        """쓰기 구문을 다음 group commit에 합류시키고 커밋을 기다린다."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((statements, future))
+        if len(self._pending) >= self.batch_size:
+            await self._flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+        await future
+
+    async def _delayed_flush(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        # 커밋 중에 합류한 쓰기까지 모두 처리
+        while self._pending:
+            await self._flush()
+
+    async def _flush(self) -> None:
+        """대기 중인 쓰기를 1개 트랜잭션으로 커밋한다."""
+        async with self._flush_lock:
+            batch, self._pending = self._pending, []
+            if not batch:
+                return
+            conn = await self._get_conn()
+            error: Exception | None = None
+            committed = False
+            try:
+                for statements, _ in batch:
+                    for sql, params in statements:
+                        await conn.execute(sql, params)
+                await conn.commit()
+                committed = True
+            except sqlite3.Error as e:
+                await conn.rollback()
+                error = e
+            finally:
+                # 커밋 실패/취소 시에도 대기 중인 요청이 멈추지 않도록 모두 종료
+                for _, future in batch:
+                    if future.done():
+                        continue
+                    if committed:
+                        future.set_result(None)
+                    else:
+                        future.set_exception(
+                            error or RuntimeError("체크포인트 커밋이 중단되었습니다")
+                        )
+            if committed:
+                self.stats["commits"] += 1
+                self.stats["batched_requests"] += len(batch)
+
+    async def aclose(self) -> None:
+        """남은 쓰기를 커밋하고 연결을 닫는다."""
+        await self._flush()
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+            self._loop = None
+
+    def close(self) -> None:
+        """동기 API용 종료 — 연결을 닫고 전용 루프 스레드를 멈춘다."""
+        self._run_sync(self.aclose())
+        with self._sync_loop_lock:
+            loop, self._sync_loop = self._sync_loop, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+
+    # ── 읽기 ──
+
+    def _to_tuple(self, row, writes) -> CheckpointTuple:
+        thread_id, checkpoint_ns, checkpoint_id, parent_id, type_, blob, meta_type, meta = row
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint=self.serde.loads_typed((type_, blob)),
+            metadata=self.serde.loads_typed((meta_type, meta)),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_id,
+                    }
+                }
+                if parent_id
+                else None
+            ),
+            pending_writes=[
+                (task_id, channel, self.serde.loads_typed((w_type, value)))
+                for task_id, channel, w_type, value in writes
+            ],
+        )
+
+    async def _load_writes(self, conn, thread_id: str, checkpoint_ns: str, checkpoint_id: str):
+        async with conn.execute(
+            (
+                "SELECT task_id, channel, type, value FROM writes "
+                "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? "
+                "ORDER BY task_id, idx"
+            ),
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ) as cursor:
+            return await cursor.fetchall()
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        conn = await self._get_conn()
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        columns = (
+            "thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, "
+            "type, checkpoint, metadata_type, metadata"
+        )
+        if checkpoint_id := get_checkpoint_id(config):
+            query = (
+                f"SELECT {columns} FROM checkpoints "
+                "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?"
+            )
+            params: tuple = (thread_id, checkpoint_ns, checkpoint_id)
+        else:
+            query = (
+                f"SELECT {columns} FROM checkpoints "
+                "WHERE thread_id = ? AND checkpoint_ns = ? "
+                "ORDER BY checkpoint_id DESC LIMIT 1"
+            )
+            params = (thread_id, checkpoint_ns)
+
+        async with conn.execute(query, params) as cursor:
+            row = await cursor.fetchone()
+        if row is None:
+            return None
+        writes = await self._load_writes(conn, row[0], row[1], row[2])
+        return self._to_tuple(row, writes)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        conn = await self._get_conn()
+        clauses, params = [], []
+        if config is not None:
+            clauses.append("thread_id = ?")
+            params.append(config["configurable"]["thread_id"])
+            if (checkpoint_ns := config["configurable"].get("checkpoint_ns")) is not None:
+                clauses.append("checkpoint_ns = ?")
+                params.append(checkpoint_ns)
+        if before is not None and (before_id := get_checkpoint_id(before)):
+            clauses.append("checkpoint_id < ?")
+            params.append(before_id)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        async with conn.execute(
+            (
+                "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, "
+                f"type, checkpoint, metadata_type, metadata FROM checkpoints {where} "
+                "ORDER BY checkpoint_id DESC"
+            ),
+            params,
+        ) as cursor:
+            rows = await cursor.fetchall()
+
+        count = 0
+        for row in rows:
+            if limit is not None and count >= limit:
+                break
+            metadata = self.serde.loads_typed((row[6], row[7]))
+            if filter and not all(metadata.get(k) == v for k, v in filter.items()):
+                continue
+            writes = await self._load_writes(conn, row[0], row[1], row[2])
+            count += 1
+            yield self._to_tuple(row, writes)
+
+    # ── 쓰기 ──
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        type_, blob = self.serde.dumps_typed(checkpoint)
+        meta_type, meta = self.serde.dumps_typed(metadata)
+        await self._submit([(
+            (
+                "INSERT OR REPLACE INTO checkpoints "
+                "(thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, "
+                "type, checkpoint, metadata_type, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+            ),
+            (
+                thread_id,
+                checkpoint_ns,
+                checkpoint["id"],
+                config["configurable"].get("checkpoint_id"),
+                type_,
+                blob,
+                meta_type,
+                meta,
+            ),
+        )])
+        self.stats["puts"] += 1
+        self.stats["bytes_written"] += len(blob) + len(meta)
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        # 특수 채널(에러/인터럽트 등)은 덮어쓰기, 일반 쓰기는 최초 1회만 기록
+        verb = (
+            "INSERT OR REPLACE"
+            if all(channel in WRITES_IDX_MAP for channel, _ in writes)
+            else "INSERT OR IGNORE"
+        )
+        statements = []
+        for idx, (channel, value) in enumerate(writes):
+            type_, blob = self.serde.dumps_typed(value)
+            statements.append((
+                (
+                    f"{verb} INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, "
+                    "idx, channel, type, value, task_path) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                ),
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint_id,
+                    task_id,
+                    WRITES_IDX_MAP.get(channel, idx),
+                    channel,
+                    type_,
+                    blob,
+                    task_path,
+                ),
+            ))
+        await self._submit(statements)
+        self.stats["writes"] += len(statements)
+        self.stats["bytes_written"] += sum(len(params[7]) for _, params in statements)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await self._submit([
+            ("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,)),
+            ("DELETE FROM writes WHERE thread_id = ?", (thread_id,)),
+        ])
+
+    async def aprune_before(
+        self, thread_id: str, checkpoint_ns: str, keep_checkpoint_id: str
+    ) -> None:
+        """keep_checkpoint_id 이전의 체크포인트와 쓰기를 삭제한다."""
+        params = (thread_id, checkpoint_ns, keep_checkpoint_id)
+        await self._submit([
+            (
+                (
+                    "DELETE FROM checkpoints "
+                    "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id < ?"
+                ),
+                params,
+            ),
+            (
+                (
+                    "DELETE FROM writes "
+                    "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id < ?"
+                ),
+                params,
+            ),
+        ])
+
+    # ── 동기 API: 연결을 연 이벤트 루프에 위임 ──
+
+    def _run_sync(self, coro: Awaitable):
+        """비동기 API 코루틴을 소유 루프에서 실행하고 결과를 기다린다."""
+        loop = self._loop if self._loop is not None and self._loop.is_running() else None
+        if loop is None:
+            loop = self._get_sync_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            coro.close()
+            raise RuntimeError(
+                "SQLiteCheckpointSaver의 동기 API를 이벤트 루프 안에서 호출할 수 없습니다. "
+                "비동기 API(aget_tuple/aput 등)나 graph.ainvoke()를 사용하세요"
+            )
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def _get_sync_loop(self) -> asyncio.AbstractEventLoop:
+        """동기 호출 전용 이벤트 루프 스레드 (최초 호출 시 시작)"""
+        with self._sync_loop_lock:
+            if self._sync_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="sqlite-checkpointer", daemon=True
+                ).start()
+                # 이전 루프에 묶였을 수 있는 락을 새 루프용으로 교체
+                self._conn_lock = asyncio.Lock()
+                self._flush_lock = asyncio.Lock()
+                self._sync_loop = loop
+            return self._sync_loop
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return self._run_sync(self.aget_tuple(config))
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        async def collect() -> list[CheckpointTuple]:
+            return [
+                item
+                async for item in self.alist(config, filter=filter, before=before, limit=limit)
+            ]
+
+        yield from self._run_sync(collect())
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return self._run_sync(self.aput(config, checkpoint, metadata, new_versions))
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        self._run_sync(self.aput_writes(config, writes, task_id, task_path))
+
+    def delete_thread(self, thread_id: str) -> None:
+        self._run_sync(self.adelete_thread(thread_id))
+
+    def prune_before(self, thread_id: str, checkpoint_ns: str, keep_checkpoint_id: str) -> None:
+        self._run_sync(self.aprune_before(thread_id, checkpoint_ns, keep_checkpoint_id))
+
+
+def _typed_size(value: Any) -> int:
+    """serde.dumps_typed 결과((type, bytes) 튜플)의 바이트 크기"""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, tuple):
+        return sum(len(v) for v in value if isinstance(v, (bytes, bytearray)))
+    return 0
+
+
+class BoundedMemorySaver(MemorySaver):
+    """세션 수명/메모리가 제한된 MemorySaver
+
+    스레드별 직렬화 바이트와 마지막 접근 시각을 추적하여
+    - 유휴 ttl_seconds를 넘긴 세션은 스위퍼가 주기적으로 삭제하고
+    - 전체 바이트가 max_bytes를 넘으면 가장 오래 쓰이지 않은 세션부터 퇴출한다 (LRU).
+    퇴출된 세션의 다음 요청은 새 대화로 시작한다.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 1800.0,
+        max_bytes: int = 64 * 1024 * 1024,
+        sweep_interval: float = 60.0,
+        serde=None,
+    ) -> None:
+        super().__init__(serde=serde)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        # thread_id → [바이트, 마지막 접근(monotonic)] — 앞쪽이 가장 오래 쓰이지 않은 세션
+        self._sessions: OrderedDict[str, list] = OrderedDict()
+        self._bytes_held = 0
+        self._lock = threading.RLock()
+        self._sweeper: asyncio.Task | None = None
+        self._counters = {
+            "evicted_ttl": 0,
+            "evicted_lru": 0,
+            "evicted_bytes": 0,
+            "sweeps": 0,
+            "bytes_written": 0,
+            "snapshot_restored": 0,
+        }
+        # 스냅샷에서 읽었지만 아직 복원하지 않은 세션
+        # thread_id → (type, 직렬화된 최신 체크포인트, 저장 시각 epoch)
+        self._restore_pending: dict[str, tuple[str, bytes, float]] = {}
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._counters,
+                "live_sessions": len(self._sessions),
+                "snapshot_pending": len(self._restore_pending),
+                "bytes_held": self._bytes_held,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+    def _touch(self, thread_id: str, added_bytes: int = 0) -> None:
+        with self._lock:
+            self._counters["bytes_written"] += max(added_bytes, 0)
+            entry = self._sessions.get(thread_id)
+            if entry is None:
+                entry = self._sessions[thread_id] = [0, 0.0]
+            entry[0] += added_bytes
+            entry[1] = time.monotonic()
+            self._bytes_held += added_bytes
+            self._sessions.move_to_end(thread_id)
+
+    def _evict(self, thread_id: str, reason: str) -> None:
+        with self._lock:
+            entry = self._sessions.pop(thread_id, None)
+            if entry is None:
+                return
+            self._bytes_held -= entry[0]
+            self._counters[f"evicted_{reason}"] += 1
+            self._counters["evicted_bytes"] += entry[0]
+            super().delete_thread(thread_id)
+        logger.debug("세션 퇴출 [%s]: %s (%dB)", reason, thread_id, entry[0])
+
+    def _enforce_budget(self, current: str) -> None:
+        """전체 바이트가 상한을 넘으면 LRU 세션부터 퇴출한다 (현재 세션 제외)."""
+        with self._lock:
+            while self._bytes_held > self.max_bytes and len(self._sessions) > 1:
+                oldest = next(iter(self._sessions))
+                if oldest == current:
+                    break
+                self._evict(oldest, "lru")
+
+    def sweep(self) -> int:
+        """유휴 TTL을 넘긴 세션을 삭제하고 삭제 수를 반환한다."""
+        deadline = time.monotonic() - self.ttl_seconds
+        expired = 0
+        with self._lock:
+            self._counters["sweeps"] += 1
+            # LRU 순서 = 접근 시각 순이므로 앞에서부터 만료 세션만 확인
+            while self._sessions:
+                thread_id, (_, last_access) = next(iter(self._sessions.items()))
+                if last_access > deadline:
+                    break
+                self._evict(thread_id, "ttl")
+                expired += 1
+        return expired
+
+    async def _sweep_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            expired = self.sweep()
+            if expired:
+                logger.info("만료 세션 %d개 정리 (남은 세션 %d개)", expired, len(self._sessions))
+
+    def start_sweeper(self) -> None:
+        """백그라운드 TTL 스위퍼를 시작한다 (실행 중인 이벤트 루프 필요)."""
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep_loop())
+
+    async def aclose(self) -> None:
+        """스위퍼를 중지한다."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        result = super().get_tuple(config)
+        thread_id = config["configurable"]["thread_id"]
+        if result is None and thread_id in self._restore_pending and self._restore(thread_id):
+            result = super().get_tuple(config)
+        if result is not None and thread_id in self._sessions:
+            self._touch(thread_id)
+        return result
+
+    def export_sessions(self) -> dict[str, tuple[str, bytes, float]]:
+        """세션별 최신 체크포인트를 (type, bytes, 저장 시각)으로 직렬화한다.
+
+        아직 복원하지 않은 스냅샷 세션은 원래 저장 시각 그대로 포함한다.
+        """
+        saved_at = time.time()
+        with self._lock:
+            exported = dict(self._restore_pending)
+            for thread_id in self._sessions:
+                saved = super().get_tuple({"configurable": {"thread_id": thread_id}})
+                if saved is None:
+                    continue
+                type_, payload = self.serde.dumps_typed({
+                    "checkpoint": saved.checkpoint,
+                    "metadata": saved.metadata,
+                    "pending_writes": saved.pending_writes,
+                })
+                exported[thread_id] = (type_, payload, saved_at)
+        return exported
+
+    def restore_sessions(self, sessions: dict[str, tuple[str, bytes, float]]) -> int:
+        """스냅샷 세션을 복원 대기열에 등록한다. 첫 조회 시 복원되며 등록 수를 반환한다."""
+        with self._lock:
+            pending = {
+                thread_id: tuple(entry)
+                for thread_id, entry in sessions.items()
+                if thread_id not in self._sessions
+            }
+            self._restore_pending.update(pending)
+        return len(pending)
+
+    def _restore(self, thread_id: str) -> bool:
+        """복원 대기 세션 1개를 저장소에 되살린다 (유휴 시간은 복원 시점부터 다시 계산)."""
+        with self._lock:
+            entry = self._restore_pending.pop(thread_id, None)
+            if entry is None:
+                return False
+            try:
+                data = self.serde.loads_typed(entry[:2])
+            except (ValueError, TypeError, KeyError, RuntimeError):
+                logger.warning("스냅샷 세션 복원 실패 — 새 대화로 시작: %s", thread_id)
+                return False
+
+            checkpoint = data["checkpoint"]
+            next_config = self.put(
+                {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}},
+                checkpoint,
+                data["metadata"],
+                checkpoint["channel_versions"],
+            )
+            writes_by_task: dict[str, list] = {}
+            for task_id, channel, value in data["pending_writes"]:
+                writes_by_task.setdefault(task_id, []).append((channel, value))
+            for task_id, writes in writes_by_task.items():
+                self.put_writes(next_config, writes, task_id)
+            self._counters["snapshot_restored"] += 1
+        return True
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        with self._lock:
+            next_config = super().put(config, checkpoint, metadata, new_versions)
+            stored = self.storage[thread_id][checkpoint_ns][checkpoint["id"]]
+            added = sum(_typed_size(v) for v in stored[:2])
+            blobs = getattr(self, "blobs", {})
+            for channel, version in new_versions.items():
+                added += _typed_size(blobs.get((thread_id, checkpoint_ns, channel, version)))
+            self._touch(thread_id, added)
+            self._enforce_budget(thread_id)
+        return next_config
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        key = (
+            thread_id,
+            config["configurable"].get("checkpoint_ns", ""),
+            config["configurable"]["checkpoint_id"],
+        )
+        with self._lock:
+            before = sum(_typed_size(w[2]) for w in self.writes.get(key, {}).values())
+            super().put_writes(config, writes, task_id, task_path)
+            after = sum(_typed_size(w[2]) for w in self.writes.get(key, {}).values())
+            self._touch(thread_id, after - before)
+            self._enforce_budget(thread_id)
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            self._restore_pending.pop(thread_id, None)
+            entry = self._sessions.pop(thread_id, None)
+            if entry is not None:
+                self._bytes_held -= entry[0]
+            super().delete_thread(thread_id)
+
+    def _thread_bytes(self, thread_id: str) -> int:
+        """스레드가 보유한 체크포인트/쓰기/채널 값 바이트 합계"""
+        total = sum(
+            _typed_size(v)
+            for checkpoints in self.storage.get(thread_id, {}).values()
+            for stored in checkpoints.values()
+            for v in stored[:2]
+        )
+        total += sum(
+            _typed_size(w[2])
+            for key, writes in self.writes.items()
+            if key[0] == thread_id
+            for w in writes.values()
+        )
+        total += sum(
+            _typed_size(v) for key, v in getattr(self, "blobs", {}).items() if key[0] == thread_id
+        )
+        return total
+
+    def prune_before(self, thread_id: str, checkpoint_ns: str, keep_checkpoint_id: str) -> None:
+        """keep_checkpoint_id 이전의 체크포인트·쓰기와 더 이상 참조되지 않는 채널 값을 삭제한다."""
+        with self._lock:
+            checkpoints = self.storage.get(thread_id, {}).get(checkpoint_ns)
+            if not checkpoints or keep_checkpoint_id not in checkpoints:
+                return
+            for checkpoint_id in [c for c in checkpoints if c < keep_checkpoint_id]:
+                del checkpoints[checkpoint_id]
+                self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+
+            blobs = getattr(self, "blobs", None)
+            if blobs:
+                kept = self.serde.loads_typed(checkpoints[keep_checkpoint_id][0])
+                live = {
+                    (thread_id, checkpoint_ns, channel, version)
+                    for channel, version in kept["channel_versions"].items()
+                }
+                stale = [k for k in blobs if k[:2] == (thread_id, checkpoint_ns) and k not in live]
+                for key in stale:
+                    del blobs[key]
+
+            entry = self._sessions.get(thread_id)
+            if entry is not None:
+                held = self._thread_bytes(thread_id)
+                self._bytes_held += held - entry[0]
+                entry[0] = held
+
+    async def aprune_before(
+        self, thread_id: str, checkpoint_ns: str, keep_checkpoint_id: str
+    ) -> None:
+        self.prune_before(thread_id, checkpoint_ns, keep_checkpoint_id)
+
+
+class CompactingCheckpointSaver(BaseCheckpointSaver):
+    """턴 경계 체크포인트만 저장하는 체크포인터 래퍼 (체크포인트 압축)
+
+    한 턴은 router → agent → guardrail → (fix_response → guardrail) → memory로
+    슈퍼스텝마다 체크포인트를 만들지만 읽는 쪽(aget_state, 세션 API)은 최신 상태만 쓴다.
+    중간 슈퍼스텝은 프로세스 내 스레드별 스크래치 슬롯(최신 1개)에만 두고,
+    boundary_channels가 갱신된 체크포인트(= memory 노드 실행 후 턴 종료)만
+    내부 저장소에 쓴 뒤 이전 체크포인트를 정리한다.
+
+    턴 도중 실패하면 다른 워커에서는 직전 턴 종료 상태가 보인다.
+
+    Args:
+        inner: 실제 저장소 (BoundedMemorySaver / SQLiteCheckpointSaver / AsyncPostgresSaver)
+        boundary_channels: 갱신되면 턴 경계로 보는 상태 채널
+        max_scratch: 스크래치 슬롯 최대 스레드 수 (초과 시 오래된 슬롯부터 삭제)
+    """
+
+    def __init__(
+        self,
+        inner: BaseCheckpointSaver,
+        boundary_channels: Sequence[str],
+        max_scratch: int = 1024,
+    ) -> None:
+        super().__init__(serde=inner.serde)
+        self.inner = inner
+        self.boundary_channels = frozenset(boundary_channels)
+        self.max_scratch = max_scratch
+        # (thread_id, checkpoint_ns) → (최신 중간 체크포인트, {(task_id, idx): 쓰기},
+        #                              직전 저장 이후 갱신된 채널 버전)
+        self._scratch: OrderedDict[
+            tuple[str, str], tuple[CheckpointTuple, dict, ChannelVersions]
+        ] = OrderedDict()
+        self._counters = {
+            "turns": 0,
+            "scratch_checkpoints": 0,
+            "scratch_writes": 0,
+            "persisted_checkpoints": 0,
+            "persisted_writes": 0,
+        }
+
+    def __getattr__(self, name: str):
+        # start_sweeper 등 내부 저장소 전용 기능은 그대로 위임
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+    @property
+    def stats(self) -> dict:
+        inner_stats = dict(getattr(self.inner, "stats", {}))
+        turns = self._counters["turns"]
+        return {
+            **inner_stats,
+            "compaction": {
+                **self._counters,
+                "scratch_threads": len(self._scratch),
+                "bytes_written_per_turn": (
+                    inner_stats.get("bytes_written", 0) / turns if turns else 0.0
+                ),
+            },
+        }
+
+    async def aclose(self) -> None:
+        self._scratch.clear()
+        if hasattr(self.inner, "aclose"):
+            await self.inner.aclose()
+
+    @staticmethod
+    def _key(config: RunnableConfig) -> tuple[str, str]:
+        return (
+            config["configurable"]["thread_id"],
+            config["configurable"].get("checkpoint_ns", ""),
+        )
+
+    def _get_scratch(self, key: tuple[str, str]) -> CheckpointTuple | None:
+        """스크래치 슬롯의 체크포인트를 대기 쓰기와 함께 반환한다."""
+        slot = self._scratch.get(key)
+        if slot is None:
+            return None
+        saved, writes, _ = slot
+        return saved._replace(pending_writes=list(writes.values()))
+
+    def _latest(
+        self, config: RunnableConfig
+    ) -> tuple[CheckpointTuple | None, bool]:
+        """(스크래치 결과, 내부 저장소 조회 필요 여부) — 동기/비동기 조회 공통"""
+        scratch = self._get_scratch(self._key(config))
+        if scratch is None:
+            return None, True
+        checkpoint_id = get_checkpoint_id(config)
+        if checkpoint_id == scratch.config["configurable"]["checkpoint_id"]:
+            return scratch, False
+        # 최신 조회면 내부 저장소와 비교, 특정 ID 조회면 내부 저장소만
+        return (scratch if checkpoint_id is None else None), True
+
+    @staticmethod
+    def _newer(
+        scratch: CheckpointTuple | None, persisted: CheckpointTuple | None
+    ) -> CheckpointTuple | None:
+        """체크포인트 ID는 시간순 정렬되므로 더 최신인 쪽을 반환"""
+        if scratch is None:
+            return persisted
+        if persisted is None or (
+            persisted.config["configurable"]["checkpoint_id"]
+            < scratch.config["configurable"]["checkpoint_id"]
+        ):
+            return scratch
+        return persisted
+
+    def _list_scratch(
+        self,
+        config: RunnableConfig | None,
+        filter: dict[str, Any] | None,
+        before: RunnableConfig | None,
+    ) -> CheckpointTuple | None:
+        """list 결과 앞에 붙일 스크래치 체크포인트 (조건 불일치면 None)"""
+        if config is None:
+            return None
+        scratch = self._get_scratch(self._key(config))
+        before_id = get_checkpoint_id(before) if before else None
+        if (
+            scratch is not None
+            and (before_id is None or get_checkpoint_id(scratch.config) < before_id)
+            and (not filter or all(scratch.metadata.get(k) == v for k, v in filter.items()))
+        ):
+            return scratch
+        return None
+
+    def _is_boundary(self, new_versions: ChannelVersions) -> bool:
+        return bool(self.boundary_channels.intersection(new_versions))
+
+    def _persist_versions(
+        self, key: tuple[str, str], checkpoint: Checkpoint, new_versions: ChannelVersions
+    ) -> ChannelVersions:
+        """턴 경계 저장 시 내부 저장소에 넘길 채널 버전
+
+        blob 단위로 저장하는 저장소(MemorySaver, Postgres)는 new_versions에 있는 채널만
+        쓰므로, 스크래치로 건너뛴 슈퍼스텝에서 갱신된 채널 버전을 합쳐서 넘긴다.
+        스크래치 슬롯이 없으면(퇴출 등) 전체 채널 버전을 넘긴다.
+        """
+        slot = self._scratch.get(key)
+        if slot is None:
+            return {**checkpoint["channel_versions"], **new_versions}
+        return {**slot[2], **new_versions}
+
+    def _after_persist(self, key: tuple[str, str]) -> None:
+        self._scratch.pop(key, None)
+        self._counters["turns"] += 1
+        self._counters["persisted_checkpoints"] += 1
+
+    def _put_scratch(
+        self,
+        key: tuple[str, str],
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """중간 체크포인트를 스크래치 슬롯에 둔다."""
+        next_config = {
+            "configurable": {
+                "thread_id": key[0],
+                "checkpoint_ns": key[1],
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+        parent_id = config["configurable"].get("checkpoint_id")
+        saved = CheckpointTuple(
+            config=next_config,
+            checkpoint=checkpoint,
+            metadata=metadata,
+            parent_config=(
+                {"configurable": {**next_config["configurable"], "checkpoint_id": parent_id}}
+                if parent_id
+                else None
+            ),
+            pending_writes=[],
+        )
+        slot = self._scratch.get(key)
+        versions = {**slot[2], **new_versions} if slot else dict(new_versions)
+        self._scratch[key] = (saved, {}, versions)
+        self._scratch.move_to_end(key)
+        while len(self._scratch) > self.max_scratch:
+            self._scratch.popitem(last=False)
+        self._counters["scratch_checkpoints"] += 1
+        return next_config
+
+    def _put_scratch_writes(
+        self, config: RunnableConfig, writes: Sequence[tuple[str, Any]], task_id: str
+    ) -> bool:
+        """스크래치 체크포인트에 대한 쓰기면 슬롯에 기록하고 True, 아니면 False"""
+        slot = self._scratch.get(self._key(config))
+        if slot is None or (
+            slot[0].config["configurable"]["checkpoint_id"]
+            != config["configurable"]["checkpoint_id"]
+        ):
+            self._counters["persisted_writes"] += len(writes)
+            return False
+
+        # MemorySaver와 같은 규칙: 특수 채널은 덮어쓰기, 일반 쓰기는 (task_id, idx)당 1회
+        pending = slot[1]
+        for idx, (channel, value) in enumerate(writes):
+            write_key = (task_id, WRITES_IDX_MAP.get(channel, idx))
+            if write_key[1] >= 0 and write_key in pending:
+                continue
+            pending[write_key] = (task_id, channel, value)
+        self._counters["scratch_writes"] += len(writes)
+        return True
+
+    def _drop_scratch(self, thread_id: str) -> None:
+        for key in [k for k in self._scratch if k[0] == thread_id]:
+            del self._scratch[key]
+
+    # ── 비동기 API ──
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        scratch, check_inner = self._latest(config)
+        if not check_inner:
+            return scratch
+        return self._newer(scratch, await self.inner.aget_tuple(config))
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        if limit != 0 and (scratch := self._list_scratch(config, filter, before)):
+            yield scratch
+            if limit is not None:
+                limit -= 1
+        if limit == 0:
+            return
+        async for item in self.inner.alist(config, filter=filter, before=before, limit=limit):
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        key = self._key(config)
+        if not self._is_boundary(new_versions):
+            return self._put_scratch(key, config, checkpoint, metadata, new_versions)
+
+        versions = self._persist_versions(key, checkpoint, new_versions)
+        next_config = await self.inner.aput(config, checkpoint, metadata, versions)
+        self._after_persist(key)
+        if hasattr(self.inner, "aprune_before"):
+            await self.inner.aprune_before(key[0], key[1], checkpoint["id"])
+        return next_config
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        if not self._put_scratch_writes(config, writes, task_id):
+            await self.inner.aput_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        self._drop_scratch(thread_id)
+        await self.inner.adelete_thread(thread_id)
+
+    # ── 동기 API: 같은 스크래치 규칙으로 내부 저장소의 동기 API에 위임 ──
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        scratch, check_inner = self._latest(config)
+        if not check_inner:
+            return scratch
+        return self._newer(scratch, self.inner.get_tuple(config))
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        if limit != 0 and (scratch := self._list_scratch(config, filter, before)):
+            yield scratch
+            if limit is not None:
+                limit -= 1
+        if limit == 0:
+            return
+        yield from self.inner.list(config, filter=filter, before=before, limit=limit)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        key = self._key(config)
+        if not self._is_boundary(new_versions):
+            return self._put_scratch(key, config, checkpoint, metadata, new_versions)
+
+        versions = self._persist_versions(key, checkpoint, new_versions)
+        next_config = self.inner.put(config, checkpoint, metadata, versions)
+        self._after_persist(key)
+        if hasattr(self.inner, "prune_before"):
+            self.inner.prune_before(key[0], key[1], checkpoint["id"])
+        return next_config
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        if not self._put_scratch_writes(config, writes, task_id):
+            self.inner.put_writes(config, writes, task_id, task_path)
+
+    def delete_thread(self, thread_id: str) -> None:
+        self._drop_scratch(thread_id)
+        self.inner.delete_thread(thread_id)
+
+
+def create_checkpointer(settings) -> BaseCheckpointSaver:
+    """설정에 따라 동기 생성 가능한 체크포인터를 만든다 (memory / sqlite).
+
+    postgres는 연결을 열어야 하므로 open_postgres_checkpointer()를 사용한다.
+    """
+    backend = settings.checkpointer_backend
+    if backend not in VALID_BACKENDS:
+        raise ValueError(f"지원하지 않는 체크포인터 백엔드: {backend}. 지원: {VALID_BACKENDS}")
+
+    if backend == "sqlite":
+        return SQLiteCheckpointSaver(
+            settings.checkpoint_db_path,
+            flush_interval=settings.checkpoint_flush_ms / 1000,
+            batch_size=settings.checkpoint_batch_size,
+            serde=create_serializer(settings),
+        )
+    if backend == "postgres":
+        raise RuntimeError(
+            "postgres 체크포인터는 open_postgres_checkpointer()로 초기화해야 합니다 (앱 lifespan)"
+        )
+
+    return BoundedMemorySaver(
+        ttl_seconds=settings.session_ttl_seconds,
+        max_bytes=settings.session_max_bytes,
+        sweep_interval=settings.session_sweep_interval_seconds,
+        serde=create_serializer(settings),
+    )
+
+
+async def open_postgres_checkpointer(settings, stack: AsyncExitStack) -> BaseCheckpointSaver:
+    """AsyncPostgresSaver를 파이프라인 모드로 열고 테이블을 준비한다.
+
+    연결 수명은 stack이 관리한다 (앱 종료 시 stack.aclose()).
+    """
+    try:
+        from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+    except ImportError as e:
+        raise RuntimeError(
+            "postgres 체크포인터에는 langgraph-checkpoint-postgres가 필요합니다 "
+            "(pip install -e '.[prod]')"
+        ) from e
+
+    # pipeline=True: 슈퍼스텝별 쓰기 구문을 왕복 1회로 묶어 전송
+    saver = await stack.enter_async_context(
+        AsyncPostgresSaver.from_conn_string(
+            settings.checkpoint_postgres_url,
+            pipeline=True,
+            serde=create_serializer(settings),
+        )
+    )
+    await saver.setup()
+    return saver
+
+
+def get_saver_stats(saver: BaseCheckpointSaver) -> dict:
+    """체크포인터 쓰기 통계 (group commit 평균 배치 크기 포함)"""
+    stats = dict(getattr(saver, "stats", {}))
+    if stats.get("commits"):
+        stats["avg_batch_size"] = stats["batched_requests"] / stats["commits"]
+    backend = type(getattr(saver, "inner", saver)).__name__
+    return {"backend": backend, **stats}
@@ -0,0 +1,227 @@
+"""프롬프트 컨텍스트 토큰 예산 관리 — 블록 순위화 + 에이전트별 예산 내 조립
+
+에이전트가 모은 컨텍스트(도구 결과, 매뉴얼 청크, 이전 대화, 감지 안내)를
+관련도 점수 순으로 예산(settings.context_token_budgets)에 채우고,
+원래 순서대로 이어 붙여 프롬프트에 넣는다.
+매뉴얼 청크는 TEXT_SPLITTER의 chunk_overlap(200자) 중복을 제거한다.
+토큰 수는 대상 모델의 tiktoken 인코더로 세며, 없으면 4바이트당 1토큰으로 근사한다.
+"""
+
+import asyncio
+import logging
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 매뉴얼 청크 중복 제거 기준 (TEXT_SPLITTER chunk_overlap=200)
+CHUNK_OVERLAP_CHARS = 200
+MIN_OVERLAP_CHARS = 20
+
+# 예산이 이만큼 남으면 블록을 줄 단위로 잘라서라도 포함
+MIN_PARTIAL_TOKENS = 64
+
+# 블록 점수 — 높을수록 먼저 예산에 포함
+SCORE_INSTRUCTION = 100.0  # 감지 안내(에스컬레이션, 진단 요청 등)
+SCORE_LOOKUP = 90.0  # 에러 코드/호환표 정확 조회
+SCORE_MANUAL = 60.0  # 매뉴얼 1위 청크 (순위마다 1점씩 감소)
+SCORE_HISTORY = 45.0  # 이전 대화
+SCORE_FALLBACK = 10.0  # 전체 목록 폴백 등 저관련 결과
+
+_RESULT_SPLIT = re.compile(r"\n(?=--- 결과 \d+ )")
+
+_prompt_stats: dict[str, dict[str, int]] = {}
+
+
+@dataclass
+class ContextBlock:
+    """프롬프트 컨텍스트 블록 (text: 본문, score: 관련도)"""
+
+    text: str
+    score: float
+
+
+@lru_cache(maxsize=8)
+def _get_encoder(model: str):
+    """모델 토크나이저 반환 (tiktoken 미설치/BPE 파일 로드 실패면 None → 근사치 사용)
+
+    tiktoken은 최초 사용 시 BPE 파일을 내려받으므로 오프라인/방화벽 환경에서는
+    네트워크 오류(requests 예외는 OSError 하위)가 날 수 있다.
+    실패 결과도 캐시되어 요청마다 다운로드를 재시도하지 않는다.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        logger.warning("tiktoken 패키지가 없어 토큰 수를 근사치로 계산합니다")
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except (OSError, ValueError) as e:
+        logger.warning("tiktoken 인코더 로드 실패 — 토큰 수를 근사치로 계산합니다: %s", e)
+        return None
+
+
+async def warm_encoder(model: str | None = None) -> bool:
+    """앱 시작 시 인코더를 스레드에서 미리 로드한다 (BPE 다운로드로 이벤트 루프 블로킹 방지).
+
+    Returns:
+        인코더 로드 성공 여부 (실패면 근사치 사용)
+    """
+    encoder = await asyncio.to_thread(_get_encoder, model or settings.openai_model)
+    return encoder is not None
+
+
+def count_tokens(text: str, model: str | None = None) -> int:
+    """대상 모델 토크나이저 기준 토큰 수 (기본: settings.openai_model)"""
+    encoder = _get_encoder(model or settings.openai_model)
+    if encoder is None:
+        return max(1, len(text.encode("utf-8")) // 4) if text else 0
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+def _overlap_size(head: str, tail: str) -> int:
+    """head의 꼬리 == tail의 앞부분인 최대 길이 (MIN_OVERLAP_CHARS 미만이면 0)"""
+    limit = min(CHUNK_OVERLAP_CHARS, len(head), len(tail))
+    for size in range(limit, MIN_OVERLAP_CHARS - 1, -1):
+        if head.endswith(tail[:size]):
+            return size
+    return 0
+
+
+def strip_overlap(other: str, text: str) -> str:
+    """이미 포함된 청크 other와 겹치는 text의 앞/뒷부분(청크 중복)을 제거한다.
+
+    text가 other 바로 뒤 청크면 앞부분을, 바로 앞 청크면 뒷부분을 잘라낸다.
+    """
+    size = _overlap_size(other, text)
+    if size:
+        text = text[size:].lstrip()
+    size = _overlap_size(text, other)
+    if size:
+        text = text[:-size].rstrip()
+    return text
+
+
+def manual_blocks(
+    label: str, search_result: str, score: float = SCORE_MANUAL
+) -> list[ContextBlock]:
+    """search_manual 결과를 결과 단위 블록으로 나누고 청크 중복을 제거한다.
+
+    Args:
+        label: 블록 제목 (예: "[매뉴얼 검색 결과]")
+        search_result: search_manual 반환 문자열
+        score: 1위 결과 점수 (순위마다 1점씩 감소)
+
+    Returns:
+        검색 순위가 반영된 블록 목록 (결과가 없으면 안내 문구 1블록)
+    """
+    header, *results = _RESULT_SPLIT.split(search_result)
+    if not results:
+        return [ContextBlock(f"{label}\n{search_result}", score)]
+
+    blocks = [ContextBlock(f"{label}\n{header}", score + 1)]
+    bodies: list[str] = []
+    for rank, result in enumerate(results):
+        title, _, body = result.partition("\n")
+        for previous in bodies:
+            body = strip_overlap(previous, body)
+        if not body.strip():
+            continue
+        bodies.append(body)
+        blocks.append(ContextBlock(f"{title}\n{body}", score - rank))
+    return blocks
+
+
+def _node_stats(node: str) -> dict[str, int]:
+    """노드별 토큰 통계 항목 (없으면 생성)"""
+    return _prompt_stats.setdefault(node, {
+        "calls": 0,
+        "context_tokens_total": 0,
+        "prompt_tokens_total": 0,
+        "prompt_tokens_max": 0,
+        "blocks_dropped": 0,
+    })
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """줄 단위로 잘라 max_tokens 이하로 만든다."""
+    kept: list[str] = []
+    used = 0
+    for line in text.split("\n"):
+        tokens = count_tokens(line + "\n")
+        if used + tokens > max_tokens:
+            break
+        kept.append(line)
+        used += tokens
+    return "\n".join(kept)
+
+
+def assemble_context(node: str, blocks: list[ContextBlock]) -> str:
+    """블록을 점수 순으로 노드 예산에 채워 원래 순서로 이어 붙인다.
+
+    Args:
+        node: 에이전트 노드 이름 (settings.context_token_budgets 키)
+        blocks: 컨텍스트 블록 목록 (추가된 순서 = 프롬프트 내 순서)
+
+    Returns:
+        예산 내로 조립된 컨텍스트 문자열
+    """
+    budget = settings.context_token_budgets.get(node, settings.context_token_budget_default)
+    order = sorted(range(len(blocks)), key=lambda i: blocks[i].score, reverse=True)
+
+    selected: dict[int, str] = {}
+    used = 0
+    dropped = 0
+    for i in order:
+        text = blocks[i].text
+        tokens = count_tokens(text)
+        if used + tokens <= budget:
+            selected[i] = text
+            used += tokens
+            continue
+        remaining = budget - used
+        if remaining >= MIN_PARTIAL_TOKENS:
+            partial = _truncate_to_tokens(text, remaining)
+            if partial:
+                selected[i] = partial
+                used += count_tokens(partial)
+                continue
+        dropped += 1
+
+    stats = _node_stats(node)
+    stats["calls"] += 1
+    stats["context_tokens_total"] += used
+    stats["blocks_dropped"] += dropped
+    if dropped:
+        logger.debug("컨텍스트 예산 초과 [%s]: %d개 블록 제외 (예산 %d토큰)", node, dropped, budget)
+
+    return "\n\n".join(selected[i] for i in sorted(selected))
+
+
+def log_prompt_tokens(node: str, *texts: str) -> int:
+    """노드의 최종 프롬프트 토큰 수를 기록·로깅하고 반환한다."""
+    tokens = sum(count_tokens(text) for text in texts)
+    stats = _node_stats(node)
+    stats["prompt_tokens_total"] += tokens
+    stats["prompt_tokens_max"] = max(stats["prompt_tokens_max"], tokens)
+    logger.info("프롬프트 토큰 [%s]: %d", node, tokens)
+    return tokens
+
+
+def get_prompt_token_stats() -> dict:
+    """노드별 프롬프트/컨텍스트 토큰 통계 반환"""
+    return {
+        node: {
+            **stats,
+            "prompt_tokens_avg": (
+                stats["prompt_tokens_total"] / stats["calls"] if stats["calls"] else 0.0
+            ),
+        }
+        for node, stats in _prompt_stats.items()
+    }
@@ -38,6 +38,18 @@ def route_after_intent_router(state: AgentState) -> str:
     return "placeholder_agent"
 
 
+def route_after_combined_router(state: AgentState) -> str:
+    """통합 라우터 결과에 따라 다음 노드를 결정한다.
+
+    - answer가 설정됨 (비교/unsupported/unidentified) → END
+    - identified_model이 설정됨 → 의도별 에이전트 (route_after_intent_router와 동일)
+    - 그 외 → END
+    """
+    if state.get("answer") or not state.get("identified_model"):
+        return "__end__"
+    return route_after_intent_router(state)
+
+
 MAX_GUARDRAIL_RETRIES = 2
 
 
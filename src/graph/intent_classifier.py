@@ -0,0 +1,161 @@
+"""로컬 의도 분류기 — 키워드 규칙 + 문자 n-gram 나이브 베이즈
+
+명확한 메시지("프린터 연결", "E003 에러")는 LLM 호출 없이 마이크로초 단위로
+분류하고, 신뢰도가 임계값 미만일 때만 intent_router_node가 LLM으로 폴백한다.
+학습 예시는 data/seed/intent_examples.json, 키워드는 각 에이전트 노드의
+키워드 테이블을 그대로 재사용한다.
+"""
+
+import json
+import logging
+import math
+import re
+import unicodedata
+from collections import Counter
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+EXAMPLES_PATH = Path(__file__).parent.parent.parent / "data" / "seed" / "intent_examples.json"
+
+# 점수 결합 파라미터 — intent_examples.json 교차 검증으로 조정
+NGRAM_SHARPNESS = 4.0  # 평균 로그우도 차이를 확률로 변환할 때의 배율
+KEYWORD_WEIGHT = 3.0  # 키워드 1건당 로짓 가산점
+SMOOTHING = 0.5  # 라플라스 평활
+
+# 에러 코드 패턴 (troubleshoot_agent._extract_error_code와 동일 형식)
+_ERROR_CODE_PATTERN = re.compile(r"(?<![a-zA-Z])[Ee]\d{3}|(?:에러|오류)\s*(?:코드)?\s*\d{3}")
+
+# 설치 의도 전용 키워드 (설치 에이전트에는 유형 라벨·문제 키워드만 있으므로 보강)
+INSTALL_KEYWORDS: list[str] = ["설치", "조립", "초기 설정", "초기 세팅", "개봉", "수평"]
+
+# 여러 의도에 두루 나타나 분류 근거로 쓰면 오분류되는 키워드
+# ("체중이 0으로 나와요"는 고장, "결과지 해석"은 임상, "신장"은 키/콩팥 모두 해당,
+#  "안 돼"는 "출력이 안 돼요"처럼 모든 의도의 문제 표현에 붙는다)
+AMBIGUOUS_KEYWORDS: frozenset[str] = frozenset({
+    "증상", "신장", "수술", "체중", "결과지",
+    "안 돼", "안돼", "안 되", "안되",
+})
+
+
+def _features(text: str) -> list[str]:
+    """문자 2/3-gram 특징 추출 (공백 정규화, 소문자화)"""
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = " " + re.sub(r"\s+", " ", text).strip() + " "
+    return [text[i:i + n] for n in (2, 3) for i in range(len(text) - n + 1)]
+
+
+class IntentClassifier:
+    """키워드 + 문자 n-gram 나이브 베이즈 의도 분류기
+
+    Args:
+        examples: [(텍스트, 의도), ...] 학습 예시
+        keywords: {의도: [키워드, ...]} 키워드 테이블
+    """
+
+    def __init__(self, examples: list[tuple[str, str]], keywords: dict[str, list[str]]):
+        self.keywords = keywords
+        self.intents = sorted({intent for _, intent in examples} | set(keywords))
+        self._counts: dict[str, Counter] = {intent: Counter() for intent in self.intents}
+        doc_counts: Counter = Counter()
+        for text, intent in examples:
+            self._counts[intent].update(_features(text))
+            doc_counts[intent] += 1
+
+        total_docs = sum(doc_counts.values()) or 1
+        self._vocab_size = len({f for counts in self._counts.values() for f in counts}) or 1
+        self._totals = {intent: sum(counts.values()) for intent, counts in self._counts.items()}
+        self._log_priors = {
+            intent: math.log((doc_counts[intent] + 1) / (total_docs + len(self.intents)))
+            for intent in self.intents
+        }
+
+    def predict(self, text: str) -> tuple[str, float]:
+        """(의도, 신뢰도) 반환 — 신뢰도는 의도별 소프트맥스 확률"""
+        if _ERROR_CODE_PATTERN.search(text) and "troubleshoot" in self.intents:
+            return "troubleshoot", 1.0
+
+        features = _features(text)
+        logits: dict[str, float] = {}
+        for intent in self.intents:
+            counts = self._counts[intent]
+            denominator = self._totals[intent] + SMOOTHING * self._vocab_size
+            mean_loglik = (
+                sum(math.log((counts[f] + SMOOTHING) / denominator) for f in features)
+                / len(features)
+                if features
+                else 0.0
+            )
+            hits = sum(1 for keyword in self.keywords.get(intent, []) if keyword in text)
+            logits[intent] = (
+                NGRAM_SHARPNESS * (mean_loglik + self._log_priors[intent] / max(len(features), 1))
+                + KEYWORD_WEIGHT * hits
+            )
+
+        top = max(logits.values())
+        exp_scores = {intent: math.exp(logit - top) for intent, logit in logits.items()}
+        norm = sum(exp_scores.values())
+        intent = max(exp_scores, key=exp_scores.get)
+        return intent, exp_scores[intent] / norm
+
+
+def build_keyword_table() -> dict[str, list[str]]:
+    """각 에이전트 노드에 흩어진 키워드 테이블을 의도별로 모은다.
+
+    한 글자 키워드("병", "약", "간" 등)는 "시간", "약간" 같은 일반 단어에
+    부분 일치하므로 분류 근거에서 제외한다. 설치 에이전트의 문제 키워드
+    ("전원이 안", "안 돼" 등)는 고장 증상과 겹치므로 의도 분류에 쓰지 않는다.
+    """
+    from src.graph.nodes.clinical_agent import DIAGNOSIS_KEYWORDS
+    from src.graph.nodes.connect_agent import PERIPHERAL_NAME_KEYWORDS, PERIPHERAL_TYPE_KEYWORDS
+    from src.graph.nodes.install_agent import INSTALL_TYPE_LABELS
+    from src.graph.nodes.troubleshoot_agent import ESCALATION_KEYWORDS
+    from src.models.inbody_models import INBODY_MODELS
+
+    measurement_items = {item for p in INBODY_MODELS.values() for item in p.measurement_items}
+    table = {
+        "connect": [k for ks in PERIPHERAL_TYPE_KEYWORDS.values() for k in ks]
+        + PERIPHERAL_NAME_KEYWORDS,
+        "install": INSTALL_KEYWORDS + list(INSTALL_TYPE_LABELS.values()),
+        "troubleshoot": list(ESCALATION_KEYWORDS),
+        "clinical": DIAGNOSIS_KEYWORDS + sorted(measurement_items),
+        "general": [],
+    }
+    return {
+        intent: sorted({k for k in keywords if len(k) > 1 and k not in AMBIGUOUS_KEYWORDS})
+        for intent, keywords in table.items()
+    }
+
+
+def load_examples(path: str | Path = EXAMPLES_PATH) -> list[tuple[str, str]]:
+    """학습 예시 로드 — 파일이 없으면 빈 리스트 (키워드만으로 분류)"""
+    path = Path(path)
+    if not path.exists():
+        logger.warning("의도 분류 예시 파일이 없습니다: %s", path)
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [(row["text"], row["intent"]) for row in json.load(f)]
+
+
+_classifier: IntentClassifier | None = None
+_stats = {"total": 0, "local": 0, "llm_fallback": 0}
+
+
+def get_intent_classifier() -> IntentClassifier:
+    """로컬 의도 분류기 싱글톤 반환"""
+    global _classifier
+    if _classifier is None:
+        _classifier = IntentClassifier(load_examples(), build_keyword_table())
+    return _classifier
+
+
+def record_intent_decision(used_llm: bool) -> None:
+    """턴별 분류 경로(로컬/LLM) 기록"""
+    _stats["total"] += 1
+    _stats["llm_fallback" if used_llm else "local"] += 1
+
+
+def get_intent_classifier_stats() -> dict:
+    """LLM 호출을 건너뛴 턴 비율 등 통계 반환"""
+    total = _stats["total"]
+    return {**_stats, "llm_skip_rate": _stats["local"] / total if total else 0.0}
@@ -0,0 +1,146 @@
+"""공유 LLM 클라이언트 팩토리 — 모든 그래프 노드가 사용하는 ChatOpenAI 캐시
+
+(model, temperature)별 ChatOpenAI 인스턴스를 1회 생성해 재사용하고,
+모든 인스턴스가 하나의 비동기 HTTP 커넥션 풀(keep-alive)을 공유한다.
+노드 호출마다 새 HTTP 클라이언트·TLS 핸드셰이크가 생기는 것을 방지한다.
+"""
+
+import logging
+import threading
+
+import httpx
+from langchain_openai import ChatOpenAI
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+_http_client: httpx.AsyncClient | None = None
+_chat_models: dict[tuple[str, float], ChatOpenAI] = {}
+_lock = threading.Lock()
+_pool_stats = {"requests": 0, "in_flight": 0, "peak_in_flight": 0, "errors": 0}
+
+
+class _TrackedStream(httpx.AsyncByteStream):
+    """응답 본문 스트림이 닫힐 때 커넥션 사용 종료를 기록한다."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class _PoolMetricsTransport(httpx.AsyncBaseTransport):
+    """커넥션 풀 사용량(동시 요청 수)을 집계하는 트랜스포트 래퍼"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        _pool_stats["requests"] += 1
+        _pool_stats["in_flight"] += 1
+        _pool_stats["peak_in_flight"] = max(
+            _pool_stats["peak_in_flight"], _pool_stats["in_flight"]
+        )
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                _pool_stats["in_flight"] -= 1
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except Exception:
+            _pool_stats["errors"] += 1
+            release()
+            raise
+        response.stream = _TrackedStream(response.stream, release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    """Settings 기반 튜닝된 공유 비동기 HTTP 클라이언트 생성"""
+    limits = httpx.Limits(
+        max_connections=settings.llm_max_connections,
+        max_keepalive_connections=settings.llm_max_keepalive_connections,
+        keepalive_expiry=settings.llm_keepalive_expiry,
+    )
+    http2 = settings.llm_http2
+    try:
+        transport = httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+    except ImportError:
+        logger.warning("h2 패키지가 없어 HTTP/1.1로 대체합니다")
+        transport = httpx.AsyncHTTPTransport(limits=limits)
+
+    return httpx.AsyncClient(
+        transport=_PoolMetricsTransport(transport),
+        timeout=httpx.Timeout(settings.llm_timeout, connect=settings.llm_connect_timeout),
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """OpenAI 호출용 공유 비동기 HTTP 클라이언트 싱글톤 반환"""
+    global _http_client
+    if _http_client is None:
+        with _lock:
+            if _http_client is None:
+                _http_client = _create_http_client()
+    return _http_client
+
+
+def get_chat_model(model: str, temperature: float) -> ChatOpenAI:
+    """(model, temperature)별로 캐시된 ChatOpenAI 인스턴스를 반환한다.
+
+    Args:
+        model: OpenAI 모델명 (settings.openai_model / openai_mini_model)
+        temperature: 샘플링 온도
+    """
+    key = (model, temperature)
+    chat_model = _chat_models.get(key)
+    if chat_model is None:
+        http_client = get_http_client()
+        with _lock:
+            chat_model = _chat_models.get(key)
+            if chat_model is None:
+                chat_model = ChatOpenAI(
+                    model=model,
+                    api_key=settings.openai_api_key,
+                    temperature=temperature,
+                    http_async_client=http_client,
+                )
+                _chat_models[key] = chat_model
+    return chat_model
+
+
+def get_llm_pool_stats() -> dict:
+    """공유 커넥션 풀 사용량 통계 반환"""
+    max_connections = settings.llm_max_connections
+    return {
+        **_pool_stats,
+        "max_connections": max_connections,
+        "utilization": _pool_stats["in_flight"] / max_connections if max_connections else 0.0,
+        "cached_models": len(_chat_models),
+    }
+
+
+async def close_llm_clients() -> None:
+    """앱 종료 시 공유 HTTP 클라이언트를 닫는다."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    _chat_models.clear()
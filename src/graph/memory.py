@@ -0,0 +1,193 @@
+"""대화 메모리 관리 — 최근 N턴 원문 유지 + 이전 턴 롤링 요약
+
+체크포인터에 저장되는 messages가 무한히 늘어나지 않도록
+턴 종료 시 오래된 턴을 요약 문자열로 접고 스레드당 상태 크기를 제한한다.
+에이전트에는 요약 + 최근 턴을 토큰 예산 안에서 이전 대화 컨텍스트로 제공한다.
+"""
+
+from langchain_core.messages import BaseMessage
+
+from src.config import settings
+from src.graph.context_budget import count_tokens
+
+# 요약 1줄에 남길 질문/답변 최대 글자 수
+SUMMARY_SNIPPET_CHARS = 60
+
+_memory_stats = {
+    "turns": 0,
+    "folded_messages": 0,
+    "bytes_before_total": 0,
+    "bytes_after_total": 0,
+    "max_state_bytes": 0,
+}
+
+
+def split_turns(messages: list[BaseMessage]) -> list[list[BaseMessage]]:
+    """메시지 목록을 사용자 메시지 기준 턴 단위로 나눈다."""
+    turns: list[list[BaseMessage]] = []
+    for message in messages:
+        if message.type == "human" or not turns:
+            turns.append([message])
+        else:
+            turns[-1].append(message)
+    return turns
+
+
+def _snippet(text: str) -> str:
+    """요약용 한 줄 발췌"""
+    text = " ".join(str(text).split())
+    if len(text) <= SUMMARY_SNIPPET_CHARS:
+        return text
+    return text[:SUMMARY_SNIPPET_CHARS] + "…"
+
+
+def summarize_turn(turn: list[BaseMessage]) -> str:
+    """턴 1개를 "- 사용자: ... / 답변: ..." 한 줄로 요약한다."""
+    question = next((m.content for m in turn if m.type == "human"), "")
+    answer = next((m.content for m in turn if m.type == "ai"), "")
+    line = f"- 사용자: {_snippet(question)}"
+    if answer:
+        line += f" / 답변: {_snippet(answer)}"
+    return line
+
+
+def state_bytes(messages: list[BaseMessage], summary: str) -> int:
+    """스레드 대화 상태 크기(UTF-8 바이트) 근사치"""
+    return sum(len(str(m.content).encode("utf-8")) for m in messages) + len(
+        summary.encode("utf-8")
+    )
+
+
+def _trim_summary(summary: str, max_chars: int) -> str:
+    """요약이 상한을 넘으면 가장 오래된 줄부터 버린다."""
+    lines = summary.splitlines()
+    while lines and len("\n".join(lines)) > max_chars:
+        lines.pop(0)
+    return "\n".join(lines)
+
+
+def compact_history(
+    messages: list[BaseMessage],
+    summary: str,
+    window_turns: int,
+    max_bytes: int,
+    summary_max_chars: int,
+) -> tuple[list[BaseMessage], str]:
+    """최근 window_turns턴만 남기고 나머지를 요약으로 접는다.
+
+    window 적용 후에도 max_bytes를 넘으면 현재 턴만 남을 때까지 추가로 접고,
+    그래도 넘으면 요약을 줄인다.
+
+    Args:
+        messages: 현재 턴까지 포함한 전체 메시지
+        summary: 기존 롤링 요약
+        window_turns: 원문으로 유지할 최근 턴 수
+        max_bytes: 스레드당 대화 상태 상한(바이트)
+        summary_max_chars: 롤링 요약 최대 글자 수
+
+    Returns:
+        (제거할 메시지 목록, 새 요약)
+    """
+    turns = split_turns(messages)
+    keep_from = max(0, len(turns) - max(1, window_turns))
+    summary_lines = summary.splitlines() if summary else []
+
+    def _kept_bytes(start: int) -> int:
+        kept = [m for turn in turns[start:] for m in turn]
+        return state_bytes(kept, "\n".join(summary_lines))
+
+    for turn in turns[:keep_from]:
+        summary_lines.append(summarize_turn(turn))
+    while keep_from < len(turns) - 1 and _kept_bytes(keep_from) > max_bytes:
+        summary_lines.append(summarize_turn(turns[keep_from]))
+        keep_from += 1
+
+    new_summary = _trim_summary("\n".join(summary_lines), summary_max_chars)
+    kept = [m for turn in turns[keep_from:] for m in turn]
+    # 현재 턴만으로도 상한 초과 → 요약을 오래된 줄부터 줄인다
+    while new_summary and state_bytes(kept, new_summary) > max_bytes:
+        new_summary = "\n".join(new_summary.splitlines()[1:])
+
+    removed = [m for turn in turns[:keep_from] for m in turn]
+    return removed, new_summary
+
+
+def build_history_context(
+    messages: list[BaseMessage], summary: str, token_budget: int
+) -> str:
+    """이전 대화를 토큰 예산 안에서 컨텍스트 문자열로 만든다.
+
+    최근 턴을 우선 포함하고 남는 예산으로 롤링 요약을 앞에 붙인다.
+    현재 턴(마지막 사용자 메시지)은 제외한다.
+
+    Args:
+        messages: 체크포인터의 메시지 (현재 턴 포함)
+        summary: 롤링 요약
+        token_budget: 최대 토큰 수 (대상 모델 토크나이저 기준)
+
+    Returns:
+        "[이전 대화]" 블록 문자열 (이전 대화가 없으면 빈 문자열)
+    """
+    turns = split_turns(messages)[:-1]
+
+    recent: list[str] = []
+    used = 0
+    for turn in reversed(turns):
+        lines = [
+            f"{'사용자' if m.type == 'human' else '상담원'}: {m.content}"
+            for m in turn
+            if m.type in ("human", "ai")
+        ]
+        block = "\n".join(lines)
+        tokens = count_tokens(block)
+        if used + tokens > token_budget:
+            break
+        recent.insert(0, block)
+        used += tokens
+
+    parts = []
+    if summary:
+        summary_lines = summary.splitlines()
+        while summary_lines and used + count_tokens("\n".join(summary_lines)) > token_budget:
+            summary_lines.pop(0)
+        if summary_lines:
+            parts.append("(이전 대화 요약)\n" + "\n".join(summary_lines))
+    parts.extend(recent)
+
+    if not parts:
+        return ""
+    return "[이전 대화]\n" + "\n\n".join(parts)
+
+
+def get_history_context(state: dict) -> str:
+    """에이전트 프롬프트용 이전 대화 컨텍스트 (settings.memory_context_tokens 예산)"""
+    return build_history_context(
+        state.get("messages", []),
+        state.get("conversation_summary") or "",
+        settings.memory_context_tokens,
+    )
+
+
+def record_memory_usage(bytes_before: int, bytes_after: int, folded: int) -> None:
+    """턴 종료 시 세션 메모리 측정값을 기록한다.
+
+    Args:
+        bytes_before: 메모리 관리 없이 누적됐을 대화 크기
+        bytes_after: 윈도우 + 요약 적용 후 대화 크기
+        folded: 이번 턴에 요약으로 접은 메시지 수
+    """
+    _memory_stats["turns"] += 1
+    _memory_stats["folded_messages"] += folded
+    _memory_stats["bytes_before_total"] += bytes_before
+    _memory_stats["bytes_after_total"] += bytes_after
+    _memory_stats["max_state_bytes"] = max(_memory_stats["max_state_bytes"], bytes_after)
+
+
+def get_memory_stats() -> dict:
+    """세션 대화 메모리 통계 반환 (턴 종료 시점 평균 관리 전/후 바이트)"""
+    turns = _memory_stats["turns"]
+    return {
+        **_memory_stats,
+        "avg_bytes_before": _memory_stats["bytes_before_total"] / turns if turns else 0.0,
+        "avg_bytes_after": _memory_stats["bytes_after_total"] / turns if turns else 0.0,
+    }
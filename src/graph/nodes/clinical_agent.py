@@ -7,9 +7,18 @@
 import logging
 
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
 
 from src.config import settings
+from src.graph.context_budget import (
+    SCORE_HISTORY,
+    SCORE_INSTRUCTION,
+    ContextBlock,
+    assemble_context,
+    log_prompt_tokens,
+    manual_blocks,
+)
+from src.graph.llm import get_chat_model
+from src.graph.memory import get_history_context
 from src.models.inbody_models import get_model_profile
 from src.models.state import AgentState
 from src.prompts.disclaimers import MEDICAL_DISCLAIMER
@@ -47,29 +56,32 @@ async def clinical_agent_node(state: AgentState) -> dict:
     measurement_items = ", ".join(profile.measurement_items)
 
     # Step 2: 매뉴얼 RAG 검색
-    manual_result = search_manual.invoke({
+    manual_result = await search_manual.ainvoke({
         "model": model_id,
         "query": user_message,
     })
-    context_parts = [f"[매뉴얼 검색 결과]\n{manual_result}"]
+    context_parts = manual_blocks("[매뉴얼 검색 결과]", manual_result)
 
     # Step 3: T054 — 의학적 진단 요청 감지
     if _detect_diagnosis_request(user_message):
-        context_parts.append(
+        context_parts.append(ContextBlock(
             "[의학적 진단 요청 감지]\n"
             "사용자가 특정 질환에 대한 진단 또는 의학적 판단을 요청하고 있습니다.\n"
             "InBody는 체성분 분석 장비이며, 의학적 진단 도구가 아닙니다.\n"
-            "진단은 절대 불가함을 명확히 안내하고, 전문 의료인 상담을 권고하세요."
-        )
+            "진단은 절대 불가함을 명확히 안내하고, 전문 의료인 상담을 권고하세요.",
+            SCORE_INSTRUCTION,
+        ))
 
-    context = "\n\n".join(context_parts)
+    # 이전 대화 (요약 + 최근 턴, 토큰 예산 내)
+    history = get_history_context(state)
+    if history:
+        context_parts.append(ContextBlock(history, SCORE_HISTORY))
+
+    # 관련도 순으로 노드 예산 내 조립 (매뉴얼 청크 중복 제거)
+    context = assemble_context("clinical_agent", context_parts)
 
     # Step 4: GPT-4o로 응답 생성
-    llm = ChatOpenAI(
-        model=settings.openai_model,
-        api_key=settings.openai_api_key,
-        temperature=0.3,
-    )
+    llm = get_chat_model(settings.openai_model, temperature=0.3)
 
     system_prompt = CLINICAL_AGENT_PROMPT.format(
         model=model_id,
@@ -78,6 +90,8 @@ async def clinical_agent_node(state: AgentState) -> dict:
         context=context,
     )
 
+    log_prompt_tokens("clinical_agent", system_prompt, user_message)
+
     response = await llm.ainvoke([
         SystemMessage(content=system_prompt),
         HumanMessage(content=user_message),
@@ -0,0 +1,97 @@
+"""통합 라우터 노드 — 기종 식별 + 의도 분류를 1회 구조화 출력 호출로 처리
+
+settings.combined_router_enabled=True일 때 model_router → intent_router
+2단계 대신 사용된다. 사전 매칭으로 기종이 식별되면 의도만 분류하고,
+그렇지 않으면 JSON 스키마로 제약된 GPT-4o-mini 호출 1회로 {model, intent}를 얻는다.
+"""
+
+import logging
+from typing import Literal
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import HumanMessage, SystemMessage
+from openai import OpenAIError
+from pydantic import BaseModel, Field, ValidationError
+
+from src.config import settings
+from src.graph.llm import get_chat_model
+from src.graph.nodes.intent_router import intent_router_node
+from src.graph.nodes.model_router import (
+    _build_comparison_response,
+    _extract_all_models,
+    _pre_extract_model,
+    resolve_model_result,
+)
+from src.models.state import AgentState
+from src.prompts.system_prompts import ROUTER_PROMPT
+
+logger = logging.getLogger(__name__)
+
+
+class RouterDecision(BaseModel):
+    """통합 라우터 구조화 출력 스키마"""
+
+    model: Literal["270S", "580", "770S", "970S", "unidentified", "unsupported"] = Field(
+        description="InBody 기종 식별 결과"
+    )
+    intent: Literal["install", "connect", "troubleshoot", "clinical", "general"] = Field(
+        description="요청 의도"
+    )
+
+
+_structured_llm = None
+
+
+def _get_structured_llm():
+    """JSON 스키마 제약 출력 러너블 싱글톤 반환"""
+    global _structured_llm
+    if _structured_llm is None:
+        llm = get_chat_model(settings.openai_mini_model, temperature=0)
+        _structured_llm = llm.with_structured_output(
+            RouterDecision, method="json_schema", strict=True
+        )
+    return _structured_llm
+
+
+async def combined_router_node(state: AgentState) -> dict:
+    """사용자 메시지에서 기종과 의도를 한 번에 식별한다.
+
+    결과:
+    - comparison → answer에 비교 정보 설정 (T064)
+    - 사전 매칭 성공 → 기종 설정 + intent_router_node로 의도만 분류
+    - 그 외 → 구조화 출력 1회 호출 후 model_router와 동일한 분기 적용
+    """
+    user_message = state["messages"][-1].content
+    previous_model = state.get("identified_model")
+
+    # ── T064: 복수 기종 감지 (비교 질문) ──
+    all_models = _extract_all_models(user_message)
+    if len(all_models) >= 2:
+        logger.info("기종 비교 질문 감지: %s", all_models)
+        return {"answer": _build_comparison_response(all_models)}
+
+    # ── 사전 검사: 기종명이 직접 포함되면 의도만 분류 (로컬 분류기 우선)
+    pre_model = _pre_extract_model(user_message)
+    if pre_model:
+        logger.info("사전 매칭으로 기종 식별: %s", pre_model)
+        update = resolve_model_result(pre_model, previous_model)
+        update.update(await intent_router_node(state))
+        return update
+
+    try:
+        decision = await _get_structured_llm().ainvoke([
+            SystemMessage(content=ROUTER_PROMPT),
+            HumanMessage(content=user_message),
+        ])
+        model_id, intent = decision.model, decision.intent
+    except (OpenAIError, ValidationError, OutputParserException) as e:
+        logger.warning("통합 라우터 구조화 출력 실패 — unidentified/general로 폴백: %s", e)
+        model_id, intent = "unidentified", "general"
+
+    update = resolve_model_result(model_id, previous_model)
+    if update.get("answer"):
+        return update
+
+    update["intent"] = intent
+    update["needs_disclaimer"] = intent == "clinical"
+    return update
@@ -7,9 +7,19 @@
 import logging
 
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
 
 from src.config import settings
+from src.graph.context_budget import (
+    SCORE_HISTORY,
+    SCORE_INSTRUCTION,
+    SCORE_LOOKUP,
+    ContextBlock,
+    assemble_context,
+    log_prompt_tokens,
+    manual_blocks,
+)
+from src.graph.llm import get_chat_model
+from src.graph.memory import get_history_context
 from src.models.inbody_models import get_model_profile
 from src.models.state import AgentState
 from src.prompts.system_prompts import CONNECT_AGENT_PROMPT
@@ -63,38 +73,42 @@ async def connect_agent_node(state: AgentState) -> dict:
         "peripheral_name": peripheral_name,
     })
 
-    context_parts = [f"[주변기기 호환표 조회 결과]\n{compat_result}"]
+    context_parts = [ContextBlock(f"[주변기기 호환표 조회 결과]\n{compat_result}", SCORE_LOOKUP)]
 
     # Step 3: 매뉴얼 RAG 검색
-    manual_result = search_manual.invoke({
+    manual_result = await search_manual.ainvoke({
         "model": model_id,
         "query": user_message,
     })
-    context_parts.append(f"[연동 매뉴얼 검색 결과]\n{manual_result}")
+    context_parts.extend(manual_blocks("[연동 매뉴얼 검색 결과]", manual_result))
 
     # T050: 비호환/미등록 감지 시 추가 컨텍스트 주입
     if "조건에 맞는 호환 정보가 없습니다" in compat_result:
-        context_parts.append(
+        context_parts.append(ContextBlock(
             "[비호환/미등록 주변기기 감지]\n"
             "요청한 주변기기가 호환표에 등록되어 있지 않습니다.\n"
             "가능하다면 해당 기종에서 지원하는 대체 주변기기를 안내하세요.\n"
-            "공식 호환 목록에 없는 제품은 정상 동작을 보장할 수 없음을 안내하세요."
-        )
+            "공식 호환 목록에 없는 제품은 정상 동작을 보장할 수 없음을 안내하세요.",
+            SCORE_INSTRUCTION,
+        ))
     elif "비호환" in compat_result:
-        context_parts.append(
+        context_parts.append(ContextBlock(
             "[비호환 주변기기 감지]\n"
             "요청한 주변기기가 이 기종과 호환되지 않습니다.\n"
-            "비호환 사유를 명확히 설명하고, 호환되는 대안을 제시하세요."
-        )
+            "비호환 사유를 명확히 설명하고, 호환되는 대안을 제시하세요.",
+            SCORE_INSTRUCTION,
+        ))
 
-    context = "\n\n".join(context_parts)
+    # 이전 대화 (요약 + 최근 턴, 토큰 예산 내)
+    history = get_history_context(state)
+    if history:
+        context_parts.append(ContextBlock(history, SCORE_HISTORY))
+
+    # 관련도 순으로 노드 예산 내 조립 (매뉴얼 청크 중복 제거)
+    context = assemble_context("connect_agent", context_parts)
 
     # Step 4: GPT-4o로 응답 생성
-    llm = ChatOpenAI(
-        model=settings.openai_model,
-        api_key=settings.openai_api_key,
-        temperature=0.3,
-    )
+    llm = get_chat_model(settings.openai_model, temperature=0.3)
 
     system_prompt = CONNECT_AGENT_PROMPT.format(
         model=model_id,
@@ -102,6 +116,8 @@ async def connect_agent_node(state: AgentState) -> dict:
         context=context,
     )
 
+    log_prompt_tokens("connect_agent", system_prompt, user_message)
+
     response = await llm.ainvoke([
         SystemMessage(content=system_prompt),
         HumanMessage(content=user_message),
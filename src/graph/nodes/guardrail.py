@@ -5,14 +5,17 @@
 LLM 검증(GPT-4o-mini)은 보조적으로 사용한다.
 """
 
+import hashlib
 import json
 import logging
 import re
+from collections import OrderedDict
 
 from langchain_core.messages import SystemMessage
-from langchain_openai import ChatOpenAI
 
 from src.config import settings
+from src.graph.context_budget import count_tokens
+from src.graph.llm import get_chat_model
 from src.models.inbody_models import SUPPORTED_MODELS
 from src.models.state import AgentState
 from src.prompts.disclaimers import (
@@ -32,6 +35,154 @@ UNSAFE_REPAIR_KEYWORDS: list[str] = [
     "하우징 열", "직접 수리", "내부를 열", "커버를 분리",
 ]
 
+# 최대 재시도 초과 시 안전 폴백 응답
+SAFE_FALLBACK_ANSWER = (
+    "죄송합니다. 안전한 응답을 생성하지 못했습니다. "
+    f"InBody 고객센터로 직접 문의해 주세요.\n\n{SERVICE_CENTER_INFO}"
+)
+
+# 응답 출처(answer_source)별 신뢰 등급
+# - trusted: 검수된 DB 문구 + 고정 문구 → 면책 문구 검사만 수행
+# - deterministic: 코드로 조립한 응답 → 결정론적 검사만 수행 (LLM 검증 생략)
+# - untrusted: LLM 생성 응답 → 전체 검사
+TRUST_TIERS: dict[str, str] = {
+    "template": "trusted",
+    "placeholder": "deterministic",
+    "llm": "untrusted",
+}
+
+# 사전 컴파일 매처 — 기종별 "타 기종 언급" 단일 정규식, 위험 키워드 단일 정규식
+_OTHER_MODEL_PATTERNS: dict[str, re.Pattern] = {
+    model: re.compile(
+        r"\bInBody\s+("
+        + "|".join(re.escape(m) for m in sorted(SUPPORTED_MODELS - {model}))
+        + r")\b",
+        re.IGNORECASE,
+    )
+    for model in SUPPORTED_MODELS
+}
+_UNSAFE_REPAIR_PATTERN = re.compile("|".join(re.escape(k) for k in UNSAFE_REPAIR_KEYWORDS))
+
+# 위험 키워드 검사 전 제거할 고정 안내 문구 (HARDWARE_DISCLAIMER 자체가 "내부 부품"을 포함)
+FIXED_NOTICES = (HARDWARE_DISCLAIMER, MEDICAL_DISCLAIMER, SERVICE_CENTER_INFO)
+
+# LLM 검증 결과 캐시: (응답 해시, 상태 플래그) → (passed, violations, suggestion)
+_verdict_cache: OrderedDict[tuple, tuple[bool, list[str], str | None]] = OrderedDict()
+_guardrail_stats = {
+    "total": 0,
+    "llm_calls": 0,
+    "cache_hits": 0,
+    "skipped_trusted": 0,
+    "skipped_deterministic": 0,
+    "skipped_hard_fail": 0,
+}
+
+
+def find_other_models(answer: str, identified_model: str) -> list[str]:
+    """응답에 언급된 타 기종 목록 반환 (중복 제거, 발견 순서 유지)"""
+    pattern = _OTHER_MODEL_PATTERNS.get(identified_model)
+    if pattern is None:
+        return []
+    found: dict[str, None] = {}
+    for match in pattern.finditer(answer):
+        found[match.group(1).upper()] = None
+    return list(found)
+
+
+def find_unsafe_repair(answer: str) -> str | None:
+    """고정 안내 문구를 제외한 본문에서 첫 위험 키워드 반환"""
+    for notice in FIXED_NOTICES:
+        answer = answer.replace(notice, "")
+    match = _UNSAFE_REPAIR_PATTERN.search(answer)
+    return match.group(0) if match else None
+
+
+def _verdict_key(answer: str, state: AgentState) -> tuple:
+    """검증 캐시 키 — 응답 해시 + 판정에 영향을 주는 상태 플래그"""
+    digest = hashlib.sha256(answer.encode("utf-8")).hexdigest()
+    return (
+        digest,
+        state.get("identified_model"),
+        state.get("intent"),
+        state.get("support_level"),
+        bool(state.get("needs_disclaimer")),
+    )
+
+
+async def _llm_verdict(
+    answer: str, state: AgentState
+) -> tuple[bool, list[str], str | None] | None:
+    """LLM 종합 검증 (캐시 우선). 검증 실패 시 None (통과 처리)"""
+    key = _verdict_key(answer, state)
+    cached = _verdict_cache.get(key)
+    if cached is not None:
+        _verdict_cache.move_to_end(key)
+        _guardrail_stats["cache_hits"] += 1
+        return cached
+
+    _guardrail_stats["llm_calls"] += 1
+    try:
+        llm = get_chat_model(settings.openai_mini_model, temperature=0)
+        guardrail_prompt = GUARDRAIL_PROMPT.format(
+            model=state.get("identified_model"),
+            intent=state.get("intent", "general"),
+            answer=answer,
+        )
+        response = await llm.ainvoke([SystemMessage(content=guardrail_prompt)])
+        result = json.loads(response.content.strip())
+    except (json.JSONDecodeError, Exception):
+        logger.warning("가드레일 LLM 검증 실패 — 통과 처리")
+        return None
+
+    verdict = (
+        bool(result.get("passed", True)),
+        list(result.get("violations", [])),
+        result.get("suggestion", ""),
+    )
+    _verdict_cache[key] = verdict
+    if len(_verdict_cache) > settings.guardrail_cache_size:
+        _verdict_cache.popitem(last=False)
+    return verdict
+
+
+def export_verdict_cache() -> list[tuple[tuple, tuple]]:
+    """검증 캐시 항목을 오래된 순으로 반환한다 (종료 시 스냅샷용)."""
+    return list(_verdict_cache.items())
+
+
+def import_verdict_cache(entries: list) -> int:
+    """스냅샷의 검증 캐시 항목을 채운다. 이미 있는 키는 유지하며 추가 수를 반환한다."""
+    added = 0
+    # 스냅샷 항목은 현재 항목보다 오래된 것으로 취급 → 최신 항목부터 앞쪽에 끼워 넣는다
+    for key, verdict in reversed(entries):
+        key = tuple(key)
+        if key in _verdict_cache:
+            continue
+        passed, violations, suggestion = verdict
+        _verdict_cache[key] = (bool(passed), list(violations), suggestion)
+        _verdict_cache.move_to_end(key, last=False)
+        added += 1
+    while len(_verdict_cache) > settings.guardrail_cache_size:
+        _verdict_cache.popitem(last=False)
+    return added
+
+
+def get_guardrail_stats() -> dict:
+    """가드레일 LLM 호출/회피 통계 반환"""
+    avoided = (
+        _guardrail_stats["cache_hits"]
+        + _guardrail_stats["skipped_trusted"]
+        + _guardrail_stats["skipped_deterministic"]
+        + _guardrail_stats["skipped_hard_fail"]
+    )
+    total = _guardrail_stats["total"]
+    return {
+        **_guardrail_stats,
+        "llm_avoided": avoided,
+        "llm_avoided_rate": avoided / total if total else 0.0,
+        "cache_size": len(_verdict_cache),
+    }
+
 
 async def guardrail_node(state: AgentState) -> dict:
     """가드레일 안전 검증 노드.
@@ -40,12 +191,14 @@ async def guardrail_node(state: AgentState) -> dict:
     1. 면책 문구 검증 (결정론적, 자동 삽입)
     2. 기종 격리 검증 (결정론적, hard-fail)
     3. Level 3 안전 검증 (결정론적, hard-fail)
-    4. LLM 종합 검증 (GPT-4o-mini, hard-fail 없을 때만)
+    4. LLM 종합 검증 (GPT-4o-mini, hard-fail 없을 때만, 캐시 우선)
+
+    응답 출처의 신뢰 등급(TRUST_TIERS)에 따라 검사 3/4를 생략한다.
     """
     answer = state.get("answer", "")
     identified_model = state.get("identified_model")
-    intent = state.get("intent", "general")
     retry_count = state.get("guardrail_retry_count", 0)
+    tier = TRUST_TIERS.get(state.get("answer_source") or "llm", "untrusted")
 
     if not answer:
         return {
@@ -54,6 +207,7 @@ async def guardrail_node(state: AgentState) -> dict:
             "guardrail_suggestion": None,
         }
 
+    _guardrail_stats["total"] += 1
     violations: list[str] = []
     hard_fail = False
 
@@ -68,59 +222,41 @@ async def guardrail_node(state: AgentState) -> dict:
 
     # ── 검사 2: 기종 격리 검증 (hard-fail) ──
     if identified_model:
-        other_models = SUPPORTED_MODELS - {identified_model}
-        for other_model in other_models:
-            pattern = rf"\bInBody\s+{re.escape(other_model)}\b"
-            if re.search(pattern, answer, re.IGNORECASE):
-                violations.append(
-                    f"기종 격리 위반: {other_model} 기종 정보가 응답에 포함됨"
-                )
-                hard_fail = True
+        for other_model in find_other_models(answer, identified_model):
+            violations.append(
+                f"기종 격리 위반: {other_model} 기종 정보가 응답에 포함됨"
+            )
+            hard_fail = True
 
     # ── 검사 3: Level 3 안전 검증 (hard-fail) ──
-    if state.get("support_level") == "level_3":
-        for keyword in UNSAFE_REPAIR_KEYWORDS:
-            if keyword in answer:
-                violations.append(
-                    f"Level 3 안전 위반: '{keyword}' — 사용자 직접 수리 안내 감지"
-                )
-                hard_fail = True
-                break
+    if state.get("support_level") == "level_3" and tier != "trusted":
+        keyword = find_unsafe_repair(answer)
+        if keyword:
+            violations.append(
+                f"Level 3 안전 위반: '{keyword}' — 사용자 직접 수리 안내 감지"
+            )
+            hard_fail = True
 
     # ── 검사 4: LLM 종합 검증 (hard-fail 없을 때만) ──
     suggestion = None
-    if not hard_fail and identified_model:
-        try:
-            llm = ChatOpenAI(
-                model=settings.openai_mini_model,
-                api_key=settings.openai_api_key,
-                temperature=0,
-            )
-            guardrail_prompt = GUARDRAIL_PROMPT.format(
-                model=identified_model,
-                intent=intent,
-                answer=answer,
-            )
-            response = await llm.ainvoke([SystemMessage(content=guardrail_prompt)])
-            result = json.loads(response.content.strip())
-
-            if not result.get("passed", True):
-                llm_violations = result.get("violations", [])
-                violations.extend(llm_violations)
-                suggestion = result.get("suggestion", "")
-                hard_fail = True
-        except (json.JSONDecodeError, Exception):
-            logger.warning("가드레일 LLM 검증 실패 — 통과 처리")
+    if hard_fail:
+        _guardrail_stats["skipped_hard_fail"] += 1
+    elif tier == "trusted":
+        _guardrail_stats["skipped_trusted"] += 1
+    elif tier == "deterministic":
+        _guardrail_stats["skipped_deterministic"] += 1
+    elif identified_model:
+        verdict = await _llm_verdict(answer, state)
+        if verdict is not None and not verdict[0]:
+            violations.extend(verdict[1])
+            suggestion = verdict[2]
+            hard_fail = True
 
     # ── 최대 재시도 초과 시 안전 폴백 ──
     if hard_fail and retry_count >= MAX_GUARDRAIL_RETRIES:
         logger.warning("가드레일 최대 재시도 초과 — 안전 폴백 메시지 반환")
-        answer = (
-            "죄송합니다. 안전한 응답을 생성하지 못했습니다. "
-            f"InBody 고객센터로 직접 문의해 주세요.\n\n{SERVICE_CENTER_INFO}"
-        )
         return {
-            "answer": answer,
+            "answer": SAFE_FALLBACK_ANSWER,
             "guardrail_passed": True,
             "guardrail_violations": violations,
             "guardrail_suggestion": None,
@@ -134,9 +270,91 @@ async def guardrail_node(state: AgentState) -> dict:
     }
 
 
+# 결정론적 검사가 만든 위반 접두어 — 그 외 위반(LLM 검증)은 의미적 위반으로 간주
+DETERMINISTIC_VIOLATION_PREFIXES = ("면책 문구 자동 삽입", "기종 격리 위반", "Level 3 안전 위반")
+
+# 문장 경계: 마침표/물음표/느낌표 뒤 공백 (목록 번호 "1. "은 제외)
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[^\d][.!?])\s+")
+
+_repair_stats = {
+    "deterministic_repairs": 0,
+    "llm_repairs": 0,
+    "sentences_redacted": 0,
+    "tokens_saved_est": 0,
+}
+
+
+def _is_unsafe_sentence(sentence: str, identified_model: str | None, level_3: bool) -> bool:
+    """문장이 타 기종 언급 또는 (Level 3) 위험 수리 안내를 포함하는지 확인"""
+    if identified_model and find_other_models(sentence, identified_model):
+        return True
+    return level_3 and find_unsafe_repair(sentence) is not None
+
+
+def repair_answer(
+    answer: str,
+    identified_model: str | None,
+    support_level: str | None,
+    needs_disclaimer: bool,
+) -> str | None:
+    """결정론적 위반을 문장 단위로 제거하고 필수 안내 문구를 보장한다.
+
+    Args:
+        answer: 위반이 감지된 응답
+        identified_model: 식별된 기종 (타 기종 언급 문장 제거 기준)
+        support_level: "level_3"이면 위험 수리 안내 문장도 제거
+        needs_disclaimer: 의학적 면책 문구 필요 여부
+
+    Returns:
+        수정된 응답. 본문이 남지 않거나 위반이 남으면 None (LLM 재생성 필요)
+    """
+    level_3 = support_level == "level_3"
+
+    # 고정 안내 문구는 분리 후 마지막에 다시 붙인다 (HARDWARE_DISCLAIMER 자체에 위험 키워드 포함)
+    notices = [notice for notice in FIXED_NOTICES if notice in answer]
+    body = answer
+    for notice in notices:
+        body = body.replace(notice, "")
+    if needs_disclaimer and MEDICAL_DISCLAIMER not in notices:
+        notices.append(MEDICAL_DISCLAIMER)
+    # Level 3 응답은 하드웨어 면책 + 서비스 센터 정보를 항상 포함 (T042)
+    if level_3 and HARDWARE_DISCLAIMER not in notices:
+        notices.insert(0, HARDWARE_DISCLAIMER)
+    if level_3 and SERVICE_CENTER_INFO not in notices:
+        notices.append(SERVICE_CENTER_INFO)
+
+    lines: list[str] = []
+    for line in body.split("\n"):
+        if not line.strip():
+            lines.append(line)
+            continue
+        sentences = _SENTENCE_BOUNDARY.split(line)
+        kept = [s for s in sentences if not _is_unsafe_sentence(s, identified_model, level_3)]
+        _repair_stats["sentences_redacted"] += len(sentences) - len(kept)
+        if kept:
+            lines.append(" ".join(kept))
+
+    repaired_body = re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+    if not repaired_body:
+        return None
+    # 문장 경계를 넘는 패턴(줄바꿈 사이 기종명 등)이 남으면 결정론적 수정 불가
+    if _is_unsafe_sentence(repaired_body, identified_model, level_3):
+        return None
+
+    return "\n\n".join([repaired_body, *notices])
+
+
+def get_repair_stats() -> dict:
+    """응답 수정 통계 반환 (결정론적 수정으로 절약한 LLM 재생성 횟수/토큰 추정치)"""
+    return {**_repair_stats, "llm_calls_saved": _repair_stats["deterministic_repairs"]}
+
+
 async def fix_response_node(state: AgentState) -> dict:
     """가드레일 위반 시 응답을 수정한다.
 
+    결정론적 위반(타 기종 언급, Level 3 위험 안내, 면책 문구)만 있으면
+    문장 단위로 제거·보완하고 재시도 횟수를 소모하지 않는다.
+    의미적 위반(LLM 검증)이 있거나 결정론적 수정이 불가능하면
     guardrail_violations와 guardrail_suggestion을 기반으로
     GPT-4o가 수정된 응답을 생성한다.
     """
@@ -155,16 +373,38 @@ async def fix_response_node(state: AgentState) -> dict:
         f"반드시 {identified_model} 기종에 대한 정보만 포함하세요."
     )
 
-    llm = ChatOpenAI(
-        model=settings.openai_model,
-        api_key=settings.openai_api_key,
-        temperature=0.2,
-    )
+    # 수정 제안이 있으면(LLM 검증, 스트리밍 중단된 부분 응답) 전체 재작성 필요
+    if not suggestion and all(
+        v.startswith(DETERMINISTIC_VIOLATION_PREFIXES) for v in violations
+    ):
+        repaired = repair_answer(
+            original_answer,
+            state.get("identified_model"),
+            state.get("support_level"),
+            bool(state.get("needs_disclaimer")),
+        )
+        if repaired is not None:
+            _repair_stats["deterministic_repairs"] += 1
+            # 회피한 GPT-4o 호출 토큰 추정치 (프롬프트 + 원 응답 길이의 출력)
+            _repair_stats["tokens_saved_est"] += count_tokens(fix_prompt) + count_tokens(
+                original_answer
+            )
+            logger.info("가드레일 위반 결정론적 수정: %s", violations)
+            return {
+                "answer": repaired,
+                "guardrail_passed": None,
+                "guardrail_violations": [],
+                "guardrail_suggestion": None,
+            }
+
+    _repair_stats["llm_repairs"] += 1
+    llm = get_chat_model(settings.openai_model, temperature=0.2)
 
     response = await llm.ainvoke([SystemMessage(content=fix_prompt)])
 
     return {
         "answer": response.content,
+        "answer_source": "llm",
         "guardrail_retry_count": retry_count + 1,
         "guardrail_passed": None,
         "guardrail_violations": [],
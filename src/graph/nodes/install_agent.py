@@ -7,9 +7,18 @@
 import logging
 
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
 
 from src.config import settings
+from src.graph.context_budget import (
+    SCORE_HISTORY,
+    SCORE_INSTRUCTION,
+    ContextBlock,
+    assemble_context,
+    log_prompt_tokens,
+    manual_blocks,
+)
+from src.graph.llm import get_chat_model
+from src.graph.memory import get_history_context
 from src.models.inbody_models import get_model_profile
 from src.models.state import AgentState
 from src.prompts.system_prompts import INSTALL_AGENT_PROMPT
@@ -49,42 +58,46 @@ async def install_agent_node(state: AgentState) -> dict:
     install_type = profile.install_type
 
     # Step 1: 설치 매뉴얼 RAG 검색
-    manual_result = search_manual.invoke({
+    manual_result = await search_manual.ainvoke({
         "model": model_id,
         "query": user_message,
     })
 
-    context_parts = [f"[설치 매뉴얼 검색 결과]\n{manual_result}"]
+    context_parts = manual_blocks("[설치 매뉴얼 검색 결과]", manual_result)
 
     # Step 2: 설치 유형 정보 추가
     install_label = INSTALL_TYPE_LABELS.get(install_type, install_type)
-    context_parts.append(
+    context_parts.append(ContextBlock(
         f"[설치 유형 정보]\n"
         f"이 기종은 {install_label} 설치 유형입니다.\n"
         f"- 접이식(foldable): 본체를 펼쳐서 설치하는 방식 (270S, 580)\n"
-        f"- 분리형(separable): 본체와 전극부를 분리 조립하는 방식 (770S, 970S)"
-    )
+        f"- 분리형(separable): 본체와 전극부를 분리 조립하는 방식 (770S, 970S)",
+        SCORE_INSTRUCTION,
+    ))
 
     # T047: 설치 중 문제 감지
     if _is_install_trouble(user_message):
-        context_parts.append(
+        context_parts.append(ContextBlock(
             "[설치 중 문제 감지]\n"
             "사용자가 설치 과정에서 특정 단계에 막혀 있습니다.\n"
             "해당 단계에 대한 체크리스트를 제시하세요:\n"
             "- 해당 단계의 전제 조건이 충족되었는지 확인\n"
             "- 일반적인 실수나 누락 사항 안내\n"
             "- 물리적 연결 상태(케이블, 커넥터, 나사 등) 점검 항목\n"
-            "- 그래도 해결되지 않을 경우 서비스 센터 연락 안내"
-        )
+            "- 그래도 해결되지 않을 경우 서비스 센터 연락 안내",
+            SCORE_INSTRUCTION,
+        ))
+
+    # 이전 대화 (요약 + 최근 턴, 토큰 예산 내)
+    history = get_history_context(state)
+    if history:
+        context_parts.append(ContextBlock(history, SCORE_HISTORY))
 
-    context = "\n\n".join(context_parts)
+    # 관련도 순으로 노드 예산 내 조립 (매뉴얼 청크 중복 제거)
+    context = assemble_context("install_agent", context_parts)
 
     # Step 3: GPT-4o로 응답 생성
-    llm = ChatOpenAI(
-        model=settings.openai_model,
-        api_key=settings.openai_api_key,
-        temperature=0.3,
-    )
+    llm = get_chat_model(settings.openai_model, temperature=0.3)
 
     system_prompt = INSTALL_AGENT_PROMPT.format(
         model=model_id,
@@ -93,6 +106,8 @@ async def install_agent_node(state: AgentState) -> dict:
         context=context,
     )
 
+    log_prompt_tokens("install_agent", system_prompt, user_message)
+
     response = await llm.ainvoke([
         SystemMessage(content=system_prompt),
         HumanMessage(content=user_message),
@@ -1,16 +1,18 @@
 """의도 분류 노드 (IntentRouter) — T035
 
-GPT-4o-mini를 사용하여 사용자 메시지의 의도를 5가지 중 하나로 분류한다.
+사용자 메시지의 의도를 5가지 중 하나로 분류한다.
 install / connect / troubleshoot / clinical / general
+로컬 분류기 신뢰도가 임계값 이상이면 즉시 반환하고, 미만일 때만 GPT-4o-mini를 호출한다.
 """
 
 import json
 import logging
 
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
 
 from src.config import settings
+from src.graph.intent_classifier import get_intent_classifier, record_intent_decision
+from src.graph.llm import get_chat_model
 from src.models.state import AgentState
 from src.prompts.system_prompts import INTENT_ROUTER_PROMPT
 
@@ -24,14 +26,23 @@ async def intent_router_node(state: AgentState) -> dict:
 
     5가지 의도: install, connect, troubleshoot, clinical, general
     clinical이면 needs_disclaimer=True 설정
+    로컬 분류기 신뢰도 < intent_classifier_threshold일 때만 LLM 호출
     """
     user_message = state["messages"][-1].content
 
-    llm = ChatOpenAI(
-        model=settings.openai_mini_model,
-        api_key=settings.openai_api_key,
-        temperature=0,
-    )
+    # 사전 분류: 로컬 분류기 신뢰도가 충분하면 LLM 없이 즉시 분류
+    if settings.intent_classifier_enabled:
+        intent, confidence = get_intent_classifier().predict(user_message)
+        if intent in VALID_INTENTS and confidence >= settings.intent_classifier_threshold:
+            logger.info("로컬 분류기로 의도 분류: %s (%.2f)", intent, confidence)
+            record_intent_decision(used_llm=False)
+            return {
+                "intent": intent,
+                "needs_disclaimer": intent == "clinical",
+            }
+
+    record_intent_decision(used_llm=True)
+    llm = get_chat_model(settings.openai_mini_model, temperature=0)
 
     response = await llm.ainvoke([
         SystemMessage(content=INTENT_ROUTER_PROMPT.format()),
@@ -0,0 +1,56 @@
+"""대화 메모리 노드 — 턴 종료 시 응답 기록 + 오래된 턴 요약
+
+모든 경로의 마지막에 실행되어 최종 응답을 AIMessage로 기록하고,
+최근 settings.memory_window_turns턴만 원문으로 남긴 채
+나머지를 conversation_summary로 접는다 (스레드당 상태 크기 상한 적용).
+"""
+
+import logging
+
+from langchain_core.messages import AIMessage, RemoveMessage
+
+from src.config import settings
+from src.graph.memory import compact_history, record_memory_usage, state_bytes
+from src.models.state import AgentState
+
+logger = logging.getLogger(__name__)
+
+
+async def memory_node(state: AgentState) -> dict:
+    """최종 응답을 대화 이력에 추가하고 이력을 윈도우 + 요약으로 압축한다."""
+    answer = state.get("answer") or ""
+    new_messages = [AIMessage(content=answer)] if answer else []
+    messages = [*state.get("messages", []), *new_messages]
+    summary = state.get("conversation_summary") or ""
+
+    removed, new_summary = compact_history(
+        messages,
+        summary,
+        window_turns=settings.memory_window_turns,
+        max_bytes=settings.memory_max_state_bytes,
+        summary_max_chars=settings.memory_summary_max_chars,
+    )
+
+    # 메모리 관리가 없었다면 누적됐을 크기 (세션 누적 원문 바이트)
+    history_bytes = (state.get("history_bytes") or 0) + state_bytes(
+        [state["messages"][-1], *new_messages] if state.get("messages") else new_messages,
+        "",
+    )
+    # 세션 누적 사용자 메시지 수 — 이력이 윈도우로 잘려도 줄지 않는다
+    # (카운터 도입 이전 세션은 현재 남아 있는 사용자 메시지 수에서 시작)
+    turn_count = state.get("turn_count")
+    if turn_count is None:
+        turn_count = sum(1 for m in state.get("messages", [])[:-1] if m.type == "human")
+    turn_count += 1
+
+    kept = messages[len(removed):]  # removed는 항상 앞쪽 턴들
+    record_memory_usage(history_bytes, state_bytes(kept, new_summary), len(removed))
+    if removed:
+        logger.debug("대화 이력 압축: %d개 메시지 요약으로 이동", len(removed))
+
+    return {
+        "messages": [*new_messages, *(RemoveMessage(id=m.id) for m in removed)],
+        "conversation_summary": new_summary,
+        "history_bytes": history_bytes,
+        "turn_count": turn_count,
+    }
@@ -9,9 +9,9 @@ import logging
 import re
 
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
 
 from src.config import settings
+from src.graph.llm import get_chat_model
 from src.models.inbody_models import INBODY_MODELS, SUPPORTED_MODELS, get_model_profile
 from src.models.state import AgentState
 from src.prompts.disclaimers import SERVICE_CENTER_INFO
@@ -54,11 +54,7 @@ async def model_router_node(state: AgentState) -> dict:
             "tone_profile": profile.tone_profile,
         }
 
-    llm = ChatOpenAI(
-        model=settings.openai_mini_model,
-        api_key=settings.openai_api_key,
-        temperature=0,
-    )
+    llm = get_chat_model(settings.openai_mini_model, temperature=0)
 
     response = await llm.ainvoke([
         SystemMessage(content=MODEL_ROUTER_PROMPT.format()),
@@ -73,6 +69,14 @@ async def model_router_node(state: AgentState) -> dict:
         logger.warning("ModelRouter JSON 파싱 실패 — unidentified로 폴백")
         model_id = "unidentified"
 
+    return resolve_model_result(model_id, previous_model)
+
+
+def resolve_model_result(model_id: str, previous_model: str | None) -> dict:
+    """LLM 기종 식별 결과를 상태 업데이트로 변환한다.
+
+    model_router_node와 combined_router_node가 공유한다.
+    """
     # identified: 지원 기종
     if model_id in SUPPORTED_MODELS:
         profile = get_model_profile(model_id)
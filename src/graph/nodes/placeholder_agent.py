@@ -39,4 +39,4 @@ async def placeholder_agent_node(state: AgentState) -> dict:
     if state.get("needs_disclaimer"):
         answer += f"\n\n{MEDICAL_DISCLAIMER}"
 
-    return {"answer": answer}
+    return {"answer": answer, "answer_source": "placeholder"}
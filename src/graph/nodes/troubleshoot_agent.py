@@ -8,15 +8,32 @@ import logging
 import re
 
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
 
 from src.config import settings
+from src.graph.context_budget import (
+    SCORE_FALLBACK,
+    SCORE_HISTORY,
+    SCORE_INSTRUCTION,
+    SCORE_LOOKUP,
+    ContextBlock,
+    assemble_context,
+    log_prompt_tokens,
+    manual_blocks,
+)
+from src.graph.llm import get_chat_model
+from src.graph.memory import get_history_context
+from src.models.error_codes import ErrorCodeResponse
 from src.models.inbody_models import get_model_profile
 from src.models.state import AgentState
 from src.prompts.disclaimers import HARDWARE_DISCLAIMER, SERVICE_CENTER_INFO
 from src.prompts.system_prompts import TROUBLESHOOT_AGENT_PROMPT
-from src.prompts.tone_profiles import get_tone_instruction
-from src.tools.error_code_tool import lookup_error_code, search_errors_by_symptom
+from src.prompts.tone_profiles import get_tone_instruction, get_tone_template
+from src.tools.error_code_tool import (
+    fetch_error_code,
+    lookup_error_code,
+    search_errors_by_symptom,
+)
+from src.tools.fanout import gather_tools
 from src.tools.manual_search_tool import extract_image_urls, search_manual
 
 logger = logging.getLogger(__name__)
@@ -28,14 +45,19 @@ ESCALATION_KEYWORDS = [
     "계속", "같은 문제", "동일한 문제",
 ]
 
+# 템플릿 응답 적중 통계 (에러 코드 정확 일치 → LLM 미호출)
+_template_stats = {"total": 0, "template": 0, "llm": 0}
+
 
 async def troubleshoot_agent_node(state: AgentState) -> dict:
     """트러블슈팅 에이전트: 에러 코드 분석 + 해결책 생성.
 
     흐름:
     1. 사용자 메시지에서 에러 코드 추출 (T040)
-    2. 에러 코드 있음 → lookup_error_code 호출
-       에러 코드 없음 → search_errors_by_symptom + search_manual RAG 검색 (T041)
+       에러 코드 1개가 DB에 정확히 일치 → 톤별 템플릿 응답 (LLM 미호출)
+    2. 도구 동시 호출 (도구별 타임아웃, 느린 도구는 제외하고 진행)
+       에러 코드 있음 → lookup_error_code + search_manual
+       에러 코드 없음 → search_errors_by_symptom + search_manual (T041)
     3. Level 1/Level 3 분기 응답 생성 (T042)
     4. 에스컬레이션 감지 시 Level 3 이관 안내 (T043)
     """
@@ -47,58 +69,97 @@ async def troubleshoot_agent_node(state: AgentState) -> dict:
     # Step 1: 에러 코드 추출
     error_code = _extract_error_code(user_message)
     is_escalation = _is_escalation(user_message)
+    _template_stats["total"] += 1
+
+    # Step 1.5: 에러 코드 정확 일치 → 결정론적 템플릿 응답
+    if (
+        error_code
+        and settings.error_code_template_enabled
+        and not _has_multiple_error_codes(user_message)
+    ):
+        error = await fetch_error_code(model_id, error_code)
+        if error is not None:
+            _template_stats["template"] += 1
+            answer = _render_error_code_answer(error, profile.tone_profile)
+            return {
+                "answer": _append_support_notices(
+                    answer, error.support_level, is_escalation
+                ),
+                "answer_source": "template",
+                "error_code": error_code,
+                "support_level": error.support_level,
+                "image_urls": [],
+            }
 
-    # Step 2: 도구 호출로 컨텍스트 수집
-    context_parts = []
+    _template_stats["llm"] += 1
+
+    # Step 2: 도구 동시 호출로 컨텍스트 수집 (도구별 타임아웃, 부분 결과 허용)
+    context_parts: list[ContextBlock] = []
     support_level = None
     image_urls: list[str] = []
 
+    tool_calls = {
+        "search_manual": search_manual.ainvoke({
+            "model": model_id,
+            "query": user_message,
+        }),
+    }
     if error_code:
         # T040: 에러 코드 조회
-        error_result = await lookup_error_code.ainvoke({
+        tool_calls["lookup_error_code"] = lookup_error_code.ainvoke({
             "model": model_id,
             "error_code": error_code,
         })
-        context_parts.append(f"[에러 코드 조회 결과]\n{error_result}")
+    else:
+        # T041: 증상 기반 검색
+        tool_calls["search_errors_by_symptom"] = search_errors_by_symptom.ainvoke({
+            "model": model_id,
+            "symptom_description": user_message,
+        })
+
+    results = await gather_tools(tool_calls, timeout=settings.tool_timeout_seconds)
+
+    error_result = results.get("lookup_error_code")
+    if error_result:
+        context_parts.append(ContextBlock(f"[에러 코드 조회 결과]\n{error_result}", SCORE_LOOKUP))
 
         # support_level 추출
         if "서비스 센터 이관 필요 (Level 3)" in error_result:
             support_level = "level_3"
         elif "사용자 해결 가능 (Level 1)" in error_result:
             support_level = "level_1"
-    else:
-        # T041: 증상 기반 검색
-        symptom_result = await search_errors_by_symptom.ainvoke({
-            "model": model_id,
-            "symptom_description": user_message,
-        })
-        context_parts.append(f"[증상 기반 에러 검색 결과]\n{symptom_result}")
 
-        # 매뉴얼 RAG 검색
-        manual_result = search_manual.invoke({
-            "model": model_id,
-            "query": user_message,
-        })
-        context_parts.append(f"[매뉴얼 검색 결과]\n{manual_result}")
+    symptom_result = results.get("search_errors_by_symptom")
+    if symptom_result:
+        # 일치 항목 없이 전체 목록으로 폴백한 결과는 관련도 낮음
+        score = SCORE_FALLBACK if "정확히 일치하는 항목 없음" in symptom_result else SCORE_LOOKUP
+        context_parts.append(ContextBlock(f"[증상 기반 에러 검색 결과]\n{symptom_result}", score))
+
+    manual_result = results["search_manual"]
+    if manual_result:
+        context_parts.extend(manual_blocks("[매뉴얼 검색 결과]", manual_result))
         image_urls = extract_image_urls(manual_result)
 
     # T043: 에스컬레이션 감지
     if is_escalation:
-        context_parts.append(
+        context_parts.append(ContextBlock(
             "[에스컬레이션 감지]\n"
             "사용자가 이전 해결 방법으로 문제가 해결되지 않았다고 보고했습니다.\n"
             "다음 단계의 해결책을 제시하거나, 더 이상 사용자 해결이 불가능하면 "
-            "서비스 센터(Level 3) 이관을 안내하세요."
-        )
+            "서비스 센터(Level 3) 이관을 안내하세요.",
+            SCORE_INSTRUCTION,
+        ))
+
+    # 이전 대화 (요약 + 최근 턴, 토큰 예산 내)
+    history = get_history_context(state)
+    if history:
+        context_parts.append(ContextBlock(history, SCORE_HISTORY))
 
-    context = "\n\n".join(context_parts)
+    # 관련도 순으로 노드 예산 내 조립 (매뉴얼 청크 중복 제거)
+    context = assemble_context("troubleshoot_agent", context_parts)
 
     # Step 3: GPT-4o로 응답 생성
-    llm = ChatOpenAI(
-        model=settings.openai_model,
-        api_key=settings.openai_api_key,
-        temperature=0.3,
-    )
+    llm = get_chat_model(settings.openai_model, temperature=0.3)
 
     system_prompt = TROUBLESHOOT_AGENT_PROMPT.format(
         model=model_id,
@@ -106,13 +167,32 @@ async def troubleshoot_agent_node(state: AgentState) -> dict:
         context=context,
     )
 
-    response = await llm.ainvoke([
-        SystemMessage(content=system_prompt),
-        HumanMessage(content=user_message),
-    ])
+    log_prompt_tokens("troubleshoot_agent", system_prompt, user_message)
 
-    answer = response.content
+    # support_level 메타데이터 → /chat/stream 스트리밍 가드레일의 Level 3 검사에 사용
+    response = await llm.ainvoke(
+        [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=user_message),
+        ],
+        config={"metadata": {"support_level": support_level}},
+    )
+
+    answer = _append_support_notices(response.content, support_level, is_escalation)
 
+    return {
+        "answer": answer,
+        "answer_source": "llm",
+        "error_code": error_code,
+        "support_level": support_level,
+        "image_urls": image_urls,
+    }
+
+
+def _append_support_notices(
+    answer: str, support_level: str | None, is_escalation: bool
+) -> str:
+    """지원 수준/에스컬레이션에 따른 안내 문구를 덧붙인다."""
     # T042: Level 3 → 하드웨어 면책 + 서비스 센터 정보 추가
     if support_level == "level_3":
         answer += f"\n\n{HARDWARE_DISCLAIMER}\n\n{SERVICE_CENTER_INFO}"
@@ -125,11 +205,45 @@ async def troubleshoot_agent_node(state: AgentState) -> dict:
             f"{SERVICE_CENTER_INFO}"
         )
 
+    return answer
+
+
+def _render_error_code_answer(error: ErrorCodeResponse, tone_profile: str) -> str:
+    """에러 코드 조회 결과를 톤별 템플릿으로 렌더링한다.
+
+    Args:
+        error: 에러 코드 조회 결과
+        tone_profile: "casual" | "professional"
+
+    Returns:
+        LLM 없이 생성한 응답 본문 (면책/이관 안내는 호출 측에서 추가)
+    """
+    header = get_tone_template(tone_profile, "error_code_header").format(
+        model=error.model_id,
+        code=error.code,
+        title=error.title,
+        cause=error.cause,
+    )
+    steps_key = "level_3_steps" if error.support_level == "level_3" else "level_1_steps"
+    step_template = get_tone_template(tone_profile, "step")
+    lines = [header, "", get_tone_template(tone_profile, steps_key)]
+    lines.extend(
+        step_template.format(index=i + 1, step=step)
+        for i, step in enumerate(error.resolution_steps)
+    )
+    if error.escalation_note:
+        lines.extend(["", get_tone_template(tone_profile, "note").format(
+            note=error.escalation_note,
+        )])
+    return "\n".join(lines)
+
+
+def get_template_stats() -> dict:
+    """템플릿 응답 적중률 반환 (LLM 호출 회피 비율)"""
+    total = _template_stats["total"]
     return {
-        "answer": answer,
-        "error_code": error_code,
-        "support_level": support_level,
-        "image_urls": image_urls,
+        **_template_stats,
+        "hit_rate": _template_stats["template"] / total if total else 0.0,
     }
 
 
@@ -151,6 +265,11 @@ def _extract_error_code(message: str) -> str | None:
     return None
 
 
+def _has_multiple_error_codes(message: str) -> bool:
+    """서로 다른 에러 코드가 2개 이상 언급되었는지 확인한다 (템플릿 응답 제외 대상)."""
+    return len({code.upper() for code in re.findall(r'[Ee]\d{3}', message)}) > 1
+
+
 def _is_escalation(message: str) -> bool:
     """에스컬레이션 키워드를 감지한다."""
     return any(keyword in message for keyword in ESCALATION_KEYWORDS)
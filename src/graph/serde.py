@@ -0,0 +1,145 @@
+"""체크포인트 직렬화기 — msgpack + zstd(학습 사전) 압축
+
+LangGraph 기본 직렬화기(JsonPlusSerializer, LangChain 메시지 등을 msgpack으로 인코딩)의
+출력을 zstd로 압축한다. InBody 답변/매뉴얼 발췌로 학습한 사전을 쓰면
+짧은 체크포인트도 반복되는 문구(전극, 측정, 에러 코드 안내 등)가 크게 줄어든다.
+
+압축된 값은 타입 태그에 "+zstd"를 붙여 저장하므로 압축을 끄거나 켜도
+기존 체크포인트를 그대로 읽을 수 있다. zstandard 패키지가 없으면 압축 없이 동작한다.
+
+사전 학습: python scripts/train_checkpoint_dict.py
+"""
+
+import logging
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+logger = logging.getLogger(__name__)
+
+ZSTD_SUFFIX = "+zstd"
+
+# 이보다 작은 값(채널 버전, 짧은 플래그 등)은 압축 이득보다 헤더 비용이 커서 그대로 저장
+MIN_COMPRESS_BYTES = 64
+
+# 학습 사전 크기 — 체크포인트 1개보다 작게 유지
+DEFAULT_DICT_SIZE = 16 * 1024
+
+
+def _import_zstd():
+    """zstandard 모듈 반환 (미설치면 None)"""
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+class ZstdSerializer(SerializerProtocol):
+    """기본 직렬화기 출력에 zstd 압축을 씌우는 체크포인트 직렬화기
+
+    Args:
+        inner: 실제 인코딩을 맡는 직렬화기 (None이면 JsonPlusSerializer)
+        level: zstd 압축 레벨 (1~22, 기본 3)
+        dict_path: 학습된 zstd 사전 파일 (없으면 사전 없이 압축)
+    """
+
+    def __init__(
+        self,
+        inner: SerializerProtocol | None = None,
+        level: int = 3,
+        dict_path: str | Path | None = None,
+    ) -> None:
+        self.inner = inner or JsonPlusSerializer()
+        self.level = level
+        self._zstd = _import_zstd()
+        self._dict = None
+        # 압축/해제 컨텍스트는 스레드 간 공유 불가 → 스레드별 생성
+        self._local = threading.local()
+
+        if self._zstd is None:
+            logger.warning("zstandard 패키지가 없어 체크포인트를 압축하지 않습니다")
+            return
+        if dict_path and Path(dict_path).exists():
+            self._dict = self._zstd.ZstdCompressionDict(Path(dict_path).read_bytes())
+            logger.info("체크포인트 zstd 사전 로드: %s (id=%d)", dict_path, self._dict.dict_id())
+        elif dict_path:
+            logger.info("zstd 사전 파일이 없어 사전 없이 압축합니다: %s", dict_path)
+
+    @property
+    def enabled(self) -> bool:
+        return self._zstd is not None
+
+    @property
+    def dict_id(self) -> int | None:
+        return self._dict.dict_id() if self._dict is not None else None
+
+    def _compressor(self):
+        if not hasattr(self._local, "compressor"):
+            kwargs = {"dict_data": self._dict} if self._dict is not None else {}
+            self._local.compressor = self._zstd.ZstdCompressor(level=self.level, **kwargs)
+        return self._local.compressor
+
+    def _decompressor(self):
+        if not hasattr(self._local, "decompressor"):
+            kwargs = {"dict_data": self._dict} if self._dict is not None else {}
+            self._local.decompressor = self._zstd.ZstdDecompressor(**kwargs)
+        return self._local.decompressor
+
+    # ── SerializerProtocol ──
+
+    def dumps(self, obj: Any) -> bytes:
+        return self.inner.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self.inner.loads(data)
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        type_, data = self.inner.dumps_typed(obj)
+        if self._zstd is None or len(data) < MIN_COMPRESS_BYTES:
+            return type_, data
+        return type_ + ZSTD_SUFFIX, self._compressor().compress(data)
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        type_, payload = data
+        if not type_.endswith(ZSTD_SUFFIX):
+            return self.inner.loads_typed((type_, payload))
+
+        if self._zstd is None:
+            raise RuntimeError(
+                "zstd로 압축된 체크포인트를 읽으려면 zstandard 패키지가 필요합니다"
+            )
+        try:
+            raw = self._decompressor().decompress(payload)
+        except self._zstd.ZstdError as e:
+            raise RuntimeError(
+                f"체크포인트 압축 해제 실패 (사전 id={self.dict_id}): {e}. "
+                "압축 당시와 같은 사전 파일이 필요합니다"
+            ) from e
+        return self.inner.loads_typed((type_[: -len(ZSTD_SUFFIX)], raw))
+
+
+def train_dictionary(samples: Iterable[bytes], size: int = DEFAULT_DICT_SIZE) -> bytes:
+    """직렬화된 체크포인트 샘플로 zstd 사전을 학습해 바이트로 반환한다.
+
+    Raises:
+        RuntimeError: zstandard 패키지가 없을 때
+    """
+    zstd = _import_zstd()
+    if zstd is None:
+        raise RuntimeError("사전 학습에는 zstandard 패키지가 필요합니다 (pip install zstandard)")
+    return zstd.train_dictionary(size, list(samples)).as_bytes()
+
+
+def create_serializer(settings) -> SerializerProtocol | None:
+    """설정에 따른 체크포인트 직렬화기 (압축 비활성화면 None → LangGraph 기본값)"""
+    if not settings.checkpoint_compression_enabled:
+        return None
+    return ZstdSerializer(
+        level=settings.checkpoint_zstd_level,
+        dict_path=settings.checkpoint_zstd_dict_path or None,
+    )
@@ -0,0 +1,150 @@
+"""세션/캐시 스냅샷 — 예약 정지(EC2 야간 정지) 후 웜 재시작
+
+종료 시(lifespan) memory 체크포인터의 live 세션과 가드레일 검증 캐시를
+data/ 아래 파일 1개로 저장하고, 시작 시 읽어 둔다.
+세션은 복원 대기열에만 올려 두었다가 해당 스레드의 첫 요청에서 복원한다.
+
+- sqlite/postgres 체크포인터의 세션과 임베딩 캐시(SQLite 영속 계층)는
+  이미 디스크에 있으므로 스냅샷 대상이 아니다.
+- 다중 워커는 같은 파일에 파일 잠금을 걸고 병합 저장한다.
+- 파일은 체크포인터 직렬화기(zstd 압축 포함)로 인코딩한다.
+"""
+
+import logging
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from src.config import settings
+from src.graph.nodes.guardrail import export_verdict_cache, import_verdict_cache
+from src.graph.workflow import get_checkpointer
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+# 이 시각 이후에 저장된 스냅샷 = 같은 종료 과정의 다른 워커가 저장한 것 (병합 대상)
+_PROCESS_STARTED = time.time()
+
+
+def _memory_saver():
+    """스냅샷 대상 체크포인터 (세션 내보내기를 지원하는 memory 백엔드만)"""
+    saver = get_checkpointer()
+    saver = getattr(saver, "inner", saver)
+    return saver if hasattr(saver, "export_sessions") else None
+
+
+@contextmanager
+def _file_lock(path: Path):
+    """워커 간 스냅샷 파일 잠금 (fcntl 미지원 플랫폼은 잠금 없이 진행)"""
+    try:
+        import fcntl
+    except ImportError:
+        yield
+        return
+    with open(path.with_suffix(path.suffix + ".lock"), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _read(path: Path, serde) -> dict | None:
+    """스냅샷 파일을 읽는다 (없거나 손상/호환 불가면 None)."""
+    if not path.exists():
+        return None
+    try:
+        type_, _, payload = path.read_bytes().partition(b"\n")
+        snapshot = serde.loads_typed((type_.decode(), payload))
+    except (OSError, ValueError, TypeError, RuntimeError) as e:
+        # ValueError: 디코딩/msgpack 손상, RuntimeError: zstd 압축 해제 실패
+        logger.warning("스냅샷 파일을 읽을 수 없어 무시합니다: %s (%s)", path, e)
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        logger.warning("스냅샷 버전 불일치로 무시합니다: %s", path)
+        return None
+    return snapshot
+
+
+def save_snapshot(path: str | Path | None = None) -> dict:
+    """live 세션과 가드레일 검증 캐시를 스냅샷 파일로 저장한다.
+
+    Returns:
+        저장 결과 (세션 수, 캐시 항목 수, 파일 크기)
+    """
+    path = Path(path or settings.session_snapshot_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    saver = _memory_saver()
+    serde = get_checkpointer().serde
+
+    with _file_lock(path):
+        sessions = saver.export_sessions() if saver is not None else {}
+        verdicts = export_verdict_cache()
+
+        previous = _read(path, serde)
+        if previous and previous.get("created_at", 0) >= _PROCESS_STARTED:
+            # 먼저 종료한 다른 워커의 스냅샷과 병합
+            sessions = {**previous.get("sessions", {}), **sessions}
+            verdicts = [*previous.get("guardrail_verdicts", []), *verdicts]
+
+        type_, payload = serde.dumps_typed({
+            "version": SNAPSHOT_VERSION,
+            "created_at": time.time(),
+            "sessions": sessions,
+            "guardrail_verdicts": verdicts[-settings.guardrail_cache_size:],
+        })
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_bytes(type_.encode() + b"\n" + payload)
+        os.replace(tmp, path)
+
+    result = {
+        "sessions": len(sessions),
+        "guardrail_verdicts": min(len(verdicts), settings.guardrail_cache_size),
+        "bytes": path.stat().st_size,
+    }
+    logger.info(
+        "스냅샷 저장: 세션 %d개, 검증 캐시 %d개, %dB",
+        result["sessions"],
+        result["guardrail_verdicts"],
+        result["bytes"],
+    )
+    return result
+
+
+def load_snapshot(path: str | Path | None = None) -> dict | None:
+    """스냅샷을 읽어 검증 캐시를 채우고 세션을 복원 대기열에 등록한다.
+
+    settings.session_snapshot_max_age_hours보다 오래된 스냅샷은 무시한다.
+
+    Returns:
+        복원 결과 (대기 세션 수, 캐시 항목 수, 스냅샷 경과 시간) 또는 None
+    """
+    path = Path(path or settings.session_snapshot_path)
+    snapshot = _read(path, get_checkpointer().serde)
+    if snapshot is None:
+        return None
+
+    age_hours = (time.time() - snapshot.get("created_at", 0)) / 3600
+    if age_hours > settings.session_snapshot_max_age_hours:
+        logger.info("스냅샷이 오래되어 무시합니다 (%.1f시간 경과)", age_hours)
+        return None
+
+    # 복원되지 않은 채 스냅샷을 거듭 넘어온 세션도 최초 저장 시각 기준으로 만료
+    deadline = time.time() - settings.session_snapshot_max_age_hours * 3600
+    live = {
+        thread_id: entry
+        for thread_id, entry in snapshot.get("sessions", {}).items()
+        if entry[2] >= deadline
+    }
+    saver = _memory_saver()
+    sessions = saver.restore_sessions(live) if saver is not None else 0
+    verdicts = import_verdict_cache(snapshot.get("guardrail_verdicts", []))
+    logger.info(
+        "스냅샷 로드: 세션 %d개 복원 대기, 검증 캐시 %d개 (%.1f시간 전 저장)",
+        sessions,
+        verdicts,
+        age_hours,
+    )
+    return {"sessions": sessions, "guardrail_verdicts": verdicts, "age_hours": age_hours}
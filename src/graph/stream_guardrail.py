@@ -0,0 +1,120 @@
+"""스트리밍 가드레일 — 생성 중인 토큰에 결정론적 검사를 점진 적용
+
+/chat/stream에서 에이전트 토큰을 클라이언트로 보내기 전에
+기종 격리 / Level 3 위험 키워드 검사를 슬라이딩 윈도우로 수행한다.
+검사를 통과한 구간만 내보내고, 패턴이 걸칠 수 있는 꼬리 구간은 보류한다.
+면책 문구는 최종 가드레일 노드가 삽입하며 done 이벤트로 전달된다.
+
+LLM이 고정 안내 문구(HARDWARE_DISCLAIMER 등)를 직접 쓰는 경우, 문구 자체에 위험
+키워드("내부 부품")가 있으므로 문구가 끝까지 도착할 때까지 검사·전송을 보류하고
+완성된 문구는 검사 구간에서 제외한다.
+"""
+
+from src.graph.nodes.guardrail import FIXED_NOTICES, find_other_models, find_unsafe_repair
+
+# 보류 구간 길이 — 가장 긴 검사 패턴("InBody  770S" 등)보다 넉넉하게
+STREAM_WINDOW_CHARS = 32
+
+# 최종 응답을 생성하는 노드 (라우터/가드레일 LLM 토큰은 클라이언트로 보내지 않음)
+ANSWER_NODES = {
+    "troubleshoot_agent", "install_agent", "connect_agent",
+    "clinical_agent", "placeholder_agent", "fix_response",
+}
+
+_stream_stats = {"streams": 0, "cutoffs": 0, "chars_flushed": 0, "chars_withheld": 0}
+
+
+def _pending_notice_len(text: str) -> int:
+    """text 끝이 고정 안내 문구의 앞부분이면 그 길이 (아직 문구 전체가 도착하지 않음)"""
+    pending = 0
+    for notice in FIXED_NOTICES:
+        tail = text[-(len(notice) - 1):]
+        idx = tail.find(notice[0])
+        while idx != -1:
+            if notice.startswith(tail[idx:]):
+                pending = max(pending, len(tail) - idx)
+                break
+            idx = tail.find(notice[0], idx + 1)
+    return pending
+
+
+def _notice_start(text: str, pos: int) -> int:
+    """pos가 완성된 고정 안내 문구 내부이면 문구 시작 위치, 아니면 pos"""
+    for notice in FIXED_NOTICES:
+        start = text.find(notice, max(0, pos - len(notice) + 1))
+        if start != -1 and start < pos:
+            pos = start
+    return pos
+
+
+class StreamGuardrail:
+    """단일 LLM 응답 스트림에 대한 점진 검증기"""
+
+    def __init__(self, identified_model: str | None, support_level: str | None):
+        self.identified_model = identified_model
+        self.support_level = support_level
+        self.text = ""
+        self.flushed = 0
+        self.violations: list[str] = []
+        _stream_stats["streams"] += 1
+
+    def _check(self, segment: str) -> list[str]:
+        """구간에서 hard-fail 위반 목록 반환"""
+        violations = []
+        if self.identified_model:
+            violations.extend(
+                f"기종 격리 위반: {other} 기종 정보가 응답에 포함됨"
+                for other in find_other_models(segment, self.identified_model)
+            )
+        if self.support_level == "level_3":
+            keyword = find_unsafe_repair(segment)
+            if keyword:
+                violations.append(
+                    f"Level 3 안전 위반: '{keyword}' — 사용자 직접 수리 안내 감지"
+                )
+        return violations
+
+    def feed(self, token: str) -> str:
+        """토큰을 추가하고 검증된 구간을 반환한다.
+
+        Returns:
+            클라이언트로 내보낼 검증 완료 텍스트 (위반 시 빈 문자열, violations 설정)
+        """
+        self.text += token
+        # 도착 중인 고정 안내 문구는 완성될 때까지 검사/전송 보류
+        checked_end = len(self.text) - _pending_notice_len(self.text)
+        if not self._scan(checked_end):
+            return ""
+        safe_end = min(len(self.text) - STREAM_WINDOW_CHARS, checked_end)
+        if safe_end <= self.flushed:
+            return ""
+        segment = self.text[self.flushed:safe_end]
+        self.flushed = safe_end
+        _stream_stats["chars_flushed"] += len(segment)
+        return segment
+
+    def _scan(self, end: int) -> bool:
+        """text[..end]의 미검사 구간을 검사한다. 위반이면 violations를 설정하고 False."""
+        # 이미 내보낸 구간의 꼬리와 겹치게 검사 → 토큰 경계에 걸친 패턴 포착
+        # (겹침 시작점이 완성된 안내 문구 중간이면 문구 전체가 들어가도록 앞당김)
+        scan_from = _notice_start(self.text, max(0, self.flushed - STREAM_WINDOW_CHARS))
+        self.violations = self._check(self.text[scan_from:end])
+        if self.violations:
+            _stream_stats["cutoffs"] += 1
+            _stream_stats["chars_withheld"] += len(self.text) - self.flushed
+            return False
+        return True
+
+    def flush(self) -> str:
+        """스트림 종료 시 보류 구간을 검사 후 반환한다 (위반이면 빈 문자열, violations 설정)."""
+        if self.violations or not self._scan(len(self.text)):
+            return ""
+        segment = self.text[self.flushed:]
+        self.flushed = len(self.text)
+        _stream_stats["chars_flushed"] += len(segment)
+        return segment
+
+
+def get_stream_guardrail_stats() -> dict:
+    """스트리밍 가드레일 통계 반환 (생성 중단 횟수, 보류/전송 문자 수)"""
+    return dict(_stream_stats)
@@ -1,56 +1,164 @@
 """LangGraph 워크플로우 정의 — T029, T045, T048, T052, T055, T057, T058, T062
 
 START → model_router → [조건부 엣지]
-                          ├── identified → intent_router → [조건부 엣지]
-                          │                                  ├── troubleshoot → troubleshoot_agent ─┐
-                          │                                  ├── install → install_agent ────────────┤
-                          │                                  ├── connect → connect_agent ────────────┤
-                          │                                  ├── clinical → clinical_agent ──────────┤
-                          │                                  └── 그 외 → placeholder_agent ──────────┤
-                          │                                                                         ▼
-                          │                                                                    guardrail
-                          │                                                                    ├── 통과 → END
-                          │                                                                    └── 실패 → fix_response → guardrail (최대 2회)
-                          └── unidentified/unsupported → END (answer 이미 설정됨)
+  ├── identified → intent_router → [조건부 엣지]
+  │     ├── troubleshoot → troubleshoot_agent ─┐
+  │     ├── install → install_agent ───────────┤
+  │     ├── connect → connect_agent ───────────┤
+  │     ├── clinical → clinical_agent ─────────┤
+  │     └── 그 외 → placeholder_agent ─────────┤
+  │                                            ▼
+  │                                        guardrail
+  │                                        ├── 통과 → memory → END
+  │                                        └── 실패 → fix_response → guardrail (최대 2회)
+  └── unidentified/unsupported → memory → END (answer 이미 설정됨)
+
+memory 노드는 모든 경로의 마지막에 응답을 이력에 기록하고 오래된 턴을 요약으로 접는다.
+
+settings.combined_router_enabled=True면 model_router + intent_router 대신
+router(combined_router_node) 1개 노드가 기종과 의도를 함께 식별한다.
 """
 
-from langgraph.checkpoint.memory import MemorySaver
+import logging
+import time
+from contextlib import AsyncExitStack
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import END, StateGraph
 
+from src.config import settings
+from src.graph.checkpointer import (
+    CompactingCheckpointSaver,
+    create_checkpointer,
+    get_saver_stats,
+    open_postgres_checkpointer,
+)
 from src.graph.edges import (
+    route_after_combined_router,
     route_after_guardrail,
     route_after_intent_router,
     route_after_model_router,
 )
 from src.graph.nodes.clinical_agent import clinical_agent_node
+from src.graph.nodes.combined_router import combined_router_node
 from src.graph.nodes.connect_agent import connect_agent_node
 from src.graph.nodes.guardrail import fix_response_node, guardrail_node
 from src.graph.nodes.install_agent import install_agent_node
 from src.graph.nodes.intent_router import intent_router_node
+from src.graph.nodes.memory import memory_node
 from src.graph.nodes.model_router import model_router_node
 from src.graph.nodes.placeholder_agent import placeholder_agent_node
 from src.graph.nodes.troubleshoot_agent import troubleshoot_agent_node
 from src.models.state import AgentState
 
-# 체크포인터 싱글톤 (T062)
-_checkpointer: MemorySaver | None = None
+logger = logging.getLogger(__name__)
+
+# 턴 경계 채널 — memory 노드(모든 경로의 마지막)가 매 턴 갱신한다
+TURN_BOUNDARY_CHANNELS = ("history_bytes",)
+
+# 체크포인터 싱글톤 (T062) — settings.checkpointer_backend로 선택
+_checkpointer: BaseCheckpointSaver | None = None
+_checkpointer_stack: AsyncExitStack | None = None
+
+# 컴파일된 그래프 레지스트리 — 프로세스당 1회 컴파일 후 모든 요청에서 재사용
+_compiled_workflow = None
+_compile_time_ms: float | None = None
+
+
+def _with_compaction(saver: BaseCheckpointSaver) -> BaseCheckpointSaver:
+    """설정 시 턴 경계 체크포인트만 저장하도록 감싼다."""
+    if not settings.checkpoint_compaction_enabled:
+        return saver
+    return CompactingCheckpointSaver(saver, TURN_BOUNDARY_CHANNELS)
 
 
-def get_checkpointer() -> MemorySaver:
-    """InMemorySaver 체크포인터 싱글톤을 반환한다."""
+def get_checkpointer() -> BaseCheckpointSaver:
+    """체크포인터 싱글톤을 반환한다 (memory / sqlite는 최초 호출 시 생성)."""
     global _checkpointer
     if _checkpointer is None:
-        _checkpointer = MemorySaver()
+        _checkpointer = _with_compaction(create_checkpointer(settings))
     return _checkpointer
 
 
+async def open_checkpointer() -> BaseCheckpointSaver:
+    """앱 시작 시 체크포인터를 준비한다.
+
+    postgres는 여기서 연결을 열고, memory는 만료 세션 스위퍼를 시작한다.
+    """
+    global _checkpointer, _checkpointer_stack
+    if _checkpointer is None and settings.checkpointer_backend == "postgres":
+        _checkpointer_stack = AsyncExitStack()
+        _checkpointer = _with_compaction(
+            await open_postgres_checkpointer(settings, _checkpointer_stack)
+        )
+    checkpointer = get_checkpointer()
+    if hasattr(checkpointer, "start_sweeper"):
+        checkpointer.start_sweeper()
+    return checkpointer
+
+
+async def close_checkpointer() -> None:
+    """앱 종료 시 대기 중인 쓰기를 커밋하고 연결을 닫는다.
+
+    닫힌 체크포인터에 묶인 컴파일 워크플로우도 함께 버려, 다음 사용 시
+    새 체크포인터로 다시 컴파일되게 한다.
+    """
+    global _checkpointer, _checkpointer_stack, _compiled_workflow, _compile_time_ms
+    if _checkpointer is not None and hasattr(_checkpointer, "aclose"):
+        await _checkpointer.aclose()
+    if _checkpointer_stack is not None:
+        await _checkpointer_stack.aclose()
+        _checkpointer_stack = None
+    _checkpointer = None
+    _compiled_workflow = None
+    _compile_time_ms = None
+
+
+def get_checkpointer_stats() -> dict:
+    """체크포인터 백엔드/쓰기 통계 반환"""
+    if _checkpointer is None:
+        return {"backend": settings.checkpointer_backend, "initialized": False}
+    return get_saver_stats(_checkpointer)
+
+
 def create_workflow() -> StateGraph:
     """LangGraph StateGraph를 생성한다."""
     workflow = StateGraph(AgentState)
 
-    # 노드 등록
-    workflow.add_node("model_router", model_router_node)
-    workflow.add_node("intent_router", intent_router_node)
+    agent_routes = {
+        "troubleshoot_agent": "troubleshoot_agent",
+        "install_agent": "install_agent",
+        "connect_agent": "connect_agent",
+        "clinical_agent": "clinical_agent",
+        "placeholder_agent": "placeholder_agent",
+    }
+
+    # 라우터 노드 등록 + 엣지 설정
+    if settings.combined_router_enabled:
+        # 기종+의도 1회 호출 통합 라우터
+        workflow.add_node("router", combined_router_node)
+        workflow.set_entry_point("router")
+        workflow.add_conditional_edges(
+            "router",
+            route_after_combined_router,
+            {**agent_routes, "__end__": "memory"},
+        )
+    else:
+        workflow.add_node("model_router", model_router_node)
+        workflow.add_node("intent_router", intent_router_node)
+        workflow.set_entry_point("model_router")
+        workflow.add_conditional_edges(
+            "model_router",
+            route_after_model_router,
+            {"intent_router": "intent_router", "__end__": "memory"},
+        )
+        workflow.add_conditional_edges(
+            "intent_router",
+            route_after_intent_router,
+            agent_routes,
+        )
+
+    # 에이전트 노드 등록
     workflow.add_node("placeholder_agent", placeholder_agent_node)
     workflow.add_node("troubleshoot_agent", troubleshoot_agent_node)
     workflow.add_node("install_agent", install_agent_node)
@@ -58,27 +166,7 @@ def create_workflow() -> StateGraph:
     workflow.add_node("clinical_agent", clinical_agent_node)
     workflow.add_node("guardrail", guardrail_node)
     workflow.add_node("fix_response", fix_response_node)
-
-    # 엣지 설정
-    workflow.set_entry_point("model_router")
-
-    workflow.add_conditional_edges(
-        "model_router",
-        route_after_model_router,
-        {"intent_router": "intent_router", "__end__": END},
-    )
-
-    workflow.add_conditional_edges(
-        "intent_router",
-        route_after_intent_router,
-        {
-            "troubleshoot_agent": "troubleshoot_agent",
-            "install_agent": "install_agent",
-            "connect_agent": "connect_agent",
-            "clinical_agent": "clinical_agent",
-            "placeholder_agent": "placeholder_agent",
-        },
-    )
+    workflow.add_node("memory", memory_node)
 
     # 모든 에이전트 → guardrail
     workflow.add_edge("troubleshoot_agent", "guardrail")
@@ -91,16 +179,42 @@ def create_workflow() -> StateGraph:
     workflow.add_conditional_edges(
         "guardrail",
         route_after_guardrail,
-        {"__end__": END, "fix_response": "fix_response"},
+        {"__end__": "memory", "fix_response": "fix_response"},
     )
 
     # fix_response → guardrail (재검증 루프)
     workflow.add_edge("fix_response", "guardrail")
 
+    # 턴 종료: 대화 이력 기록 + 압축
+    workflow.add_edge("memory", END)
+
     return workflow
 
 
+def compile_workflow() -> float:
+    """워크플로우를 컴파일하여 레지스트리에 등록하고 소요 시간(ms)을 반환한다.
+
+    앱 시작 시(lifespan) 1회 호출된다. 재호출하면 그래프를 다시 컴파일한다.
+    """
+    global _compiled_workflow, _compile_time_ms
+    started = time.perf_counter()
+    _compiled_workflow = create_workflow().compile(checkpointer=get_checkpointer())
+    _compile_time_ms = (time.perf_counter() - started) * 1000
+    logger.debug("워크플로우 컴파일 완료: %.2fms", _compile_time_ms)
+    return _compile_time_ms
+
+
+def get_compile_time_ms() -> float | None:
+    """마지막 컴파일 소요 시간(ms)을 반환한다. 미컴파일 상태면 None."""
+    return _compile_time_ms
+
+
 def get_compiled_workflow():
-    """체크포인터가 연결된 컴파일된 워크플로우를 반환한다."""
-    checkpointer = get_checkpointer()
-    return create_workflow().compile(checkpointer=checkpointer)
+    """체크포인터가 연결된 컴파일된 워크플로우를 반환한다.
+
+    레지스트리에 등록된 그래프를 재사용하며, 아직 컴파일되지 않았으면
+    (lifespan 외부 호출 등) 이 시점에 1회 컴파일한다.
+    """
+    if _compiled_workflow is None:
+        compile_workflow()
+    return _compiled_workflow
@@ -27,8 +27,66 @@ async def lifespan(app: FastAPI):
     except Exception:
         logger.exception("DB 초기화 실패")
 
+    # 시작: 체크포인터 준비 (postgres는 연결 풀 오픈)
+    try:
+        from src.graph.workflow import open_checkpointer
+
+        checkpointer = await open_checkpointer()
+        logger.info("체크포인터 준비 완료: %s", type(checkpointer).__name__)
+    except Exception:
+        logger.exception("체크포인터 초기화 실패")
+
+    # 시작: 이전 종료 시 저장한 세션/캐시 스냅샷 로드 (세션은 첫 요청 시 복원)
+    if settings.session_snapshot_enabled:
+        try:
+            from src.graph.snapshot import load_snapshot
+
+            load_snapshot()
+        except Exception:
+            logger.exception("스냅샷 로드 실패")
+
+    # 시작: 토큰 예산용 tiktoken 인코더 예열 (최초 BPE 다운로드를 요청 경로에서 제외)
+    from src.graph.context_budget import warm_encoder
+
+    if await warm_encoder():
+        logger.info("tiktoken 인코더 로드 완료")
+
+    # 시작: LangGraph 워크플로우 1회 컴파일 (요청마다 재컴파일 방지)
+    try:
+        from src.graph.workflow import compile_workflow
+
+        compile_ms = compile_workflow()
+        logger.info("워크플로우 컴파일 완료: %.2fms (요청마다 재사용)", compile_ms)
+    except Exception:
+        logger.exception("워크플로우 컴파일 실패")
+
     yield
 
+    # 종료: 공유 LLM HTTP 커넥션 풀 정리
+    try:
+        from src.graph.llm import close_llm_clients
+
+        await close_llm_clients()
+    except Exception:
+        logger.exception("LLM 클라이언트 종료 실패")
+
+    # 종료: live 세션/캐시 스냅샷 저장 (체크포인터 종료 전)
+    if settings.session_snapshot_enabled:
+        try:
+            from src.graph.snapshot import save_snapshot
+
+            save_snapshot()
+        except Exception:
+            logger.exception("스냅샷 저장 실패")
+
+    # 종료: 대기 중인 체크포인트 쓰기 커밋 + 연결 종료
+    try:
+        from src.graph.workflow import close_checkpointer
+
+        await close_checkpointer()
+    except Exception:
+        logger.exception("체크포인터 종료 실패")
+
     # 종료: DB 엔진 정리
     try:
         from src.db.database import engine
@@ -59,6 +117,7 @@ app.add_middleware(
 from src.api.chat import router as chat_router  # noqa: E402
 from src.api.errors import router as errors_router  # noqa: E402
 from src.api.health import router as health_router  # noqa: E402
+from src.api.metrics import router as metrics_router
 from src.api.models_api import router as models_router  # noqa: E402
 from src.api.peripherals import router as peripherals_router  # noqa: E402
 from src.api.sessions import router as sessions_router  # noqa: E402
@@ -66,6 +125,7 @@ from src.api.sessions import router as sessions_router  # noqa: E402
 app.include_router(chat_router)
 app.include_router(errors_router)
 app.include_router(health_router)
+app.include_router(metrics_router)
 app.include_router(models_router)
 app.include_router(peripherals_router)
 app.include_router(sessions_router)
@@ -14,7 +14,11 @@ class AgentState(TypedDict):
     """
 
     # 대화 이력 (add_messages 리듀서: 체크포인터에서 대화 이력 누적)
+    # memory 노드가 턴 종료 시 최근 N턴만 남기고 나머지는 conversation_summary로 접는다
     messages: Annotated[list[BaseMessage], add_messages]
+    conversation_summary: str
+    history_bytes: int  # 메모리 관리 없이 누적됐을 대화 크기 (측정용)
+    turn_count: int  # 세션 누적 사용자 메시지 수 (요약으로 접힌 턴 포함)
 
     # 기종 식별 결과
     identified_model: str | None  # "270S" | "580" | "770S" | "970S" | None
@@ -37,6 +41,7 @@ class AgentState(TypedDict):
     # 안전 검증
     needs_disclaimer: bool
     answer: str | None
+    answer_source: str | None  # "template" | "placeholder" | "llm" (가드레일 신뢰 등급)
     guardrail_passed: bool | None
     guardrail_retry_count: int
     guardrail_violations: list[str]
@@ -27,6 +27,21 @@ INTENT_ROUTER_PROMPT = (
     '{{"intent": "<의도>", "confidence": <0.0~1.0>}}'
 )
 
+ROUTER_PROMPT = (
+    "당신은 InBody 기술 지원 요청을 분류하는 전문가입니다.\n\n"
+    "사용자의 메시지에서 InBody 기종과 요청 의도를 함께 식별하세요.\n\n"
+    "기종 (model):\n"
+    "- 지원 기종: 270S, 580, 770S, 970S\n"
+    "- 기종이 명확하지 않으면 \"unidentified\"\n"
+    "- 지원하지 않는 기종(예: 230, 370, 720 등)이 언급되면 \"unsupported\"\n\n"
+    "의도 (intent):\n"
+    "- install: 기기 설치, 조립, 초기 설정 관련 질문\n"
+    "- connect: 주변기기 연결, PC/프린터/바코드 리더기 연동 관련 질문\n"
+    "- troubleshoot: 에러 코드, 오작동, 고장, 수리 관련 질문\n"
+    "- clinical: 측정 결과 해석, 체성분 수치 의미, 의학적 질문\n"
+    "- general: 위 카테고리에 해당하지 않는 일반 질문"
+)
+
 INSTALL_AGENT_PROMPT = (
     "당신은 InBody {model} 기종의 설치 전문 도우미입니다.\n\n"
     "{tone_instruction}\n\n"
@@ -80,7 +95,8 @@ CLINICAL_AGENT_PROMPT = (
     "규칙:\n"
     "1. 측정 결과에 영향을 미치는 생리학적 변수를 설명하세요 (식사, 운동, 수분, 체위 등).\n"
     "2. 의학적 진단은 절대 하지 마세요.\n"
-    "3. 특정 질환에 대한 질문에는 의학적 진단 불가를 명확히 안내하고 전문 의료인 상담을 권고하세요.\n"
+    "3. 특정 질환에 대한 질문에는 의학적 진단 불가를 명확히 안내하고 "
+    "전문 의료인 상담을 권고하세요.\n"
     "4. 모든 응답 끝에 반드시 의학적 면책 문구를 포함하세요.\n"
     "5. 다른 기종의 측정 항목이나 수치를 절대 혼합하지 마세요.\n\n"
     "참고 자료:\n{context}"
@@ -12,6 +12,17 @@ TONE_PROFILES: dict[str, dict[str, str]] = {
             "- 사용자가 기술에 익숙하지 않다고 가정하세요.\n"
             '- "~합니다", "~해 주세요" 등 정중하면서도 친근한 어투를 사용하세요.'
         ),
+        # 에러 코드 정확 일치 시 결정론적 응답 템플릿 (LLM 미호출)
+        "error_code_header": (
+            "InBody {model} 화면의 {code} 코드는 '{title}' 안내예요.\n\n원인: {cause}"
+        ),
+        "level_1_steps": "아래 순서대로 차근차근 진행해 주세요.",
+        "level_3_steps": (
+            "이 문제는 사용자가 직접 해결하기 어려워 서비스 센터 점검이 필요해요.\n"
+            "점검 전까지 아래 조치만 진행해 주세요."
+        ),
+        "step": "{index}단계. {step}",
+        "note": "참고: {note}",
     },
     "professional": {
         "name": "전문가용 톤",
@@ -24,6 +35,15 @@ TONE_PROFILES: dict[str, dict[str, str]] = {
             "- 체계적이고 논리적인 구조로 답변을 구성하세요.\n"
             '- "~합니다" 등 격식체를 사용하세요.'
         ),
+        # 에러 코드 정확 일치 시 결정론적 응답 템플릿 (LLM 미호출)
+        "error_code_header": "[{code}] {title} — InBody {model}\n\n- 원인: {cause}",
+        "level_1_steps": "- 지원 수준: 사용자 조치 가능 (Level 1)\n\n조치 절차:",
+        "level_3_steps": (
+            "- 지원 수준: 서비스 센터 이관 (Level 3)\n\n"
+            "공인 서비스 센터 점검 전 허용되는 조치:"
+        ),
+        "step": "{index}. {step}",
+        "note": "비고: {note}",
     },
 }
 
@@ -37,3 +57,9 @@ def get_tone_instruction(tone_profile: str) -> str:
             f"지원: {list(TONE_PROFILES.keys())}"
         )
     return profile["instruction"]
+
+
+def get_tone_template(tone_profile: str, key: str) -> str:
+    """톤 프로파일의 결정론적 응답 템플릿 반환 (없으면 casual 템플릿)"""
+    profile = TONE_PROFILES.get(tone_profile, TONE_PROFILES["casual"])
+    return profile[key]
@@ -0,0 +1,179 @@
+"""질의 임베딩 캐시 — 메모리 LRU + SQLite 영속 2계층
+
+동일 질의("전원이 안 켜져요", "E001" 등)의 임베딩 API 호출을 제거한다.
+SQLite 계층은 data/ 볼륨에 저장되어 EC2 야간 정지/시작 후에도 유지된다.
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import unicodedata
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(text: str) -> str:
+    """캐시 키용 질의 정규화 — 유니코드 NFKC, 공백 압축, 소문자화"""
+    text = unicodedata.normalize("NFKC", text)
+    return _WHITESPACE.sub(" ", text).strip().lower()
+
+
+class CachedEmbeddings(Embeddings):
+    """질의 임베딩 결과를 캐시하는 임베딩 래퍼
+
+    캐시 키는 (임베딩 모델명, 정규화된 질의 텍스트)이다.
+    벡터는 계층과 무관하게 float32 정밀도로 저장·반환한다.
+    문서 임베딩(embed_documents)은 캐시 없이 그대로 위임한다.
+
+    Args:
+        embeddings: 실제 임베딩 백엔드
+        model_name: 임베딩 모델명 (캐시 키에 포함)
+        max_size: 메모리 LRU 최대 항목 수
+        persist_path: SQLite 파일 경로 (빈 문자열이면 영속 계층 비활성화)
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        model_name: str,
+        max_size: int = 2048,
+        persist_path: str | Path = "",
+    ):
+        self.embeddings = embeddings
+        self.model_name = model_name
+        self.max_size = max_size
+        self._memory: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        self._conn: sqlite3.Connection | None = None
+        if persist_path:
+            self._conn = self._open_store(Path(persist_path))
+
+    @staticmethod
+    def _open_store(path: Path) -> sqlite3.Connection | None:
+        """SQLite 영속 계층을 연다. 실패 시 메모리 계층만 사용한다."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS query_embeddings "
+                "(key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            conn.commit()
+            return conn
+        except sqlite3.Error:
+            logger.warning("임베딩 캐시 DB 열기 실패 — 메모리 캐시만 사용: %s", path)
+            return None
+
+    def _key(self, text: str) -> str:
+        digest = hashlib.sha256(normalize_query(text).encode("utf-8")).hexdigest()
+        return f"{self.model_name}:{digest}"
+
+    @staticmethod
+    def _to_float32(vector: list[float]) -> list[float]:
+        """저장 정밀도(float32)로 맞춘다 — 메모리/디스크/신규 결과가 같은 값을 반환하도록"""
+        return array("f", vector).tolist()
+
+    def _memory_lookup(self, key: str) -> list[float] | None:
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+            return vector
+
+    def _disk_lookup(self, key: str) -> list[float] | None:
+        """SQLite 계층 조회 — 비동기 경로에서는 스레드에서 실행된다."""
+        vector = None
+        if self._conn is not None:
+            with self._db_lock:
+                row = self._conn.execute(
+                    "SELECT vector FROM query_embeddings WHERE key = ?", (key,)
+                ).fetchone()
+            if row is not None:
+                vector = array("f", row[0]).tolist()
+
+        with self._lock:
+            if vector is None:
+                self._stats["misses"] += 1
+            else:
+                self._remember(key, vector)
+                self._stats["disk_hits"] += 1
+        return vector
+
+    def _lookup(self, key: str) -> list[float] | None:
+        vector = self._memory_lookup(key)
+        return vector if vector is not None else self._disk_lookup(key)
+
+    def _store(self, key: str, vector: list[float]) -> None:
+        """메모리와 SQLite 계층에 저장 — 비동기 경로에서는 스레드에서 실행된다."""
+        with self._lock:
+            self._remember(key, vector)
+        if self._conn is None:
+            return
+        try:
+            with self._db_lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO query_embeddings (key, vector) VALUES (?, ?)",
+                    (key, array("f", vector).tobytes()),
+                )
+                self._conn.commit()
+        except sqlite3.Error:
+            logger.warning("임베딩 캐시 DB 쓰기 실패 — 메모리에만 저장")
+
+    def _remember(self, key: str, vector: list[float]) -> None:
+        """메모리 LRU에 저장 (락 보유 상태에서 호출)"""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self.embeddings.embed_documents(texts)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        return await self.embeddings.aembed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        key = self._key(text)
+        vector = self._lookup(key)
+        if vector is None:
+            vector = self._to_float32(self.embeddings.embed_query(text))
+            self._store(key, vector)
+        return vector
+
+    async def aembed_query(self, text: str) -> list[float]:
+        key = self._key(text)
+        vector = self._memory_lookup(key)
+        if vector is not None:
+            return vector
+
+        # SQLite 조회/쓰기는 동기 I/O → 이벤트 루프 밖에서 실행
+        vector = await asyncio.to_thread(self._disk_lookup, key)
+        if vector is None:
+            vector = self._to_float32(await self.embeddings.aembed_query(text))
+            await asyncio.to_thread(self._store, key, vector)
+        return vector
+
+    def stats(self) -> dict:
+        """캐시 적중 통계 반환"""
+        with self._lock:
+            hits = self._stats["memory_hits"] + self._stats["disk_hits"]
+            total = hits + self._stats["misses"]
+            return {
+                **self._stats,
+                "memory_size": len(self._memory),
+                "hit_rate": hits / total if total else 0.0,
+            }
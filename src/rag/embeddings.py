@@ -0,0 +1,184 @@
+"""임베딩 제공자 — Settings.embedding_provider로 선택
+
+- openai:  OpenAI 임베딩 API (운영 기본값)
+- hashing: 문자 n-gram 해싱 + 랜덤 프로젝션 NumPy 임베더 (네트워크 불필요, 결정론적)
+- replay:  녹화된 벡터 재생 (embedding_replay_record=True면 OpenAI 호출 결과를 녹화)
+
+hashing/replay는 네트워크가 없는 환경에서 인제스트·검색 처리량을 측정하기 위한 용도다.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from src.rag.embedding_cache import normalize_query
+from src.rag.lexical_index import tokenize
+
+logger = logging.getLogger(__name__)
+
+VALID_PROVIDERS = {"openai", "hashing", "replay"}
+
+
+class HashingEmbeddings(Embeddings):
+    """문자 n-gram 해싱 + 랜덤 프로젝션 임베더
+
+    각 토큰(BM25 색인과 동일한 한국어 bigram 토큰화)을 해시 시드로 생성한
+    가우시안 랜덤 벡터에 사상하고, 빈도 가중합을 L2 정규화한다.
+    토큰이 겹치는 텍스트일수록 코사인 유사도가 높아진다.
+
+    Args:
+        size: 임베딩 차원
+        seed: 토큰 벡터 생성 시드 (같은 시드면 같은 벡터)
+    """
+
+    def __init__(self, size: int = 1536, seed: int = 0):
+        self.size = size
+        self.seed = seed
+        self._token_vectors: dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def _token_vector(self, token: str) -> np.ndarray:
+        vector = self._token_vectors.get(token)
+        if vector is None:
+            digest = hashlib.blake2b(f"{self.seed}:{token}".encode(), digest_size=8)
+            rng = np.random.default_rng(int.from_bytes(digest.digest(), "little"))
+            vector = rng.standard_normal(self.size, dtype=np.float32)
+            with self._lock:
+                self._token_vectors[token] = vector
+        return vector
+
+    def _embed(self, text: str) -> list[float]:
+        vector = np.zeros(self.size, dtype=np.float32)
+        for token in tokenize(text):
+            vector += self._token_vector(token)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector.tolist()
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._embed(text)
+
+
+class ReplayEmbeddings(Embeddings):
+    """녹화된 임베딩 벡터를 재생하는 제공자
+
+    녹화 파일은 {"key": 정규화 텍스트 해시, "vector": [...]} JSON Lines 형식이다.
+    녹화에 없는 텍스트는 recorder_factory가 있으면 실제 백엔드를 호출해 녹화하고,
+    없으면 KeyError를 낸다. 실제 백엔드는 첫 녹화 미스에서 생성한다.
+
+    Args:
+        path: 녹화 파일 경로
+        recorder_factory: 녹화 미스 시 호출할 실제 임베딩 백엔드 생성 함수 (선택)
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        recorder_factory: Callable[[], Embeddings] | None = None,
+    ):
+        self.path = Path(path)
+        self.recorder_factory = recorder_factory
+        self._recorder: Embeddings | None = None
+        self._vectors: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        self._vectors[record["key"]] = record["vector"]
+        logger.info("임베딩 녹화 로드: %s (%d개)", self.path, len(self._vectors))
+
+    @property
+    def recorder(self) -> Embeddings:
+        """녹화용 실제 임베딩 백엔드 (첫 사용 시 생성)"""
+        if self._recorder is None:
+            with self._lock:
+                if self._recorder is None:
+                    self._recorder = self.recorder_factory()
+        return self._recorder
+
+    @staticmethod
+    def _key(text: str) -> str:
+        return hashlib.sha256(normalize_query(text).encode("utf-8")).hexdigest()
+
+    def _record(self, keys: list[str], vectors: list[list[float]]) -> None:
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                for key, vector in zip(keys, vectors):
+                    if key not in self._vectors:
+                        self._vectors[key] = vector
+                        f.write(json.dumps({"key": key, "vector": vector}) + "\n")
+
+    def _replay(self, texts: list[str]) -> tuple[list[str], list[list[float] | None]]:
+        keys = [self._key(text) for text in texts]
+        vectors = [self._vectors.get(key) for key in keys]
+        missing = [text for text, vector in zip(texts, vectors) if vector is None]
+        if missing and self.recorder_factory is None:
+            raise KeyError(f"녹화되지 않은 임베딩 {len(missing)}건: {missing[0][:30]!r}...")
+        return keys, vectors
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys, vectors = self._replay(texts)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            recorded = self.recorder.embed_documents([texts[i] for i in missing])
+            self._record([keys[i] for i in missing], recorded)
+            for i, vector in zip(missing, recorded):
+                vectors[i] = vector
+        return vectors
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys, vectors = self._replay(texts)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            recorded = await self.recorder.aembed_documents([texts[i] for i in missing])
+            self._record([keys[i] for i in missing], recorded)
+            for i, vector in zip(missing, recorded):
+                vectors[i] = vector
+        return vectors
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_documents([text])[0]
+
+    async def aembed_query(self, text: str) -> list[float]:
+        return (await self.aembed_documents([text]))[0]
+
+
+def create_embedding_provider(settings) -> Embeddings:
+    """설정에 따라 임베딩 제공자를 생성한다."""
+    provider = settings.embedding_provider
+    if provider not in VALID_PROVIDERS:
+        raise ValueError(f"지원하지 않는 임베딩 제공자: {provider}. 지원: {VALID_PROVIDERS}")
+
+    if provider == "hashing":
+        return HashingEmbeddings(size=settings.embedding_dimensions)
+
+    if provider == "replay":
+        # 재생 전용이면 OpenAI 클라이언트를 만들지 않는다 — 녹화 미스에서만 생성
+        factory = (
+            (lambda: _openai_embeddings(settings)) if settings.embedding_replay_record else None
+        )
+        return ReplayEmbeddings(settings.embedding_replay_path, recorder_factory=factory)
+    return _openai_embeddings(settings)
+
+
+def _openai_embeddings(settings) -> Embeddings:
+    """OpenAI 임베딩 백엔드 (hashing/replay는 langchain_openai 없이도 동작하도록 지연 임포트)"""
+    from langchain_openai import OpenAIEmbeddings
+
+    return OpenAIEmbeddings(
+        model=settings.embedding_model,
+        openai_api_key=settings.openai_api_key,
+    )
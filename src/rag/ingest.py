@@ -1,5 +1,7 @@
 """PDF 매뉴얼 인제스트 — 청킹 + 기종별 메타데이터 태깅"""
 
+import hashlib
+import json
 import logging
 from pathlib import Path
 
@@ -19,6 +21,26 @@ TEXT_SPLITTER = RecursiveCharacterTextSplitter(
 )
 
 
+def make_chunk_id(model: str, source_file: str, page_number: int, chunk_index: int) -> str:
+    """청크의 결정론적 ID — 재인제스트 시 동일 청크는 같은 ID로 upsert된다."""
+    return f"{model}:{source_file}:{page_number}:{chunk_index}"
+
+
+def hash_chunk(text: str, metadata: dict) -> str:
+    """청크 본문 + 메타데이터의 콘텐츠 해시"""
+    payload = json.dumps([text, metadata], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def hash_file(path: str | Path) -> str:
+    """파일 콘텐츠 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
 def load_and_chunk_pdf(
     pdf_path: str | Path,
     model: str,
@@ -32,55 +54,170 @@ def load_and_chunk_pdf(
         category: 문서 카테고리
 
     Returns:
-        [{"text": "...", "metadata": {...}}, ...] 형태의 청크 리스트
+        [{"id": "...", "text": "...", "metadata": {...}, "hash": "..."}, ...]
+        형태의 청크 리스트
     """
     pdf_path = Path(pdf_path)
+    logger.info("PDF 로드 중: %s (기종: %s)", pdf_path.name, model)
+    chunks = list(iter_chunks(pdf_path, model, category))
+    logger.info("텍스트 청킹 완료: %s → %d개 청크", pdf_path.name, len(chunks))
+    return chunks
+
+
+def iter_chunks(
+    pdf_path: str | Path,
+    model: str,
+    category: str = "general",
+):
+    """PDF를 페이지 단위로 읽으며 청크를 하나씩 생성하는 제너레이터
+
+    한 번에 한 페이지만 메모리에 올리므로 수백 페이지짜리 서비스 매뉴얼도
+    코퍼스 크기와 무관하게 일정한 메모리로 처리할 수 있다.
+
+    Yields:
+        {"id": "...", "text": "...", "metadata": {...}, "hash": "..."} 형태의 청크
+    """
+    for page_chunks in iter_page_chunks(pdf_path, model, category):
+        yield from page_chunks
+
+
+def iter_page_chunks(
+    pdf_path: str | Path,
+    model: str,
+    category: str = "general",
+):
+    """iter_chunks의 페이지 단위 버전 — 페이지마다 청크 리스트(빈 리스트 포함)를 생성"""
+    pdf_path = Path(pdf_path)
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
 
-    logger.info("PDF 로드 중: %s (기종: %s)", pdf_path.name, model)
-    loader = PyPDFLoader(str(pdf_path))
-    pages = loader.load()
-
+    for page in PyPDFLoader(str(pdf_path)).lazy_load():
+        yield _chunk_page(page, model, category, pdf_path.name)
+
+
+def iter_batches(items, batch_size: int):
+    """이터러블을 batch_size 크기의 리스트로 묶어 순차 생성한다."""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def parse_pdf_file(pdf_path: str | Path, model: str) -> tuple[list[dict], int]:
+    """프로세스 풀 워커용 파싱 함수 — (청크 리스트, 페이지 수) 반환"""
+    chunks: list[dict] = []
+    n_pages = 0
+    for page_chunks in iter_page_chunks(pdf_path, model):
+        n_pages += 1
+        chunks.extend(page_chunks)
+    return chunks, n_pages
+
+
+def _chunk_page(page, model: str, category: str, source_file: str) -> list[dict]:
+    """로드된 페이지 하나를 청킹하고 ID·메타데이터·해시를 태깅한다."""
+    page_num = page.metadata.get("page", 0)
+    page_chunks = [
+        text for text in TEXT_SPLITTER.split_text(page.page_content) if text.strip()
+    ]
     chunks = []
-    for page in pages:
-        page_num = page.metadata.get("page", 0)
-        page_chunks = TEXT_SPLITTER.split_text(page.page_content)
-        for chunk_text in page_chunks:
-            if not chunk_text.strip():
-                continue
-            metadata = create_metadata(
-                model=model,
-                category=category,
-                source_file=pdf_path.name,
-                page_number=page_num,
-            )
-            chunks.append({"text": chunk_text, "metadata": metadata})
-
-    logger.info("텍스트 청킹 완료: %s → %d개 청크", pdf_path.name, len(chunks))
+    for chunk_index, chunk_text in enumerate(page_chunks):
+        metadata = create_metadata(
+            model=model,
+            category=category,
+            source_file=source_file,
+            page_number=page_num,
+        )
+        chunks.append({
+            "id": make_chunk_id(model, source_file, page_num, chunk_index),
+            "text": chunk_text,
+            "metadata": metadata,
+            "hash": hash_chunk(chunk_text, metadata),
+        })
     return chunks
 
 
-def ingest_model_manuals(
+def load_manifest(path: str | Path) -> dict:
+    """인제스트 매니페스트 로드 — {기종: {파일명: {"file_hash", "chunks": {ID: 해시}}}}"""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        logger.warning("매니페스트 로드 실패 — 전체 재인제스트: %s", path)
+        return {}
+
+
+def save_manifest(path: str | Path, manifest: dict) -> None:
+    """인제스트 매니페스트 저장 (임시 파일 교체로 원자적 기록)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(
+        json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True),
+        encoding="utf-8",
+    )
+    tmp_path.replace(path)
+
+
+def scan_manual_changes(
     manuals_dir: str | Path,
     model: str,
-) -> list[dict]:
-    """특정 기종의 매뉴얼 디렉토리 내 모든 PDF를 인제스트"""
-    manuals_dir = Path(manuals_dir)
-    if not manuals_dir.exists():
-        logger.warning("매뉴얼 디렉토리가 없습니다: %s", manuals_dir)
-        return []
+    previous: dict,
+) -> dict:
+    """파일 해시만으로 변경 여부를 판정한다 (파싱 없음).
 
-    all_chunks = []
-    pdf_files = sorted(manuals_dir.glob("*.pdf"))
+    Args:
+        manuals_dir: 기종 매뉴얼 디렉토리
+        model: InBody 기종
+        previous: 해당 기종의 기존 매니페스트 항목 ({파일명: {...}})
 
-    if not pdf_files:
-        logger.warning("PDF 파일이 없습니다: %s", manuals_dir)
-        return []
+    Returns:
+        {"changed": [(PDF 경로, 파일 해시)], "files": 변경 없는 파일의 매니페스트 항목,
+         "deletes": 제거된 파일의 청크 ID, "skipped_files": 변경 없는 파일 수}
+    """
+    manuals_dir = Path(manuals_dir)
+    pdf_files = sorted(manuals_dir.glob("*.pdf")) if manuals_dir.exists() else []
 
+    changed: list[tuple[Path, str]] = []
+    files: dict[str, dict] = {}
     for pdf_path in pdf_files:
-        chunks = load_and_chunk_pdf(pdf_path, model=model)
-        all_chunks.extend(chunks)
+        file_hash = hash_file(pdf_path)
+        old_entry = previous.get(pdf_path.name)
+        if old_entry and old_entry.get("file_hash") == file_hash:
+            files[pdf_path.name] = old_entry
+        else:
+            changed.append((pdf_path, file_hash))
+
+    # 디렉토리에서 제거된 파일의 청크 삭제
+    present = {pdf_path.name for pdf_path in pdf_files}
+    deletes = [
+        chunk_id
+        for source_file, old_entry in previous.items()
+        if source_file not in present
+        for chunk_id in old_entry.get("chunks", {})
+    ]
+    return {"changed": changed, "files": files, "deletes": deletes, "skipped_files": len(files)}
+
+
+def diff_file_chunks(
+    chunks: list[dict],
+    file_hash: str,
+    old_entry: dict | None,
+) -> tuple[list[dict], list[str], dict]:
+    """변경된 파일의 새 청크를 기존 매니페스트 항목과 비교한다.
+
+    Returns:
+        (upsert 대상 청크, 삭제 대상 ID, 새 매니페스트 항목)
+    """
+    old_chunks = old_entry.get("chunks", {}) if old_entry else {}
+    new_chunks = {chunk["id"]: chunk["hash"] for chunk in chunks}
+
+    upserts = [chunk for chunk in chunks if old_chunks.get(chunk["id"]) != chunk["hash"]]
+    deletes = [chunk_id for chunk_id in old_chunks if chunk_id not in new_chunks]
+    return upserts, deletes, {"file_hash": file_hash, "chunks": new_chunks}
 
-    logger.info("기종 %s 인제스트 완료: 총 %d개 청크", model, len(all_chunks))
-    return all_chunks
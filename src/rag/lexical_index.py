@@ -0,0 +1,195 @@
+"""기종별 BM25 역색인 — 한국어 문자 n-gram 토큰화 + RRF 융합
+
+에러 코드("E012"), 부품명("전극"), 고유명사("LookInBody")처럼 임베딩
+유사도로는 잘 맞지 않는 질의를 어휘 매칭으로 보완한다.
+색인은 인제스트 시 갱신되며 Chroma 디렉토리 옆에 JSON으로 저장된다.
+
+JSON에는 청크 ID별 토큰 빈도만 저장하고 본문/메타데이터는 저장하지 않는다
+(Chroma가 원본). 검색 결과 상위 k개만 fetch 콜백으로 Chroma에서 가져온다.
+"""
+
+import json
+import logging
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+
+from langchain_core.documents import Document
+
+logger = logging.getLogger(__name__)
+
+# 영숫자 토큰(에러 코드·영문 고유명사)과 한글 연속 구간을 분리
+_TOKEN_PATTERN = re.compile(r"[0-9a-z]+|[가-힣]+")
+
+# BM25 파라미터
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# RRF 상수 (Cormack et al. 기본값)
+RRF_K = 60
+
+# 저장 형식 버전 (1: 본문+메타데이터, 2: 토큰 빈도만)
+INDEX_FORMAT = 2
+
+
+def tokenize(text: str) -> list[str]:
+    """한국어 친화 토큰화
+
+    - 영숫자 토큰: 통째로 사용 (e012, lookinbody)
+    - 한글 구간: 문자 bigram (전극 청소 → 전극, 청소 / 측정값이 → 측정, 정값, 값이)
+      조사·어미가 붙어도 어간 bigram이 겹치므로 형태소 분석기 없이 매칭된다.
+    """
+    text = unicodedata.normalize("NFKC", text).lower()
+    tokens: list[str] = []
+    for token in _TOKEN_PATTERN.findall(text):
+        if token[0].isascii() or len(token) == 1:
+            tokens.append(token)
+        else:
+            tokens.extend(token[i:i + 2] for i in range(len(token) - 1))
+    return tokens
+
+
+class LexicalIndex:
+    """단일 기종 컬렉션용 BM25 역색인
+
+    검색 스레드 풀에서 동시에 호출되므로 문서 변경과 역색인 지연 구축은 락으로 보호한다.
+
+    Args:
+        path: 색인 JSON 저장 경로 (None이면 저장하지 않음)
+        fetch: 청크 ID 목록 → Document 목록 (Chroma 조회). None이면 본문을 메모리에 보관
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        fetch: Callable[[list[str]], list[Document]] | None = None,
+    ):
+        self.path = Path(path) if path else None
+        self.fetch = fetch
+        self.terms: dict[str, dict[str, int]] = {}
+        self._local_docs: dict[str, Document] = {}
+        self._postings: dict[str, dict[str, int]] | None = None
+        self._lengths: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls,
+        path: str | Path,
+        fetch: Callable[[list[str]], list[Document]] | None = None,
+    ) -> "LexicalIndex":
+        """저장된 색인을 로드한다. 파일이 없거나 손상되었으면 빈 색인을 반환한다."""
+        index = cls(path, fetch)
+        if not index.path.exists():
+            return index
+        try:
+            data = json.loads(index.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            logger.warning("어휘 색인 로드 실패 — 빈 색인 사용: %s", path)
+            return index
+
+        if data.get("format") == INDEX_FORMAT:
+            index.terms = data["terms"]
+        else:
+            # 형식 1(본문 저장) 파일 → 토큰 빈도로 변환, 다음 save()에서 형식 2로 저장
+            index.terms = {
+                doc_id: dict(Counter(tokenize(doc["text"]))) for doc_id, doc in data.items()
+            }
+        return index
+
+    def save(self) -> None:
+        """색인을 JSON 파일로 저장한다."""
+        if self.path is None:
+            return
+        with self._lock:
+            payload = json.dumps(
+                {"format": INDEX_FORMAT, "terms": self.terms},
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(payload, encoding="utf-8")
+        tmp_path.replace(self.path)
+
+    def add(self, ids: list[str], texts: list[str], metadatas: list[dict]) -> None:
+        """문서를 색인에 추가 (같은 ID는 덮어쓴다)"""
+        with self._lock:
+            for doc_id, text, metadata in zip(ids, texts, metadatas):
+                self.terms[doc_id] = dict(Counter(tokenize(text)))
+                if self.fetch is None:
+                    self._local_docs[doc_id] = Document(page_content=text, metadata=metadata)
+            self._postings = None
+
+    def remove(self, ids: list[str]) -> None:
+        """문서를 색인에서 제거"""
+        with self._lock:
+            for doc_id in ids:
+                self.terms.pop(doc_id, None)
+                self._local_docs.pop(doc_id, None)
+            self._postings = None
+
+    def _snapshot(self) -> tuple[dict[str, dict[str, int]], dict[str, int]]:
+        """(역색인, 문서 길이) 반환 — 역색인이 없으면 락 안에서 한 번만 구축"""
+        with self._lock:
+            if self._postings is None:
+                self._build()
+            return self._postings, self._lengths
+
+    def _build(self) -> None:
+        """역색인(토큰 → {문서 ID: 빈도})을 메모리에 구축 (락 보유 상태에서 호출)"""
+        postings: dict[str, dict[str, int]] = {}
+        lengths: dict[str, int] = {}
+        for doc_id, counts in self.terms.items():
+            lengths[doc_id] = sum(counts.values())
+            for token, tf in counts.items():
+                postings.setdefault(token, {})[doc_id] = tf
+        self._postings = postings
+        self._lengths = lengths
+
+    def search_ids(self, query: str, k: int = 5) -> list[str]:
+        """BM25 점수 상위 k개 청크 ID를 반환한다."""
+        postings, lengths = self._snapshot()
+        if not lengths:
+            return []
+
+        n_docs = len(lengths)
+        avg_len = sum(lengths.values()) / n_docs or 1.0
+        scores: Counter[str] = Counter()
+
+        for token in set(tokenize(query)):
+            matches = postings.get(token)
+            if not matches:
+                continue
+            idf = math.log(1 + (n_docs - len(matches) + 0.5) / (len(matches) + 0.5))
+            for doc_id, tf in matches.items():
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc_id] / avg_len)
+                scores[doc_id] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+        return [doc_id for doc_id, _ in scores.most_common(k)]
+
+    def search(self, query: str, k: int = 5) -> list[Document]:
+        """BM25 점수 상위 k개 문서를 반환한다 (본문은 fetch로 가져온다)."""
+        ids = self.search_ids(query, k)
+        if not ids:
+            return []
+        if self.fetch is not None:
+            return self.fetch(ids)
+        with self._lock:
+            return [self._local_docs[doc_id] for doc_id in ids if doc_id in self._local_docs]
+
+
+def reciprocal_rank_fusion(ranked_lists: list[list[Document]], k: int = RRF_K) -> list[Document]:
+    """여러 검색 결과 순위를 RRF로 융합한다 (문서 본문 기준 중복 제거)."""
+    scores: dict[str, float] = {}
+    docs: dict[str, Document] = {}
+    for ranked in ranked_lists:
+        for rank, doc in enumerate(ranked):
+            key = doc.page_content
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank + 1)
+            docs.setdefault(key, doc)
+    return [docs[key] for key in sorted(scores, key=scores.get, reverse=True)]
@@ -57,3 +57,24 @@ def build_model_category_filter(model: str, category: str) -> dict:
     if category not in VALID_CATEGORIES:
         raise ValueError(f"지원하지 않는 카테고리: {category}")
     return {"$and": [{"model": model}, {"category": category}]}
+
+
+def rerank_by_category(docs: list, model: str, category: str | None, k: int) -> list:
+    """기종 필터로 가져온 후보를 카테고리 기준으로 메모리 내 재정렬
+
+    카테고리가 일치하는 문서를 유사도 순서대로 앞에 두고, 부족분은
+    나머지 후보로 채운다. 다른 기종 메타데이터를 가진 문서는 제외한다
+    (Layer 2 격리의 이중 보장).
+
+    Args:
+        docs: 유사도 순으로 정렬된 후보 문서 리스트
+        model: InBody 기종
+        category: 우선할 카테고리 (None이면 재정렬 없음)
+        k: 반환할 문서 수
+    """
+    docs = [doc for doc in docs if doc.metadata.get("model") == model]
+    if category:
+        matched = [doc for doc in docs if doc.metadata.get("category") == category]
+        others = [doc for doc in docs if doc.metadata.get("category") != category]
+        docs = matched + others
+    return docs[:k]
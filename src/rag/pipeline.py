@@ -0,0 +1,268 @@
+"""병렬 인제스트 파이프라인 — 파싱(프로세스 풀) → 임베딩(동시 배치) → 쓰기(단일 writer)
+
+1. parse: 변경된 PDF를 ProcessPoolExecutor에서 파싱·청킹 (CPU 바운드)
+   ingest_streaming=True면 페이지 단위 제너레이터로 순차 파싱 (메모리 상한 고정)
+2. embed: 배치 단위 임베딩을 동시성 제한 + 토큰/분 한도 + 재시도로 요청 (I/O 바운드)
+3. write: 단일 writer가 Chroma에 upsert (SQLite 쓰기 직렬화)
+
+단계 사이는 유한 큐로 연결되어 하류가 밀리면 상류가 대기한다.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from langchain_core.embeddings import Embeddings
+
+from src.config import settings
+from src.rag.ingest import (
+    diff_file_chunks,
+    iter_batches,
+    iter_page_chunks,
+    parse_pdf_file,
+    scan_manual_changes,
+)
+from src.rag.vectorstore import (
+    delete_documents_from_collection,
+    finalize_collection_writes,
+    list_document_ids,
+    upsert_embedded_documents,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_tokens(text: str) -> int:
+    """임베딩 토큰 수 근사치 — UTF-8 4바이트당 1토큰 (한글 1자 ≈ 0.75토큰)"""
+    return max(1, len(text.encode("utf-8")) // 4)
+
+
+class TokenRateLimiter:
+    """60초 슬라이딩 윈도우 기반 토큰/분 제한기
+
+    Args:
+        tokens_per_minute: 분당 허용 토큰 수
+    """
+
+    def __init__(self, tokens_per_minute: int):
+        self.tokens_per_minute = tokens_per_minute
+        self._window: deque[tuple[float, int]] = deque()
+        self._used = 0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int) -> None:
+        """토큰 예산이 생길 때까지 대기한 뒤 사용량을 기록한다."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._window and now - self._window[0][0] >= 60:
+                    self._used -= self._window.popleft()[1]
+                # 단일 배치가 한도보다 커도 윈도우가 비어 있으면 통과시킨다
+                if not self._window or self._used + tokens <= self.tokens_per_minute:
+                    self._window.append((now, tokens))
+                    self._used += tokens
+                    return
+                await asyncio.sleep(60 - (now - self._window[0][0]))
+
+
+@dataclass
+class IngestReport:
+    """인제스트 처리량 리포트"""
+
+    files: int = 0
+    pages: int = 0
+    chunks: int = 0
+    tokens: int = 0
+    deleted: int = 0
+    skipped_files: int = 0
+    retries: int = 0
+    elapsed: float = 0.0
+
+    def summary(self) -> str:
+        """처리량 요약 문자열 (pages/s, chunks/s, tokens/s)"""
+        elapsed = self.elapsed or 1e-9
+        return (
+            f"파일 {self.files}개 (변경 없음 {self.skipped_files}개), "
+            f"페이지 {self.pages}, 청크 {self.chunks} (삭제 {self.deleted}), "
+            f"토큰 {self.tokens}, 재시도 {self.retries}회, {self.elapsed:.2f}s\n"
+            f"처리량: {self.pages / elapsed:.1f} pages/s, "
+            f"{self.chunks / elapsed:.1f} chunks/s, {self.tokens / elapsed:.0f} tokens/s"
+        )
+
+
+async def run_ingest_pipeline(
+    manuals_root: str | Path,
+    models: list[str],
+    manifest: dict,
+    embeddings: Embeddings,
+) -> IngestReport:
+    """전체 기종 매뉴얼을 병렬 파이프라인으로 증분 인제스트한다.
+
+    성공 시 manifest를 제자리에서 갱신한다 (저장은 호출자 책임).
+    갱신된 매니페스트에 없는 청크 ID는 컬렉션과 어휘 색인에서 삭제한다.
+
+    Args:
+        manuals_root: data/manuals 디렉토리
+        models: 인제스트할 기종 리스트
+        manifest: 기존 인제스트 매니페스트
+        embeddings: 문서 임베딩 백엔드
+    """
+    manuals_root = Path(manuals_root)
+    report = IngestReport()
+    started = time.perf_counter()
+    loop = asyncio.get_running_loop()
+
+    limiter = TokenRateLimiter(settings.ingest_embed_tpm)
+
+    # 파일 해시로 변경분만 선별
+    new_files: dict[str, dict] = {}
+    deletes: dict[str, list[str]] = {}
+    jobs: list[tuple[str, Path, str]] = []
+    for model in models:
+        scan = scan_manual_changes(manuals_root / model, model, manifest.get(model, {}))
+        new_files[model] = dict(scan["files"])
+        deletes[model] = list(scan["deletes"])
+        report.skipped_files += scan["skipped_files"]
+        jobs.extend((model, pdf_path, file_hash) for pdf_path, file_hash in scan["changed"])
+
+    batch_size = settings.ingest_embed_batch_size
+    concurrency = settings.ingest_embed_concurrency
+
+    async def produce_parallel() -> None:
+        # 동시에 처리 중인 파일 수를 워커 수로 제한 — 파싱 결과가 쌓이지 않도록
+        parse_slots = asyncio.Semaphore(settings.ingest_parse_workers)
+
+        async def parse_file(model: str, pdf_path: Path, file_hash: str) -> None:
+            async with parse_slots:
+                chunks, n_pages = await loop.run_in_executor(
+                    pool, parse_pdf_file, str(pdf_path), model
+                )
+                upserts, file_deletes, entry = diff_file_chunks(
+                    chunks, file_hash, manifest.get(model, {}).get(pdf_path.name)
+                )
+                new_files[model][pdf_path.name] = entry
+                deletes[model].extend(file_deletes)
+                report.files += 1
+                report.pages += n_pages
+                logger.info("파싱 완료: [%s] %s → %d개 청크", model, pdf_path.name, len(chunks))
+                for batch in iter_batches(upserts, batch_size):
+                    await batch_queue.put((model, batch))
+
+        with ProcessPoolExecutor(max_workers=settings.ingest_parse_workers) as pool:
+            await asyncio.gather(*(parse_file(*job) for job in jobs))
+
+    async def produce_streaming() -> None:
+        # 페이지 단위 제너레이터 — 메모리에는 한 페이지 + 유한 큐만 유지된다
+        for model, pdf_path, file_hash in jobs:
+            old_entry = manifest.get(model, {}).get(pdf_path.name)
+            new_chunks: dict[str, str] = {}
+            batch: list[dict] = []
+
+            pages = iter_page_chunks(pdf_path, model)
+            while (page_chunks := await asyncio.to_thread(next, pages, None)) is not None:
+                report.pages += 1
+                # 페이지 단위로 diff — upsert 대상만 배치에 담고 ID·해시만 누적
+                upserts, _, page_entry = diff_file_chunks(page_chunks, file_hash, old_entry)
+                batch.extend(upserts)
+                new_chunks.update(page_entry["chunks"])
+                if len(batch) >= batch_size:
+                    await batch_queue.put((model, batch))
+                    batch = []
+            if batch:
+                await batch_queue.put((model, batch))
+
+            # 파일 전체의 삭제 대상과 매니페스트 항목은 누적한 ID·해시로 계산
+            seen = [{"id": chunk_id, "hash": h} for chunk_id, h in new_chunks.items()]
+            _, file_deletes, entry = diff_file_chunks(seen, file_hash, old_entry)
+            deletes[model].extend(file_deletes)
+            new_files[model][pdf_path.name] = entry
+            report.files += 1
+            logger.info("파싱 완료: [%s] %s → %d개 청크", model, pdf_path.name, len(new_chunks))
+
+    async def produce() -> None:
+        if settings.ingest_streaming:
+            await produce_streaming()
+        else:
+            await produce_parallel()
+        for _ in range(concurrency):
+            await batch_queue.put(None)
+
+    async def embedder() -> None:
+        while (item := await batch_queue.get()) is not None:
+            model, chunks = item
+            texts = [chunk["text"] for chunk in chunks]
+            tokens = sum(estimate_tokens(text) for text in texts)
+            await limiter.acquire(tokens)
+            vectors = await _embed_with_retry(embeddings, texts, report)
+            report.tokens += tokens
+            await write_queue.put((model, chunks, vectors))
+
+    async def embed_stage() -> None:
+        await asyncio.gather(*(embedder() for _ in range(concurrency)))
+        await write_queue.put(None)
+
+    async def writer() -> None:
+        while (item := await write_queue.get()) is not None:
+            model, chunks, vectors = item
+            report.chunks += await asyncio.to_thread(
+                upsert_embedded_documents, model, chunks, vectors
+            )
+
+    # 단계 간 유한 큐 — 하류가 느리면 상류가 대기(백프레셔)하여 메모리 상한 유지
+    batch_queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+    write_queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+
+    stages = [
+        asyncio.create_task(produce()),
+        asyncio.create_task(embed_stage()),
+        asyncio.create_task(writer()),
+    ]
+    try:
+        await asyncio.gather(*stages)
+    except BaseException:
+        for task in stages:
+            task.cancel()
+        raise
+
+    for model in models:
+        # 매니페스트에 없는 청크(삭제/이름 변경된 파일, --full 재인제스트 이전 청크) 정리
+        expected = {cid for entry in new_files[model].values() for cid in entry["chunks"]}
+        stored = await asyncio.to_thread(list_document_ids, model)
+        orphans = stored - expected - set(deletes[model])
+        if orphans:
+            logger.info("[%s] 매니페스트에 없는 청크 %d개 삭제", model, len(orphans))
+            deletes[model].extend(sorted(orphans))
+        if deletes[model]:
+            report.deleted += await asyncio.to_thread(
+                delete_documents_from_collection, model, deletes[model]
+            )
+        finalize_collection_writes(model)
+        manifest[model] = new_files[model]
+
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+async def _embed_with_retry(
+    embeddings: Embeddings,
+    texts: list[str],
+    report: IngestReport,
+) -> list[list[float]]:
+    """지수 백오프(+지터) 재시도로 문서 임베딩을 요청한다."""
+    attempt = 0
+    while True:
+        try:
+            return await embeddings.aembed_documents(texts)
+        except Exception as e:
+            if attempt >= settings.ingest_embed_max_retries:
+                raise
+            delay = min(60.0, 2 ** attempt) + random.uniform(0, 1)
+            attempt += 1
+            report.retries += 1
+            logger.warning("임베딩 배치 실패 (%d회차) — %.1fs 후 재시도: %s", attempt, delay, e)
+            await asyncio.sleep(delay)
@@ -1,13 +1,26 @@
-"""벡터 DB 초기화 및 기종별 리트리버 팩토리 — 기종 격리 Layer 1+2 구현"""
+"""벡터 DB 초기화 및 기종별 리트리버 팩토리 — 기종 격리 Layer 1+2 구현
 
+리트리버/어휘 색인은 프로세스 내에 캐시된다. 인제스트는 별도 프로세스
+(scripts/ingest_manuals.py)에서 실행되므로, 쓰기 후 기종별 버전 파일을 갱신하고
+API 서버는 접근 시 버전 파일 mtime을 비교하여 바뀌었으면 캐시를 다시 만든다.
+"""
+
+import asyncio
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import chromadb
 from langchain_community.vectorstores import Chroma
-from langchain_openai import OpenAIEmbeddings
+from langchain_core.documents import Document
 
 from src.config import settings
+from src.rag.embedding_cache import CachedEmbeddings
+from src.rag.embeddings import create_embedding_provider
+from src.rag.lexical_index import LexicalIndex
 from src.rag.metadata import (
     VALID_MODELS,
     build_model_category_filter,
@@ -19,68 +32,279 @@ logger = logging.getLogger(__name__)
 # 기종별 컬렉션명 매핑 (Layer 1: 물리적 격리)
 COLLECTION_NAMES = {model: f"inbody_{model.lower()}" for model in VALID_MODELS}
 
-# 임베딩 모델 싱글톤
-_embeddings: OpenAIEmbeddings | None = None
+# 임베딩 모델 싱글톤 (질의 임베딩 캐시 래퍼)
+_embeddings: CachedEmbeddings | None = None
+
+# Chroma 클라이언트/컬렉션 핸들/리트리버 프로세스 공유 캐시
+_client: chromadb.ClientAPI | None = None
+_vectorstores: dict[str, Chroma] = {}
+_lexical_indexes: dict[str, LexicalIndex] = {}
+_retrievers: dict[tuple[str, str | None, int], object] = {}
+_retriever_stats = {"hits": 0, "misses": 0, "invalidations": 0, "external_reloads": 0}
+_cache_lock = threading.Lock()
+
+# 기종별 캐시가 만들어질 당시의 컬렉션 버전 (버전 파일 mtime_ns)
+_collection_versions: dict[str, int] = {}
+
+# Chroma 질의 전용 스레드 풀 — 이벤트 루프 블로킹 방지, 동시 질의 수 제한
+_search_executor = ThreadPoolExecutor(
+    max_workers=settings.rag_search_workers,
+    thread_name_prefix="chroma-search",
+)
 
 
-def get_embeddings() -> OpenAIEmbeddings:
-    """OpenAI 임베딩 모델 싱글톤 반환"""
+def get_embeddings() -> CachedEmbeddings:
+    """질의 캐시가 적용된 임베딩 제공자 싱글톤 반환 (Settings.embedding_provider)"""
     global _embeddings
     if _embeddings is None:
-        _embeddings = OpenAIEmbeddings(openai_api_key=settings.openai_api_key)
+        _embeddings = CachedEmbeddings(
+            create_embedding_provider(settings),
+            model_name=f"{settings.embedding_provider}:{settings.embedding_model}",
+            max_size=settings.embedding_cache_size,
+            persist_path=settings.embedding_cache_path,
+        )
     return _embeddings
 
 
+def get_embedding_cache_stats() -> dict:
+    """질의 임베딩 캐시 적중 통계 반환"""
+    return get_embeddings().stats()
+
+
 def get_chroma_client() -> chromadb.ClientAPI:
-    """Chroma 영속 클라이언트 반환"""
-    persist_dir = Path(settings.chroma_persist_dir)
-    persist_dir.mkdir(parents=True, exist_ok=True)
-    return chromadb.PersistentClient(path=str(persist_dir))
+    """Chroma 영속 클라이언트 싱글톤 반환 (프로세스당 1회 오픈)"""
+    global _client
+    if _client is None:
+        with _cache_lock:
+            if _client is None:
+                persist_dir = Path(settings.chroma_persist_dir)
+                persist_dir.mkdir(parents=True, exist_ok=True)
+                _client = chromadb.PersistentClient(path=str(persist_dir))
+    return _client
+
+
+def get_vectorstore(model: str) -> Chroma:
+    """기종별 Chroma 핸들 반환 — 컬렉션당 1개를 생성해 재사용"""
+    if model not in VALID_MODELS:
+        raise ValueError(f"지원하지 않는 기종: {model}")
+
+    vectorstore = _vectorstores.get(model)
+    if vectorstore is None:
+        client = get_chroma_client()
+        with _cache_lock:
+            vectorstore = _vectorstores.get(model)
+            if vectorstore is None:
+                vectorstore = Chroma(
+                    client=client,
+                    collection_name=COLLECTION_NAMES[model],
+                    embedding_function=get_embeddings(),
+                )
+                _vectorstores[model] = vectorstore
+    return vectorstore
+
+
+def get_lexical_index(model: str) -> LexicalIndex:
+    """기종별 BM25 색인 반환 — 최초 접근 시 디스크에서 로드 후 재사용"""
+    if model not in VALID_MODELS:
+        raise ValueError(f"지원하지 않는 기종: {model}")
+
+    _check_collection_version(model)
+    index = _lexical_indexes.get(model)
+    if index is None:
+        with _cache_lock:
+            index = _lexical_indexes.get(model)
+            if index is None:
+                path = Path(settings.lexical_index_dir) / f"{COLLECTION_NAMES[model]}.json"
+                index = LexicalIndex.load(path, fetch=partial(_fetch_documents, model))
+                _lexical_indexes[model] = index
+    return index
+
+
+def _fetch_documents(model: str, ids: list[str]) -> list[Document]:
+    """어휘 검색 결과 ID의 본문/메타데이터를 Chroma에서 가져온다 (ID 순서 유지)."""
+    collection = get_chroma_client().get_or_create_collection(COLLECTION_NAMES[model])
+    result = collection.get(ids=ids, include=["documents", "metadatas"])
+    found = {
+        doc_id: Document(page_content=text, metadata=metadata or {})
+        for doc_id, text, metadata in zip(result["ids"], result["documents"], result["metadatas"])
+    }
+    return [found[doc_id] for doc_id in ids if doc_id in found]
+
+
+def _version_path(model: str) -> Path:
+    return Path(settings.lexical_index_dir) / f"{COLLECTION_NAMES[model]}.version"
+
+
+def _read_collection_version(model: str) -> int:
+    """기종 컬렉션의 현재 버전 (버전 파일 mtime_ns, 없으면 0)"""
+    try:
+        return _version_path(model).stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+def _bump_collection_version(model: str) -> None:
+    """다른 프로세스(API 서버)에 컬렉션 변경을 알리도록 버전 파일을 갱신한다."""
+    path = _version_path(model)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(str(time.time_ns()), encoding="utf-8")
+    _collection_versions[model] = _read_collection_version(model)
+
+
+def _drop_model_caches(model: str) -> None:
+    """기종의 Chroma 핸들/리트리버/어휘 색인 캐시 제거 (락 보유 상태에서 호출)"""
+    for key in [key for key in _retrievers if key[0] == model]:
+        del _retrievers[key]
+    _vectorstores.pop(model, None)
+    _lexical_indexes.pop(model, None)
+
+
+def _check_collection_version(model: str) -> None:
+    """다른 프로세스의 인제스트로 컬렉션 버전이 바뀌었으면 기종 캐시를 버린다."""
+    current = _read_collection_version(model)
+    seen = _collection_versions.get(model)
+    if seen == current:
+        return
+    with _cache_lock:
+        if _collection_versions.get(model) == current:
+            return
+        if seen is not None:
+            _drop_model_caches(model)
+            _retriever_stats["external_reloads"] += 1
+            logger.info("컬렉션 변경 감지 — 캐시 재생성: %s", COLLECTION_NAMES[model])
+        _collection_versions[model] = current
 
 
 def init_collections() -> dict[str, Chroma]:
     """기종별 Chroma 컬렉션 초기화 (4개)"""
-    client = get_chroma_client()
-    embeddings = get_embeddings()
     collections = {}
 
     for model, collection_name in COLLECTION_NAMES.items():
-        collections[model] = Chroma(
-            client=client,
-            collection_name=collection_name,
-            embedding_function=embeddings,
-        )
+        collections[model] = get_vectorstore(model)
         logger.info("컬렉션 초기화: %s (%s)", collection_name, model)
 
     return collections
 
 
+def invalidate_retrievers(model: str | None = None) -> None:
+    """리트리버 캐시 무효화 — 인제스트 완료 후 호출
+
+    현재 프로세스의 리트리버 캐시를 비우고 버전 파일을 갱신하여
+    다른 프로세스(API 서버)도 다음 접근 시 리트리버와 어휘 색인을 다시 만들게 한다.
+
+    Args:
+        model: 무효화할 기종 (None이면 전체)
+    """
+    models = list(COLLECTION_NAMES) if model is None else [model]
+    with _cache_lock:
+        for target in models:
+            for key in [key for key in _retrievers if key[0] == target]:
+                del _retrievers[key]
+            _bump_collection_version(target)
+        _retriever_stats["invalidations"] += 1
+
+
+def get_retriever_cache_stats() -> dict:
+    """리트리버 캐시 적중 통계 반환"""
+    hits = _retriever_stats["hits"]
+    misses = _retriever_stats["misses"]
+    total = hits + misses
+    return {
+        **_retriever_stats,
+        "size": len(_retrievers),
+        "hit_rate": hits / total if total else 0.0,
+    }
+
+
 def add_documents_to_collection(
     model: str,
     chunks: list[dict],
 ) -> int:
-    """청크 리스트를 해당 기종 컬렉션에 추가"""
+    """청크 리스트를 해당 기종 컬렉션에 추가 (ID가 있으면 upsert)"""
     if model not in VALID_MODELS:
         raise ValueError(f"지원하지 않는 기종: {model}")
 
-    client = get_chroma_client()
-    embeddings = get_embeddings()
-    collection_name = COLLECTION_NAMES[model]
+    if not chunks:
+        return 0
 
-    vectorstore = Chroma(
-        client=client,
-        collection_name=collection_name,
-        embedding_function=embeddings,
-    )
+    vectorstore = get_vectorstore(model)
 
     texts = [chunk["text"] for chunk in chunks]
     metadatas = [chunk["metadata"] for chunk in chunks]
+    # 결정론적 청크 ID가 있으면 upsert (재인제스트 시 중복 방지)
+    ids = [chunk["id"] for chunk in chunks] if all("id" in c for c in chunks) else None
+
+    ids = vectorstore.add_texts(texts=texts, metadatas=metadatas, ids=ids)
+
+    # 어휘 색인도 함께 갱신 후 저장 (서버 시작 시 재구축 불필요)
+    lexical_index = get_lexical_index(model)
+    lexical_index.add(ids, texts, metadatas)
+    lexical_index.save()
 
-    vectorstore.add_texts(texts=texts, metadatas=metadatas)
-    logger.info("컬렉션 %s에 %d개 문서 추가", collection_name, len(texts))
+    invalidate_retrievers(model)
+    logger.info("컬렉션 %s에 %d개 문서 추가", COLLECTION_NAMES[model], len(texts))
     return len(texts)
 
 
+def upsert_embedded_documents(
+    model: str,
+    chunks: list[dict],
+    vectors: list[list[float]],
+) -> int:
+    """임베딩이 계산된 청크를 컬렉션에 upsert (인제스트 파이프라인 writer 단계용)
+
+    어휘 색인은 메모리에만 반영되며, 모든 배치가 끝난 뒤
+    finalize_collection_writes()로 저장한다.
+    """
+    if model not in VALID_MODELS:
+        raise ValueError(f"지원하지 않는 기종: {model}")
+    if not chunks:
+        return 0
+
+    ids = [chunk["id"] for chunk in chunks]
+    texts = [chunk["text"] for chunk in chunks]
+    metadatas = [chunk["metadata"] for chunk in chunks]
+
+    collection = get_chroma_client().get_or_create_collection(COLLECTION_NAMES[model])
+    collection.upsert(ids=ids, embeddings=vectors, documents=texts, metadatas=metadatas)
+    get_lexical_index(model).add(ids, texts, metadatas)
+    return len(ids)
+
+
+def list_document_ids(model: str) -> set[str]:
+    """기종 컬렉션과 어휘 색인에 저장된 전체 청크 ID"""
+    if model not in VALID_MODELS:
+        raise ValueError(f"지원하지 않는 기종: {model}")
+
+    collection = get_chroma_client().get_or_create_collection(COLLECTION_NAMES[model])
+    ids = set(collection.get(include=[])["ids"])
+    return ids | set(get_lexical_index(model).terms)
+
+
+def finalize_collection_writes(model: str) -> None:
+    """배치 쓰기 완료 후 어휘 색인 저장 + 리트리버 캐시 무효화"""
+    get_lexical_index(model).save()
+    invalidate_retrievers(model)
+
+
+def delete_documents_from_collection(model: str, ids: list[str]) -> int:
+    """청크 ID 리스트를 해당 기종 컬렉션과 어휘 색인에서 삭제"""
+    if model not in VALID_MODELS:
+        raise ValueError(f"지원하지 않는 기종: {model}")
+    if not ids:
+        return 0
+
+    get_vectorstore(model).delete(ids=ids)
+
+    lexical_index = get_lexical_index(model)
+    lexical_index.remove(ids)
+    lexical_index.save()
+
+    invalidate_retrievers(model)
+    logger.info("컬렉션 %s에서 %d개 문서 삭제", COLLECTION_NAMES[model], len(ids))
+    return len(ids)
+
+
 def get_retriever(
     model: str,
     category: str | None = None,
@@ -88,6 +312,9 @@ def get_retriever(
 ):
     """기종별 리트리버 반환 — 메타데이터 필터 필수 적용 (Layer 2: 논리적 격리)
 
+    (model, category, k) 단위로 메모이즈되며, 인제스트 후
+    invalidate_retrievers()로 무효화된다.
+
     Args:
         model: InBody 기종 (270S, 580, 770S, 970S)
         category: 카테고리 필터 (선택)
@@ -96,15 +323,12 @@ def get_retriever(
     if model not in VALID_MODELS:
         raise ValueError(f"지원하지 않는 기종: {model}")
 
-    client = get_chroma_client()
-    embeddings = get_embeddings()
-    collection_name = COLLECTION_NAMES[model]
-
-    vectorstore = Chroma(
-        client=client,
-        collection_name=collection_name,
-        embedding_function=embeddings,
-    )
+    _check_collection_version(model)
+    key = (model, category, k)
+    retriever = _retrievers.get(key)
+    if retriever is not None:
+        _retriever_stats["hits"] += 1
+        return retriever
 
     # Layer 2: 기종 필터 필수 + 카테고리 필터 선택
     if category:
@@ -112,7 +336,43 @@ def get_retriever(
     else:
         search_filter = build_model_filter(model)
 
-    return vectorstore.as_retriever(
+    retriever = get_vectorstore(model).as_retriever(
         search_type="similarity",
         search_kwargs={"k": k, "filter": search_filter},
     )
+    with _cache_lock:
+        _retrievers[key] = retriever
+        _retriever_stats["misses"] += 1
+    return retriever
+
+
+async def asearch_documents(
+    model: str,
+    query: str,
+    category: str | None = None,
+    k: int = 5,
+) -> list:
+    """기종별 비동기 유사도 검색 — get_retriever의 메모이즈된 리트리버 사용
+
+    질의 임베딩은 네이티브 비동기 HTTP로 생성하고, Chroma 질의는
+    전용 스레드 풀에서 실행하여 이벤트 루프를 블로킹하지 않는다.
+
+    Args:
+        model: InBody 기종 (270S, 580, 770S, 970S)
+        query: 검색 질의
+        category: 카테고리 필터 (선택)
+        k: 검색 결과 수
+    """
+    retriever = get_retriever(model=model, category=category, k=k)
+    search_kwargs = dict(retriever.search_kwargs)
+    embedding = await get_embeddings().aembed_query(query)
+
+    return await run_in_search_executor(
+        lambda: retriever.vectorstore.similarity_search_by_vector(embedding, **search_kwargs),
+    )
+
+
+async def run_in_search_executor(func, *args):
+    """CPU/디스크 바운드 검색 작업(Chroma 질의, BM25 채점)을 검색 전용 스레드 풀에서 실행"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_search_executor, func, *args)
@@ -8,16 +8,15 @@ from src.db.schemas import ErrorCodeTable
 from src.models.error_codes import ErrorCodeResponse
 
 
-@tool
-async def lookup_error_code(model: str, error_code: str) -> str:
-    """특정 기종의 에러 코드를 조회합니다.
+async def fetch_error_code(model: str, error_code: str) -> ErrorCodeResponse | None:
+    """에러 코드 행을 구조화된 응답으로 조회한다 (없으면 None).
 
     Args:
         model: InBody 기종 (270S, 580, 770S, 970S)
         error_code: 조회할 에러 코드 (예: E001)
 
     Returns:
-        에러 코드 정보 (원인, 해결 방법, 지원 수준)
+        ErrorCodeResponse 또는 None
     """
     async with async_session_factory() as session:
         result = await session.execute(
@@ -29,9 +28,9 @@ async def lookup_error_code(model: str, error_code: str) -> str:
         row = result.scalar_one_or_none()
 
     if row is None:
-        return f"기종 {model}에서 에러 코드 '{error_code}'을(를) 찾을 수 없습니다."
+        return None
 
-    response = ErrorCodeResponse(
+    return ErrorCodeResponse(
         code=row.code,
         model_id=row.model_id,
         title=row.title,
@@ -42,6 +41,22 @@ async def lookup_error_code(model: str, error_code: str) -> str:
         escalation_note=row.escalation_note,
     )
 
+
+@tool
+async def lookup_error_code(model: str, error_code: str) -> str:
+    """특정 기종의 에러 코드를 조회합니다.
+
+    Args:
+        model: InBody 기종 (270S, 580, 770S, 970S)
+        error_code: 조회할 에러 코드 (예: E001)
+
+    Returns:
+        에러 코드 정보 (원인, 해결 방법, 지원 수준)
+    """
+    response = await fetch_error_code(model, error_code)
+    if response is None:
+        return f"기종 {model}에서 에러 코드 '{error_code}'을(를) 찾을 수 없습니다."
+
     level_text = (
         "사용자 해결 가능 (Level 1)"
         if response.support_level == "level_1"
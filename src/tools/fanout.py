@@ -0,0 +1,59 @@
+"""도구 동시 호출(fan-out) 유틸리티 — 도구별 타임아웃 + 지연 시간 집계"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable
+
+logger = logging.getLogger(__name__)
+
+# 도구별 지연 통계: {도구명: {"calls", "timeouts", "errors", "total_ms", "max_ms"}}
+_latency_stats: dict[str, dict[str, float]] = {}
+
+
+async def _timed_call(name: str, call: Awaitable, timeout: float) -> str | None:
+    """단일 도구 호출 — 타임아웃/예외 시 None 반환 (부분 결과 허용)"""
+    stats = _latency_stats.setdefault(
+        name, {"calls": 0, "timeouts": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0}
+    )
+    started = time.perf_counter()
+    try:
+        return await asyncio.wait_for(call, timeout=timeout)
+    except TimeoutError:
+        stats["timeouts"] += 1
+        logger.warning("도구 %s 타임아웃 (%.1fs) — 부분 결과로 진행", name, timeout)
+        return None
+    except Exception:
+        stats["errors"] += 1
+        logger.exception("도구 %s 호출 실패 — 부분 결과로 진행", name)
+        return None
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        stats["calls"] += 1
+        stats["total_ms"] += elapsed_ms
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+
+async def gather_tools(calls: dict[str, Awaitable], timeout: float) -> dict[str, str | None]:
+    """여러 도구를 동시에 호출하고 {도구명: 결과 또는 None}을 반환한다.
+
+    Args:
+        calls: {도구명: 도구 호출 코루틴}
+        timeout: 도구별 타임아웃(초)
+    """
+    names = list(calls)
+    results = await asyncio.gather(
+        *(_timed_call(name, calls[name], timeout) for name in names)
+    )
+    return dict(zip(names, results))
+
+
+def get_tool_latency_stats() -> dict:
+    """도구별 평균/최대 지연 통계 반환 (가장 느린 의존성 식별용)"""
+    return {
+        name: {
+            **stats,
+            "avg_ms": stats["total_ms"] / stats["calls"] if stats["calls"] else 0.0,
+        }
+        for name, stats in _latency_stats.items()
+    }
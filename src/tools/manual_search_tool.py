@@ -3,17 +3,28 @@
 import logging
 import re
 
-from langchain_core.tools import tool
+from chromadb.errors import ChromaError
+from langchain_core.tools import StructuredTool
+from openai import OpenAIError
 
+from src.config import settings
 from src.prompts.disclaimers import SERVICE_CENTER_INFO
-from src.rag.metadata import VALID_CATEGORIES, VALID_MODELS
-from src.rag.vectorstore import get_retriever
+from src.rag.lexical_index import reciprocal_rank_fusion
+from src.rag.metadata import VALID_CATEGORIES, VALID_MODELS, rerank_by_category
+from src.rag.vectorstore import (
+    asearch_documents,
+    get_lexical_index,
+    get_retriever,
+    run_in_search_executor,
+)
 
 logger = logging.getLogger(__name__)
 
+# 최종 반환 문서 수
+SEARCH_K = 5
 
-@tool
-def search_manual(model: str, query: str, category: str = "") -> str:
+
+def _search_manual(model: str, query: str, category: str = "") -> str:
     """기종별 매뉴얼에서 관련 정보를 검색합니다.
 
     Args:
@@ -26,30 +37,86 @@ def search_manual(model: str, query: str, category: str = "") -> str:
         매뉴얼에서 검색된 관련 문서 내용
     """
     if model not in VALID_MODELS:
-        return (
-            f"지원하지 않는 기종입니다: {model}. "
-            f"지원 기종: {', '.join(sorted(VALID_MODELS))}"
-        )
+        return _unsupported_model_message(model)
 
     cat = category if category and category in VALID_CATEGORIES else None
 
+    # 기종 필터(필수)로 후보를 1회 검색한 뒤 카테고리는 메모리에서 재정렬
+    # — 카테고리 결과가 없을 때의 2차 검색 왕복 제거
     try:
-        retriever = get_retriever(model=model, category=cat, k=5)
-        docs = retriever.invoke(query)
+        retriever = get_retriever(model=model, k=_candidate_k(cat))
+        candidates = _fuse_lexical(model, query, retriever.invoke(query), cat)
+        docs = rerank_by_category(candidates, model, cat, SEARCH_K)
     except Exception as e:
         logger.warning("매뉴얼 검색 오류 (model=%s, category=%s): %s", model, cat, e)
         docs = []
 
-    # Level 1 폴백: 카테고리 필터 제거 후 재검색
-    if not docs and cat:
-        logger.info("카테고리 필터 '%s' 제거 후 재검색 (model=%s)", cat, model)
-        try:
-            retriever = get_retriever(model=model, category=None, k=5)
-            docs = retriever.invoke(query)
-        except Exception as e:
-            logger.warning("폴백 검색 오류 (model=%s): %s", model, e)
-            docs = []
+    return _format_search_result(model, query, docs)
+
+
+async def _asearch_manual(model: str, query: str, category: str = "") -> str:
+    """search_manual의 비동기 경로 — 이벤트 루프를 블로킹하지 않는다."""
+    if model not in VALID_MODELS:
+        return _unsupported_model_message(model)
+
+    cat = category if category and category in VALID_CATEGORIES else None
+
+    try:
+        vector_docs = await asearch_documents(model=model, query=query, k=_candidate_k(cat))
+        # BM25 채점과 색인 지연 구축은 CPU 바운드 → 검색 스레드 풀에서 실행
+        candidates = await run_in_search_executor(_fuse_lexical, model, query, vector_docs, cat)
+        docs = rerank_by_category(candidates, model, cat, SEARCH_K)
+    except (OpenAIError, ChromaError, OSError, ValueError, KeyError) as e:
+        # 임베딩 API 오류, Chroma 질의 오류, 녹화 재생 미스(KeyError)
+        logger.warning("매뉴얼 검색 오류 (model=%s, category=%s): %s", model, cat, e)
+        docs = []
+
+    return _format_search_result(model, query, docs)
+
+
+# invoke()는 동기 경로, ainvoke()는 네이티브 비동기 경로를 사용한다
+search_manual = StructuredTool.from_function(
+    func=_search_manual,
+    coroutine=_asearch_manual,
+    name="search_manual",
+)
+
+
+def _candidate_k(category: str | None) -> int:
+    """카테고리 재정렬이 필요하면 넓은 후보 집합을, 아니면 SEARCH_K를 반환"""
+    return max(settings.rag_candidate_k, SEARCH_K) if category else SEARCH_K
+
+
+def _fuse_lexical(model: str, query: str, vector_docs: list, category: str | None) -> list:
+    """벡터 검색 후보에 기종별 BM25 검색 결과를 RRF로 융합한다.
+
+    rag_hybrid_search가 꺼져 있거나 색인이 비어 있으면 벡터 결과를 그대로 반환.
+    """
+    if not settings.rag_hybrid_search:
+        return vector_docs
+
+    try:
+        lexical_docs = get_lexical_index(model).search(query, k=_candidate_k(category))
+    except (ChromaError, OSError, ValueError, KeyError) as e:
+        # 색인 파일 읽기/형식 오류, 검색 결과 본문 조회(Chroma) 오류
+        logger.warning("어휘 검색 오류 (model=%s): %s", model, e)
+        return vector_docs
+
+    if not lexical_docs:
+        return vector_docs
+    return reciprocal_rank_fusion([vector_docs, lexical_docs])
+
+
+def _unsupported_model_message(model: str) -> str:
+    """미지원 기종 안내 메시지"""
+    return (
+        f"지원하지 않는 기종입니다: {model}. "
+        f"지원 기종: {', '.join(sorted(VALID_MODELS))}"
+    )
+
 
+def _format_search_result(model: str, query: str, docs: list) -> str:
+    """검색된 문서를 에이전트 컨텍스트용 텍스트로 변환한다."""
     # Level 2 폴백: 구조화된 실패 메시지
     if not docs:
         return (
@@ -1,5 +1,10 @@
 """공통 테스트 픽스처"""
 
+import os
+
+# src.config.Settings 필수값 — 외부 API를 호출하지 않는 단위 테스트용 더미 키
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
 import pytest
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
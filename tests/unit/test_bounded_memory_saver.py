@@ -0,0 +1,94 @@
+"""BoundedMemorySaver — 유휴 TTL / 바이트 상한 LRU 퇴출 테스트"""
+
+from langgraph.checkpoint.base import create_checkpoint, empty_checkpoint
+
+from src.graph import checkpointer as checkpointer_module
+from src.graph.checkpointer import BoundedMemorySaver
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _put(saver: BoundedMemorySaver, thread_id: str, text: str, step: int = 0, config=None):
+    checkpoint = create_checkpoint(empty_checkpoint(), None, step)
+    checkpoint["channel_values"] = {"answer": text}
+    checkpoint["channel_versions"] = {"answer": step + 1}
+    config = config or {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    return saver.put(config, checkpoint, {"step": step}, {"answer": step + 1})
+
+
+def _get(saver: BoundedMemorySaver, thread_id: str):
+    return saver.get_tuple({"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}})
+
+
+def test_idle_sessions_expire_on_sweep(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(checkpointer_module.time, "monotonic", clock)
+    saver = BoundedMemorySaver(ttl_seconds=60)
+
+    _put(saver, "old", "a" * 100)
+    clock.now += 30
+    _put(saver, "recent", "b" * 100)
+    clock.now += 40  # old: 70초 유휴, recent: 40초 유휴
+
+    assert saver.sweep() == 1
+    assert _get(saver, "old") is None
+    assert _get(saver, "recent") is not None
+    stats = saver.stats
+    assert stats["evicted_ttl"] == 1
+    assert stats["live_sessions"] == 1
+
+
+def test_read_refreshes_idle_time(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(checkpointer_module.time, "monotonic", clock)
+    saver = BoundedMemorySaver(ttl_seconds=60)
+
+    _put(saver, "t1", "a" * 100)
+    clock.now += 50
+    assert _get(saver, "t1") is not None
+    clock.now += 50
+    assert saver.sweep() == 0
+
+
+def test_byte_budget_evicts_least_recently_used():
+    saver = BoundedMemorySaver(max_bytes=10_000)
+    _put(saver, "t1", "a" * 3000)
+    _put(saver, "t2", "b" * 3000)
+    _get(saver, "t1")  # t1 최근 사용 → t2가 가장 오래됨
+    _put(saver, "t3", "c" * 5000)
+
+    assert _get(saver, "t2") is None
+    assert _get(saver, "t1") is not None
+    assert _get(saver, "t3") is not None
+    stats = saver.stats
+    assert stats["evicted_lru"] == 1
+    assert stats["bytes_held"] <= saver.max_bytes
+
+
+def test_current_session_is_never_evicted():
+    saver = BoundedMemorySaver(max_bytes=1000)
+    _put(saver, "big", "x" * 5000)
+    assert _get(saver, "big") is not None
+    assert saver.stats["evicted_lru"] == 0
+
+
+def test_delete_and_prune_release_bytes():
+    saver = BoundedMemorySaver()
+    config = _put(saver, "t1", "a" * 2000, step=0)
+    config = _put(saver, "t1", "b" * 2000, step=1, config=config)
+    held = saver.stats["bytes_held"]
+
+    saver.prune_before("t1", "", config["configurable"]["checkpoint_id"])
+    assert saver.stats["bytes_held"] < held
+    assert saver.stats["bytes_held"] == saver._thread_bytes("t1")
+    assert _get(saver, "t1").checkpoint["channel_values"]["answer"] == "b" * 2000
+
+    saver.delete_thread("t1")
+    assert saver.stats["bytes_held"] == 0
+    assert saver.stats["live_sessions"] == 0
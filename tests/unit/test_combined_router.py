@@ -0,0 +1,36 @@
+"""통합 라우터 — 구조화 출력 실패 폴백 테스트"""
+
+import pytest
+from langchain_core.messages import HumanMessage
+from openai import OpenAIError
+
+from src.graph.nodes import combined_router
+
+
+class FailingLLM:
+    def __init__(self, error: Exception):
+        self.error = error
+
+    async def ainvoke(self, messages):
+        raise self.error
+
+
+async def test_api_error_falls_back_to_unidentified(monkeypatch):
+    monkeypatch.setattr(
+        combined_router, "_get_structured_llm", lambda: FailingLLM(OpenAIError("timeout"))
+    )
+    state = {"messages": [HumanMessage(content="설치는 어떻게 하나요?")]}
+
+    update = await combined_router.combined_router_node(state)
+    # unidentified 폴백 → 기종 선택 안내
+    assert "어떤 InBody 기종" in update["answer"]
+
+
+async def test_programming_error_is_not_hidden(monkeypatch):
+    monkeypatch.setattr(
+        combined_router, "_get_structured_llm", lambda: FailingLLM(AttributeError("bug"))
+    )
+    state = {"messages": [HumanMessage(content="설치는 어떻게 하나요?")]}
+
+    with pytest.raises(AttributeError):
+        await combined_router.combined_router_node(state)
@@ -0,0 +1,108 @@
+"""CompactingCheckpointSaver — 턴 경계 체크포인트만 저장하는지 테스트"""
+
+import operator
+from typing import Annotated, TypedDict
+
+from langgraph.graph import END, START, StateGraph
+
+from src.graph import workflow
+from src.graph.checkpointer import BoundedMemorySaver, CompactingCheckpointSaver
+
+
+class TurnState(TypedDict):
+    steps: Annotated[list[str], operator.add]
+    history_bytes: int
+
+
+def _graph(saver):
+    """router → agent → memory(턴 경계 채널 갱신) 3단계 그래프"""
+    graph = StateGraph(TurnState)
+    graph.add_node("router", lambda state: {"steps": ["router"]})
+    graph.add_node("agent", lambda state: {"steps": ["agent"]})
+    graph.add_node(
+        "memory",
+        lambda state: {"history_bytes": (state.get("history_bytes") or 0) + 10},
+    )
+    graph.add_edge(START, "router")
+    graph.add_edge("router", "agent")
+    graph.add_edge("agent", "memory")
+    graph.add_edge("memory", END)
+    return graph.compile(checkpointer=saver)
+
+
+def _persisted_ids(inner: BoundedMemorySaver, thread_id: str) -> list[str]:
+    return list(inner.storage.get(thread_id, {}).get("", {}))
+
+
+async def test_only_turn_boundaries_are_persisted():
+    inner = BoundedMemorySaver()
+    saver = CompactingCheckpointSaver(inner, boundary_channels=("history_bytes",))
+    graph = _graph(saver)
+    config = {"configurable": {"thread_id": "t1"}}
+
+    for _ in range(3):
+        await graph.ainvoke({"steps": []}, config)
+
+    state = await graph.aget_state(config)
+    assert state.values["steps"] == ["router", "agent"] * 3
+    assert state.values["history_bytes"] == 30
+    # 이전 턴은 정리되고 마지막 턴 종료 체크포인트 1개만 남는다
+    assert len(_persisted_ids(inner, "t1")) == 1
+
+    stats = saver.stats["compaction"]
+    assert stats["turns"] == 3
+    assert stats["scratch_checkpoints"] > stats["persisted_checkpoints"]
+    assert stats["scratch_threads"] == 0
+
+
+def test_sync_api_uses_same_compaction():
+    inner = BoundedMemorySaver()
+    saver = CompactingCheckpointSaver(inner, boundary_channels=("history_bytes",))
+    graph = _graph(saver)
+    config = {"configurable": {"thread_id": "t1"}}
+
+    graph.invoke({"steps": []}, config)
+    graph.invoke({"steps": []}, config)
+
+    assert graph.get_state(config).values["history_bytes"] == 20
+    assert len(_persisted_ids(inner, "t1")) == 1
+    assert len(list(saver.list(config))) == 1
+
+    saver.delete_thread("t1")
+    assert saver.get_tuple(config) is None
+
+
+async def test_scratch_checkpoint_is_visible_mid_turn():
+    inner = BoundedMemorySaver()
+    saver = CompactingCheckpointSaver(inner, boundary_channels=("history_bytes",))
+    graph = _graph(saver)
+    config = {"configurable": {"thread_id": "t1"}}
+    await graph.ainvoke({"steps": []}, config)
+
+    # 다음 턴 도중(agent 이전)에 멈춘 상태 재현
+    await graph.ainvoke({"steps": []}, config, interrupt_before=["agent"])
+
+    latest = await saver.aget_tuple(config)
+    assert latest.checkpoint["channel_values"]["steps"][-1] == "router"
+    # 내부 저장소에는 직전 턴 종료 상태만 있다
+    persisted = await inner.aget_tuple(config)
+    assert persisted.checkpoint["channel_values"]["history_bytes"] == 10
+    assert saver.stats["compaction"]["scratch_threads"] == 1
+
+
+async def test_close_checkpointer_resets_compiled_workflow(monkeypatch):
+    monkeypatch.setattr(workflow.settings, "checkpointer_backend", "memory")
+    monkeypatch.setattr(workflow, "_checkpointer", None)
+    monkeypatch.setattr(workflow, "_compiled_workflow", None)
+
+    first = workflow.get_compiled_workflow()
+    assert workflow.get_compiled_workflow() is first
+
+    await workflow.close_checkpointer()
+    assert workflow._compiled_workflow is None
+    assert workflow.get_compile_time_ms() is None
+
+    second = workflow.get_compiled_workflow()
+    assert second is not first
+    assert second.checkpointer is workflow.get_checkpointer()
+    await workflow.close_checkpointer()
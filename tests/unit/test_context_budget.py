@@ -0,0 +1,59 @@
+"""컨텍스트 예산 — 토크나이저 로드 실패 시 근사치 폴백 테스트"""
+
+import threading
+
+import pytest
+import requests
+import tiktoken
+
+from src.graph import context_budget
+
+
+@pytest.fixture(autouse=True)
+def _clear_encoder_cache():
+    context_budget._get_encoder.cache_clear()
+    yield
+    context_budget._get_encoder.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "error",
+    [requests.exceptions.ConnectionError("offline"), OSError("read-only"), ValueError("hash")],
+)
+def test_encoder_load_failure_falls_back_to_estimate(monkeypatch, error):
+    def fail(*args, **kwargs):
+        raise error
+
+    monkeypatch.setattr(tiktoken, "encoding_for_model", fail)
+    monkeypatch.setattr(tiktoken, "get_encoding", fail)
+
+    text = "전극을 알코올 솜으로 닦아 주세요"
+    assert context_budget.count_tokens(text, model="gpt-4o") == len(text.encode()) // 4
+    assert context_budget.count_tokens("", model="gpt-4o") == 0
+
+
+def test_unknown_model_uses_default_encoding(monkeypatch):
+    sentinel = object()
+
+    def unknown(model):
+        raise KeyError(model)
+
+    monkeypatch.setattr(tiktoken, "encoding_for_model", unknown)
+    monkeypatch.setattr(tiktoken, "get_encoding", lambda name: sentinel)
+    assert context_budget._get_encoder("custom-model") is sentinel
+
+
+async def test_warm_encoder_loads_off_the_event_loop(monkeypatch):
+    loaded_in = []
+    sentinel = object()
+
+    def load(model):
+        loaded_in.append(threading.current_thread())
+        return sentinel
+
+    monkeypatch.setattr(tiktoken, "encoding_for_model", load)
+    assert await context_budget.warm_encoder("gpt-4o") is True
+    assert loaded_in and loaded_in[0] is not threading.main_thread()
+    # 이후 요청 경로에서는 캐시된 인코더를 쓴다
+    assert context_budget._get_encoder("gpt-4o") is sentinel
+    assert len(loaded_in) == 1
@@ -0,0 +1,71 @@
+"""질의 임베딩 캐시 (메모리 LRU + SQLite) 테스트"""
+
+from langchain_core.embeddings import Embeddings
+
+from src.rag.embedding_cache import CachedEmbeddings, normalize_query
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self):
+        self.calls = 0
+
+    def embed_documents(self, texts):
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text):
+        self.calls += 1
+        return [0.1, 0.2, len(text) / 3]
+
+    async def aembed_query(self, text):
+        return self.embed_query(text)
+
+
+def test_normalize_query():
+    assert normalize_query("  전원이   안 켜져요\n") == normalize_query("전원이 안 켜져요")
+    assert normalize_query("E001") == normalize_query("e001")
+
+
+def test_memory_tier_hit():
+    backend = CountingEmbeddings()
+    cache = CachedEmbeddings(backend, model_name="test")
+
+    first = cache.embed_query("E001 에러")
+    assert cache.embed_query("e001  에러") == first
+    assert backend.calls == 1
+    assert cache.stats()["memory_hits"] == 1
+
+
+def test_memory_lru_eviction():
+    backend = CountingEmbeddings()
+    cache = CachedEmbeddings(backend, model_name="test", max_size=2)
+
+    for text in ("a", "b", "c"):
+        cache.embed_query(text)
+    cache.embed_query("a")
+    assert backend.calls == 4
+    assert cache.stats()["memory_size"] == 2
+
+
+async def test_disk_tier_survives_restart(tmp_path):
+    path = tmp_path / "embeddings.sqlite"
+    backend = CountingEmbeddings()
+    miss = await CachedEmbeddings(backend, "test", persist_path=path).aembed_query("전극 청소")
+
+    restarted = CachedEmbeddings(backend, "test", persist_path=path)
+    disk = await restarted.aembed_query("전극 청소")
+    memory = await restarted.aembed_query("전극 청소")
+
+    assert backend.calls == 1
+    # 신규/디스크/메모리 결과가 같은 float32 정밀도
+    assert miss == disk == memory
+    stats = restarted.stats()
+    assert stats["disk_hits"] == 1
+    assert stats["memory_hits"] == 1
+
+
+def test_model_name_is_part_of_key(tmp_path):
+    path = tmp_path / "embeddings.sqlite"
+    backend = CountingEmbeddings()
+    CachedEmbeddings(backend, "model-a", persist_path=path).embed_query("측정")
+    CachedEmbeddings(backend, "model-b", persist_path=path).embed_query("측정")
+    assert backend.calls == 2
@@ -0,0 +1,60 @@
+"""임베딩 제공자 — 녹화 재생 테스트"""
+
+import json
+from types import SimpleNamespace
+
+import langchain_openai
+import pytest
+
+from src.rag.embeddings import ReplayEmbeddings, create_embedding_provider
+
+
+class FakeOpenAIEmbeddings:
+    created = 0
+
+    def __init__(self, **kwargs):
+        FakeOpenAIEmbeddings.created += 1
+
+    def embed_documents(self, texts):
+        return [[float(len(text))] for text in texts]
+
+
+def _settings(path, record: bool):
+    return SimpleNamespace(
+        embedding_provider="replay",
+        embedding_replay_path=str(path),
+        embedding_replay_record=record,
+        embedding_model="text-embedding-3-small",
+        openai_api_key="sk-test",
+    )
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    FakeOpenAIEmbeddings.created = 0
+    monkeypatch.setattr(langchain_openai, "OpenAIEmbeddings", FakeOpenAIEmbeddings)
+    return FakeOpenAIEmbeddings
+
+
+def test_replay_only_never_builds_openai_backend(fake_openai, tmp_path):
+    path = tmp_path / "replay.jsonl"
+    key = ReplayEmbeddings._key("전원")
+    path.write_text(json.dumps({"key": key, "vector": [1.0]}) + "\n", encoding="utf-8")
+
+    provider = create_embedding_provider(_settings(path, record=False))
+    assert provider.embed_query("전원") == [1.0]
+    with pytest.raises(KeyError):
+        provider.embed_query("미녹화")
+    assert fake_openai.created == 0
+
+
+def test_record_mode_builds_backend_on_first_miss(fake_openai, tmp_path):
+    path = tmp_path / "replay.jsonl"
+    provider = create_embedding_provider(_settings(path, record=True))
+    assert fake_openai.created == 0
+
+    assert provider.embed_query("abc") == [3.0]
+    assert provider.embed_query("abc") == [3.0]
+    assert provider.embed_query("abcd") == [4.0]
+    assert fake_openai.created == 1
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
@@ -0,0 +1,91 @@
+"""인제스트 파이프라인 — 매니페스트 대비 고아 청크 정리 테스트"""
+
+from src.rag import pipeline
+from src.rag.ingest import hash_file
+
+
+async def test_orphaned_chunks_are_deleted(monkeypatch, tmp_path):
+    model_dir = tmp_path / "270S"
+    model_dir.mkdir()
+    pdf = model_dir / "manual.pdf"
+    pdf.write_bytes(b"%PDF-unchanged")
+
+    # 변경 없는 파일 1개 — 파싱/임베딩 없이 기존 청크 "keep"만 유지되어야 한다
+    manifest = {"270S": {"manual.pdf": {"file_hash": hash_file(pdf), "chunks": {"keep": "h"}}}}
+    deleted: dict[str, list[str]] = {}
+
+    def fake_delete(model, ids):
+        deleted[model] = list(ids)
+        return len(ids)
+
+    monkeypatch.setattr(pipeline, "list_document_ids", lambda model: {"keep", "renamed-old"})
+    monkeypatch.setattr(pipeline, "delete_documents_from_collection", fake_delete)
+    monkeypatch.setattr(pipeline, "finalize_collection_writes", lambda model: None)
+
+    report = await pipeline.run_ingest_pipeline(tmp_path, ["270S"], manifest, embeddings=None)
+
+    assert deleted == {"270S": ["renamed-old"]}
+    assert report.deleted == 1
+    assert manifest["270S"]["manual.pdf"]["chunks"] == {"keep": "h"}
+
+
+async def test_full_reingest_removes_chunks_of_deleted_files(monkeypatch, tmp_path):
+    (tmp_path / "580").mkdir()
+    deleted: dict[str, list[str]] = {}
+
+    monkeypatch.setattr(pipeline, "list_document_ids", lambda model: {"gone-1", "gone-2"})
+    monkeypatch.setattr(
+        pipeline,
+        "delete_documents_from_collection",
+        lambda model, ids: deleted.setdefault(model, list(ids)) and len(ids),
+    )
+    monkeypatch.setattr(pipeline, "finalize_collection_writes", lambda model: None)
+
+    # --full: 빈 매니페스트에서 시작
+    await pipeline.run_ingest_pipeline(tmp_path, ["580"], {}, embeddings=None)
+
+    assert deleted == {"580": ["gone-1", "gone-2"]}
+
+
+async def test_streaming_ingest_upserts_only_changed_chunks(monkeypatch, tmp_path):
+    model_dir = tmp_path / "270S"
+    model_dir.mkdir()
+    (model_dir / "manual.pdf").write_bytes(b"%PDF-changed")
+    manifest = {
+        "270S": {"manual.pdf": {"file_hash": "old", "chunks": {"a": "h1", "b": "h2", "c": "h3"}}}
+    }
+    pages = [
+        [{"id": "a", "text": "A", "hash": "h1"}, {"id": "b", "text": "B", "hash": "h2-new"}],
+        [],
+        [{"id": "d", "text": "D", "hash": "h4"}],
+    ]
+    upserted: list[str] = []
+    deleted: dict[str, list[str]] = {}
+
+    class FakeEmbeddings:
+        async def aembed_documents(self, texts):
+            return [[0.0] for _ in texts]
+
+    def fake_upsert(model, chunks, vectors):
+        upserted.extend(chunk["id"] for chunk in chunks)
+        return len(chunks)
+
+    monkeypatch.setattr(pipeline.settings, "ingest_streaming", True)
+    monkeypatch.setattr(pipeline, "iter_page_chunks", lambda path, model: iter(pages))
+    monkeypatch.setattr(pipeline, "upsert_embedded_documents", fake_upsert)
+    monkeypatch.setattr(pipeline, "list_document_ids", lambda model: {"a", "b", "c", "d"})
+    monkeypatch.setattr(
+        pipeline,
+        "delete_documents_from_collection",
+        lambda model, ids: deleted.setdefault(model, list(ids)) and len(ids),
+    )
+    monkeypatch.setattr(pipeline, "finalize_collection_writes", lambda model: None)
+
+    report = await pipeline.run_ingest_pipeline(tmp_path, ["270S"], manifest, FakeEmbeddings())
+
+    assert sorted(upserted) == ["b", "d"]
+    assert deleted == {"270S": ["c"]}
+    assert report.pages == 3
+    entry = manifest["270S"]["manual.pdf"]
+    assert entry["chunks"] == {"a": "h1", "b": "h2-new", "d": "h4"}
+    assert entry["file_hash"] != "old"
@@ -0,0 +1,68 @@
+"""로컬 의도 분류기 테스트 — data/seed/intent_examples.json 라벨 기준"""
+
+import pytest
+
+from src.config import settings
+from src.graph.intent_classifier import (
+    IntentClassifier,
+    build_keyword_table,
+    load_examples,
+)
+
+THRESHOLD = settings.intent_classifier_threshold
+
+
+@pytest.fixture(scope="module")
+def examples():
+    rows = load_examples()
+    assert rows, "seed 의도 예시가 필요합니다"
+    return rows
+
+
+@pytest.fixture(scope="module")
+def keywords():
+    return build_keyword_table()
+
+
+def test_leave_one_out_local_decisions_are_correct(examples, keywords):
+    """학습에 쓰지 않은 예시를 임계값 이상으로 분류하면 정답이어야 한다 (나머지는 LLM 폴백)."""
+    local = 0
+    wrong = []
+    for i, (text, expected) in enumerate(examples):
+        classifier = IntentClassifier(examples[:i] + examples[i + 1:], keywords)
+        intent, confidence = classifier.predict(text)
+        if confidence >= THRESHOLD:
+            local += 1
+            if intent != expected:
+                wrong.append((text, expected, intent, round(confidence, 2)))
+
+    assert wrong == []
+    # 로컬 분류로 LLM 호출을 건너뛰는 비율 하한
+    assert local / len(examples) >= 0.3
+
+
+@pytest.mark.parametrize(
+    "text, wrong_intent",
+    [
+        ("전원이 안 켜져요", "install"),
+        ("체중이 0으로 나와요", "clinical"),
+        ("결과지 해석 방법", "connect"),
+    ],
+)
+def test_symptoms_are_not_routed_locally_to_wrong_intent(examples, keywords, text, wrong_intent):
+    held_out = [row for row in examples if row[0] != text]
+    intent, confidence = IntentClassifier(held_out, keywords).predict(text)
+    assert not (intent == wrong_intent and confidence >= THRESHOLD)
+
+
+def test_error_code_is_troubleshoot(examples, keywords):
+    classifier = IntentClassifier(examples, keywords)
+    assert classifier.predict("E012 에러가 떠요") == ("troubleshoot", 1.0)
+    assert classifier.predict("에러 코드 104") == ("troubleshoot", 1.0)
+
+
+def test_keyword_table_excludes_ambiguous_terms(keywords):
+    assert "전원이 안" not in keywords["install"]
+    for term in ("증상", "신장", "수술"):
+        assert term not in keywords["clinical"]
+    assert all(len(k) > 1 for ks in keywords.values() for k in ks)
@@ -0,0 +1,94 @@
+"""BM25 어휘 색인 테스트"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from langchain_core.documents import Document
+
+from src.rag.lexical_index import LexicalIndex, reciprocal_rank_fusion, tokenize
+
+
+def _index() -> LexicalIndex:
+    index = LexicalIndex()
+    index.add(
+        ["a", "b", "c"],
+        [
+            "E012 에러: 전극 접촉 불량. 전극을 청소하세요.",
+            "측정 전 금속 액세서리를 제거하세요.",
+            "LookInBody 연동 설정 방법",
+        ],
+        [{"model": "270S"}, {"model": "270S"}, {"model": "270S"}],
+    )
+    return index
+
+
+def test_tokenize_korean_bigrams():
+    assert tokenize("E012 전극청소") == ["e012", "전극", "극청", "청소"]
+
+
+def test_search_ranks_exact_terms():
+    index = _index()
+    assert index.search("e012 에러", k=1)[0].page_content.startswith("E012")
+    assert index.search("lookinbody", k=1)[0].page_content.startswith("LookInBody")
+    assert index.search("없는단어") == []
+
+
+def test_remove_rebuilds_postings():
+    index = _index()
+    index.remove(["a"])
+    assert all("E012" not in doc.page_content for doc in index.search("전극", k=3))
+
+
+def test_concurrent_first_search_builds_once(monkeypatch):
+    index = _index()
+    builds = []
+    original = LexicalIndex._build
+
+    def counting_build(self):
+        builds.append(1)
+        original(self)
+
+    monkeypatch.setattr(LexicalIndex, "_build", counting_build)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: index.search("전극 청소", k=1), range(32)))
+
+    assert len(builds) == 1
+    assert all(result[0].page_content.startswith("E012") for result in results)
+
+
+def test_reciprocal_rank_fusion_dedupes():
+    index = _index()
+    vector = index.search("측정", k=2)
+    lexical = index.search("전극", k=2)
+    fused = reciprocal_rank_fusion([vector, lexical])
+    assert len({doc.page_content for doc in fused}) == len(fused)
+
+
+def test_saved_index_has_no_document_text(tmp_path):
+    path = tmp_path / "inbody_270s.json"
+    index = _index()
+    index.path = path
+    index.save()
+
+    raw = path.read_text(encoding="utf-8")
+    assert "LookInBody 연동 설정 방법" not in raw
+
+    fetched = []
+
+    def fetch(ids):
+        fetched.append(ids)
+        return [Document(page_content=f"chroma:{doc_id}") for doc_id in ids]
+
+    loaded = LexicalIndex.load(path, fetch=fetch)
+    assert [doc.page_content for doc in loaded.search("e012", k=1)] == ["chroma:a"]
+    assert fetched == [["a"]]
+
+
+def test_load_legacy_format(tmp_path):
+    path = tmp_path / "legacy.json"
+    path.write_text(
+        json.dumps({"x": {"text": "전극 청소 방법", "metadata": {}}}, ensure_ascii=False),
+        encoding="utf-8",
+    )
+    index = LexicalIndex.load(path, fetch=lambda ids: [Document(page_content=i) for i in ids])
+    assert index.search_ids("전극") == ["x"]
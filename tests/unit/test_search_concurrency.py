@@ -0,0 +1,107 @@
+"""비동기 매뉴얼 검색 — 동시 검색 중 이벤트 루프 지연 테스트"""
+
+import asyncio
+import time
+
+import pytest
+from langchain_core.documents import Document
+
+from src.rag import vectorstore
+from src.rag.embeddings import HashingEmbeddings
+from src.rag.lexical_index import LexicalIndex
+from src.tools import manual_search_tool
+from src.tools.manual_search_tool import search_manual
+
+# Chroma 질의 1건의 블로킹 시간 (디스크 I/O 흉내)
+QUERY_BLOCK_SECONDS = 0.1
+HEARTBEAT_INTERVAL = 0.01
+MAX_LAG_SECONDS = 0.05
+
+TEXTS = [
+    "E012 에러: 전극 접촉 불량. 전극을 청소하세요.",
+    "전원이 켜지지 않으면 어댑터 연결을 확인하세요.",
+    "LookInBody 연동 설정 방법",
+    "측정 전 금속 액세서리를 제거하세요.",
+]
+
+
+class BlockingRetriever:
+    def __init__(self, store, search_kwargs):
+        self.vectorstore = store
+        self.search_kwargs = search_kwargs
+
+    def invoke(self, query):
+        embedding = vectorstore.get_embeddings().embed_query(query)
+        return self.vectorstore.similarity_search_by_vector(embedding, **self.search_kwargs)
+
+
+class BlockingVectorStore:
+    """질의마다 스레드를 QUERY_BLOCK_SECONDS 동안 붙잡는 스텁 저장소"""
+
+    def as_retriever(self, search_type, search_kwargs):
+        return BlockingRetriever(self, search_kwargs)
+
+    def similarity_search_by_vector(self, embedding, k, filter):
+        time.sleep(QUERY_BLOCK_SECONDS)
+        return [
+            Document(page_content=text, metadata={"model": "270S", "chunk_id": str(i)})
+            for i, text in enumerate(TEXTS[:k])
+        ]
+
+
+@pytest.fixture
+def stub_search(monkeypatch, tmp_path):
+    store = BlockingVectorStore()
+    index = LexicalIndex()
+    index.add(
+        [str(i) for i in range(len(TEXTS))],
+        TEXTS,
+        [{"model": "270S", "chunk_id": str(i)} for i in range(len(TEXTS))],
+    )
+    embeddings = HashingEmbeddings(size=64)
+    monkeypatch.setattr(vectorstore.settings, "lexical_index_dir", str(tmp_path))
+    monkeypatch.setattr(vectorstore, "get_vectorstore", lambda model: store)
+    monkeypatch.setattr(vectorstore, "get_embeddings", lambda: embeddings)
+    monkeypatch.setattr(vectorstore, "_retrievers", {})
+    monkeypatch.setattr(vectorstore, "_collection_versions", {})
+    monkeypatch.setattr(manual_search_tool, "get_lexical_index", lambda model: index)
+    monkeypatch.setattr(manual_search_tool.settings, "rag_hybrid_search", True)
+
+
+async def _max_lag(searches) -> float:
+    """검색을 실행하는 동안 하트비트 코루틴의 최대 지연(초)을 반환한다."""
+    stop = asyncio.Event()
+    lags: list[float] = []
+
+    async def heartbeat():
+        while not stop.is_set():
+            expected = time.perf_counter() + HEARTBEAT_INTERVAL
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            lags.append(max(0.0, time.perf_counter() - expected))
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(HEARTBEAT_INTERVAL * 2)
+    results = await searches()
+    stop.set()
+    await beat
+    assert all("검색 결과" in result for result in results)
+    return max(lags)
+
+
+async def test_async_search_keeps_event_loop_responsive(stub_search):
+    payloads = [{"model": "270S", "query": TEXTS[i % len(TEXTS)]} for i in range(50)]
+
+    lag = await _max_lag(
+        lambda: asyncio.gather(*(search_manual.ainvoke(p) for p in payloads))
+    )
+    assert lag < MAX_LAG_SECONDS
+
+
+async def test_sync_search_blocks_event_loop(stub_search):
+    """대조군: async 노드 안의 동기 호출은 질의 시간만큼 루프를 멈춘다."""
+    payload = {"model": "270S", "query": TEXTS[0]}
+
+    async def sync_searches():
+        return [search_manual.invoke(payload) for _ in range(3)]
+
+    assert await _max_lag(sync_searches) >= QUERY_BLOCK_SECONDS
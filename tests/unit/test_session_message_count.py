@@ -0,0 +1,63 @@
+"""세션 message_count — 윈도우 압축 후에도 누적 사용자 메시지 수 유지"""
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph.message import add_messages
+
+from src.api import sessions
+from src.config import settings
+from src.graph.nodes.memory import memory_node
+
+
+async def _run_turns(n: int) -> dict:
+    state: dict = {"messages": []}
+    for i in range(n):
+        state["messages"] = add_messages(state["messages"], [HumanMessage(content=f"질문 {i}")])
+        state["answer"] = f"답변 {i}"
+        update = await memory_node(state)
+        state["messages"] = add_messages(state["messages"], update["messages"])
+        state.update({k: v for k, v in update.items() if k != "messages"})
+    return state
+
+
+async def test_turn_count_survives_window_compaction():
+    turns = settings.memory_window_turns + 3
+    state = await _run_turns(turns)
+
+    assert state["turn_count"] == turns
+    assert sum(1 for m in state["messages"] if m.type == "human") == settings.memory_window_turns
+
+
+async def test_turn_count_starts_from_existing_history():
+    """카운터 도입 이전 세션은 남아 있는 사용자 메시지 수에서 이어서 센다."""
+    state = {
+        "messages": [
+            HumanMessage(content="a", id="1"),
+            AIMessage(content="b", id="2"),
+            HumanMessage(content="c", id="3"),
+        ],
+        "answer": "d",
+    }
+    assert (await memory_node(state))["turn_count"] == 2
+
+
+async def test_session_endpoint_reports_user_turns(monkeypatch):
+    saver = InMemorySaver()
+    monkeypatch.setattr(sessions, "get_checkpointer", lambda: saver)
+    state = await _run_turns(settings.memory_window_turns + 2)
+
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = {
+        "messages": state["messages"],
+        "turn_count": state["turn_count"],
+        "identified_model": "270S",
+    }
+    versions = dict.fromkeys(checkpoint["channel_values"], 1)
+    checkpoint["channel_versions"] = versions
+    config = {"configurable": {"thread_id": "t1", "checkpoint_ns": ""}}
+    await saver.aput(config, checkpoint, {}, versions)
+
+    result = await sessions.get_session("t1")
+    assert result.message_count == settings.memory_window_turns + 2
+    assert result.identified_model == "270S"
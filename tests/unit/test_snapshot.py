@@ -0,0 +1,77 @@
+"""세션/캐시 스냅샷 — 저장 후 재시작 복원 테스트"""
+
+from collections import OrderedDict
+
+import pytest
+from langgraph.checkpoint.base import create_checkpoint, empty_checkpoint
+
+from src.graph import snapshot
+from src.graph.checkpointer import BoundedMemorySaver, CompactingCheckpointSaver
+from src.graph.nodes import guardrail
+from src.graph.serde import ZstdSerializer
+
+
+@pytest.fixture
+def restart(monkeypatch):
+    """프로세스 재시작 흉내: 새 체크포인터와 빈 검증 캐시로 교체한다."""
+
+    def _restart() -> BoundedMemorySaver:
+        saver = BoundedMemorySaver(serde=ZstdSerializer(dict_path=None))
+        wrapper = CompactingCheckpointSaver(saver, boundary_channels=("answer",))
+        monkeypatch.setattr(snapshot, "get_checkpointer", lambda: wrapper)
+        monkeypatch.setattr(guardrail, "_verdict_cache", OrderedDict())
+        return saver
+
+    return _restart
+
+
+def _config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+
+
+def _put(saver: BoundedMemorySaver, thread_id: str, answer: str) -> None:
+    checkpoint = create_checkpoint(empty_checkpoint(), None, 0)
+    checkpoint["channel_values"] = {"answer": answer}
+    checkpoint["channel_versions"] = {"answer": 1}
+    saver.put(_config(thread_id), checkpoint, {"step": 0}, {"answer": 1})
+
+
+def test_save_and_load_restores_sessions_and_verdicts(restart, tmp_path):
+    path = tmp_path / "snapshot.bin"
+    saver = restart()
+    _put(saver, "t1", "어댑터를 확인하세요")
+    guardrail._verdict_cache[("270S", "level_1", "답변")] = (True, [], None)
+
+    saved = snapshot.save_snapshot(path)
+    assert saved["sessions"] == 1
+    assert saved["guardrail_verdicts"] == 1
+
+    saver = restart()
+    loaded = snapshot.load_snapshot(path)
+    assert loaded["sessions"] == 1
+    assert loaded["guardrail_verdicts"] == 1
+    assert guardrail._verdict_cache[("270S", "level_1", "답변")] == (True, [], None)
+
+    # 세션은 첫 조회 시 복원된다
+    restored = saver.get_tuple(_config("t1"))
+    assert restored.checkpoint["channel_values"]["answer"] == "어댑터를 확인하세요"
+    assert saver.stats["snapshot_restored"] == 1
+
+
+def test_stale_snapshot_is_ignored(restart, tmp_path, monkeypatch):
+    path = tmp_path / "snapshot.bin"
+    _put(restart(), "t1", "답변")
+    snapshot.save_snapshot(path)
+
+    restart()
+    later = snapshot.time.time() + 3600 * (snapshot.settings.session_snapshot_max_age_hours + 1)
+    monkeypatch.setattr(snapshot.time, "time", lambda: later)
+    assert snapshot.load_snapshot(path) is None
+
+
+def test_corrupt_snapshot_is_ignored(restart, tmp_path):
+    path = tmp_path / "snapshot.bin"
+    path.write_bytes(b"msgpack+zstd\n\x00not-zstd")
+    restart()
+    assert snapshot.load_snapshot(path) is None
+    assert snapshot.load_snapshot(tmp_path / "missing.bin") is None
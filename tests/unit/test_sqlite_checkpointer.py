@@ -0,0 +1,107 @@
+"""SQLite 체크포인터 — 비동기/동기 API 왕복 테스트"""
+
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.base import create_checkpoint, empty_checkpoint
+
+from src.graph.checkpointer import SQLiteCheckpointSaver
+
+
+def _config(thread_id: str, checkpoint_id: str | None = None) -> dict:
+    configurable = {"thread_id": thread_id, "checkpoint_ns": ""}
+    if checkpoint_id:
+        configurable["checkpoint_id"] = checkpoint_id
+    return {"configurable": configurable}
+
+
+def _checkpoint(step: int, messages: list):
+    checkpoint = create_checkpoint(empty_checkpoint(), None, step)
+    checkpoint["channel_values"] = {"messages": messages}
+    checkpoint["channel_versions"] = {"messages": step + 1}
+    return checkpoint
+
+
+async def test_async_round_trip(tmp_path):
+    saver = SQLiteCheckpointSaver(tmp_path / "cp.sqlite")
+    messages = [HumanMessage(content="전원이 안 켜져요"), AIMessage(content="어댑터를 확인하세요")]
+
+    first = await saver.aput(_config("t1"), _checkpoint(0, messages[:1]), {"step": 0}, {})
+    second = await saver.aput(first, _checkpoint(1, messages), {"step": 1}, {})
+    await saver.aput_writes(second, [("answer", "ok")], task_id="task-1")
+
+    latest = await saver.aget_tuple(_config("t1"))
+    assert latest.config == second
+    assert latest.parent_config == first
+    assert latest.checkpoint["channel_values"]["messages"] == messages
+    assert latest.metadata == {"step": 1}
+    assert latest.pending_writes == [("task-1", "answer", "ok")]
+
+    history = [item async for item in saver.alist(_config("t1"))]
+    assert [item.metadata["step"] for item in history] == [1, 0]
+
+    # 다른 인스턴스(다른 워커)에서도 커밋된 상태를 읽는다
+    other = SQLiteCheckpointSaver(tmp_path / "cp.sqlite")
+    assert (await other.aget_tuple(_config("t1"))).config == second
+    await other.aclose()
+
+    await saver.adelete_thread("t1")
+    assert await saver.aget_tuple(_config("t1")) is None
+    assert saver.stats["commits"] >= 1
+    await saver.aclose()
+
+
+async def test_group_commit_batches_concurrent_puts(tmp_path):
+    saver = SQLiteCheckpointSaver(tmp_path / "cp.sqlite", flush_interval=0.02)
+    await asyncio.gather(*(
+        saver.aput(_config(f"t{i}"), _checkpoint(0, []), {}, {}) for i in range(10)
+    ))
+    assert saver.stats["puts"] == 10
+    assert saver.stats["commits"] < 10
+    await saver.aclose()
+
+
+async def test_aprune_before_keeps_latest(tmp_path):
+    saver = SQLiteCheckpointSaver(tmp_path / "cp.sqlite")
+    config = _config("t1")
+    for step in range(3):
+        config = await saver.aput(config, _checkpoint(step, []), {"step": step}, {})
+    await saver.aprune_before("t1", "", config["configurable"]["checkpoint_id"])
+
+    remaining = [item async for item in saver.alist(_config("t1"))]
+    assert [item.metadata["step"] for item in remaining] == [2]
+    await saver.aclose()
+
+
+def test_sync_api_without_event_loop(tmp_path):
+    saver = SQLiteCheckpointSaver(tmp_path / "cp.sqlite")
+    config = saver.put(_config("t1"), _checkpoint(0, [HumanMessage(content="hi")]), {}, {})
+    saver.put_writes(config, [("answer", "hello")], task_id="task-1")
+
+    loaded = saver.get_tuple(_config("t1"))
+    assert loaded.checkpoint["channel_values"]["messages"][0].content == "hi"
+    assert loaded.pending_writes == [("task-1", "answer", "hello")]
+    assert len(list(saver.list(_config("t1")))) == 1
+
+    saver.delete_thread("t1")
+    assert saver.get_tuple(_config("t1")) is None
+    saver.close()
+
+
+async def test_sync_api_from_worker_thread(tmp_path):
+    saver = SQLiteCheckpointSaver(tmp_path / "cp.sqlite")
+    config = await saver.aput(_config("t1"), _checkpoint(0, []), {"step": 0}, {})
+
+    loaded = await asyncio.to_thread(saver.get_tuple, _config("t1"))
+    assert loaded.config == config
+    await saver.aclose()
+
+
+async def test_sync_api_inside_event_loop_raises(tmp_path):
+    saver = SQLiteCheckpointSaver(tmp_path / "cp.sqlite")
+    await saver.aput(_config("t1"), _checkpoint(0, []), {}, {})
+
+    with pytest.raises(RuntimeError, match="비동기 API"):
+        saver.get_tuple(_config("t1"))
+    await saver.aclose()
@@ -0,0 +1,92 @@
+"""스트리밍 가드레일 테스트"""
+
+import pytest
+
+from src.api.chat import _cut_update
+from src.graph.nodes.guardrail import SAFE_FALLBACK_ANSWER, repair_answer
+from src.graph.stream_guardrail import STREAM_WINDOW_CHARS, StreamGuardrail
+from src.prompts.disclaimers import HARDWARE_DISCLAIMER, SERVICE_CENTER_INFO
+
+
+def _stream(guard: StreamGuardrail, text: str, size: int = 3) -> str | None:
+    """text를 size 글자 토큰으로 흘려보낸다. 중단되면 None, 아니면 전송된 전체 텍스트"""
+    out = []
+    for i in range(0, len(text), size):
+        out.append(guard.feed(text[i:i + size]))
+        if guard.violations:
+            return None
+    out.append(guard.flush())
+    if guard.violations:
+        return None
+    return "".join(out)
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 40])
+def test_hardware_disclaimer_passes_at_level_3(size):
+    answer = "센서 점검이 필요합니다. 서비스 센터로 연락해 주세요.\n\n" + HARDWARE_DISCLAIMER
+    guard = StreamGuardrail("270S", "level_3")
+    assert _stream(guard, answer, size) == answer
+
+
+def test_notices_with_body_in_between_pass():
+    answer = (
+        HARDWARE_DISCLAIMER + "\n\n전원 케이블을 다시 연결해 보세요. " * 3
+        + "\n\n" + SERVICE_CENTER_INFO
+    )
+    assert _stream(StreamGuardrail("580", "level_3"), answer) == answer
+
+
+def test_unsafe_repair_is_cut_at_level_3():
+    answer = "나사를 풀고 커버를 열어 내부 부품을 교체하세요. " + "추가 설명입니다. " * 10
+    guard = StreamGuardrail("270S", "level_3")
+    assert _stream(guard, answer) is None
+    assert any("Level 3" in v for v in guard.violations)
+
+
+def test_partial_notice_then_unsafe_body_is_cut():
+    """안내 문구 앞부분처럼 시작했다가 본문으로 바뀌어도 위험 키워드를 놓치지 않는다."""
+    answer = HARDWARE_DISCLAIMER[:20] + " 대신 직접 내부 부품을 분해하세요"
+    assert _stream(StreamGuardrail("270S", "level_3"), answer) is None
+
+
+def test_unsafe_repair_allowed_below_level_3():
+    answer = "내부 부품 교체는 서비스 센터에서 진행합니다. " * 3
+    assert _stream(StreamGuardrail("270S", "level_1"), answer) == answer
+
+
+def test_other_model_mention_is_cut():
+    answer = "이 방법은 InBody 770S 기종도 동일합니다. " + "설명 " * 30
+    guard = StreamGuardrail("270S", None)
+    assert _stream(guard, answer) is None
+    assert any("770S" in v for v in guard.violations)
+
+
+def test_tail_is_withheld_until_flush():
+    guard = StreamGuardrail("270S", None)
+    text = "가" * (STREAM_WINDOW_CHARS + 10)
+    assert guard.feed(text) == "가" * 10
+    assert guard.flush() == "가" * STREAM_WINDOW_CHARS
+
+
+def test_cut_answer_keeps_fixed_notices():
+    """중단된 Level 3 응답도 비스트리밍 수정 경로와 같은 안내 문구로 끝난다."""
+    answer = "센서 점검이 필요합니다. 커버를 분리하고 내부 부품을 교체하세요. " + "설명 " * 20
+    guard = StreamGuardrail("270S", "level_3")
+    assert _stream(guard, answer) is None
+
+    update, as_node = _cut_update(guard, "troubleshoot_agent", {"needs_disclaimer": False})
+    assert as_node == "fix_response"
+    assert update["answer"] == repair_answer(guard.text, "270S", "level_3", False)
+    assert update["answer"].startswith("센서 점검이 필요합니다.")
+    assert update["answer"].endswith(HARDWARE_DISCLAIMER + "\n\n" + SERVICE_CENTER_INFO)
+    assert "내부 부품을 교체" not in update["answer"]
+    assert update["guardrail_violations"] == []
+
+
+def test_cut_after_retries_uses_safe_fallback():
+    guard = StreamGuardrail("270S", "level_3")
+    assert _stream(guard, "내부 부품을 분해하세요. " * 5) is None
+
+    update, as_node = _cut_update(guard, "fix_response", {"guardrail_retry_count": 1})
+    assert as_node == "guardrail"
+    assert update["answer"] == SAFE_FALLBACK_ANSWER
@@ -0,0 +1,113 @@
+"""리트리버 캐시와 프로세스 간 무효화 테스트"""
+
+import os
+
+import chromadb
+import pytest
+
+from src.rag import vectorstore
+
+
+class FakeRetriever:
+    def __init__(self, store, search_kwargs):
+        self.vectorstore = store
+        self.search_kwargs = search_kwargs
+
+
+class FakeVectorStore:
+    def __init__(self):
+        self.queries = []
+
+    def as_retriever(self, search_type, search_kwargs):
+        return FakeRetriever(self, search_kwargs)
+
+    def similarity_search_by_vector(self, embedding, k, filter):
+        self.queries.append((embedding, k, filter))
+        return [f"doc-{i}" for i in range(k)]
+
+
+class FakeEmbeddings:
+    async def aembed_query(self, text):
+        return [0.1, 0.2]
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_path):
+    fake = FakeVectorStore()
+    monkeypatch.setattr(vectorstore.settings, "lexical_index_dir", str(tmp_path))
+    monkeypatch.setattr(vectorstore, "get_vectorstore", lambda model: fake)
+    monkeypatch.setattr(vectorstore, "get_embeddings", lambda: FakeEmbeddings())
+    monkeypatch.setattr(vectorstore, "_retrievers", {})
+    monkeypatch.setattr(vectorstore, "_lexical_indexes", {})
+    monkeypatch.setattr(vectorstore, "_collection_versions", {})
+    monkeypatch.setattr(
+        vectorstore,
+        "_retriever_stats",
+        {"hits": 0, "misses": 0, "invalidations": 0, "external_reloads": 0},
+    )
+    return fake
+
+
+def test_retriever_is_memoized(store):
+    first = vectorstore.get_retriever("270S", k=3)
+    assert vectorstore.get_retriever("270S", k=3) is first
+    assert vectorstore.get_retriever("270S", k=5) is not first
+
+    stats = vectorstore.get_retriever_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+
+def test_external_ingest_invalidates_cache(store):
+    first = vectorstore.get_retriever("270S")
+    other = vectorstore.get_retriever("580")
+
+    # 별도 프로세스(인제스트)가 270S 버전 파일을 갱신한 상황
+    path = vectorstore._version_path("270S")
+    path.write_text("external", encoding="utf-8")
+    stamp = path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(stamp, stamp))
+
+    assert vectorstore.get_retriever("270S") is not first
+    assert vectorstore.get_retriever("580") is other
+    assert vectorstore.get_retriever_cache_stats()["external_reloads"] == 1
+
+
+def test_invalidate_writes_version_file(store):
+    vectorstore.get_retriever("770S")
+    vectorstore.invalidate_retrievers("770S")
+
+    assert vectorstore._version_path("770S").exists()
+    assert vectorstore.get_retriever_cache_stats()["size"] == 0
+    # 자기 프로세스의 무효화는 외부 변경으로 다시 세지 않는다
+    vectorstore.get_retriever("770S")
+    assert vectorstore.get_retriever_cache_stats()["external_reloads"] == 0
+
+
+async def test_asearch_uses_memoized_retriever(store):
+    docs = await vectorstore.asearch_documents("970S", "전극 청소", k=2)
+
+    assert docs == ["doc-0", "doc-1"]
+    assert len(vectorstore._retrievers) == 1
+    _, k, search_filter = store.queries[0]
+    assert k == 2
+    assert search_filter == vectorstore.build_model_filter("970S")
+
+    await vectorstore.asearch_documents("970S", "전극 청소", k=2)
+    assert vectorstore.get_retriever_cache_stats()["hits"] == 1
+
+
+def test_fetch_documents_hydrates_from_chroma(monkeypatch):
+    client = chromadb.EphemeralClient()
+    collection = client.get_or_create_collection(vectorstore.COLLECTION_NAMES["580"])
+    collection.upsert(
+        ids=["c1", "c2"],
+        embeddings=[[0.0, 1.0], [1.0, 0.0]],
+        documents=["전극 청소", "체중 보정"],
+        metadatas=[{"model": "580"}, {"model": "580"}],
+    )
+    monkeypatch.setattr(vectorstore, "get_chroma_client", lambda: client)
+
+    docs = vectorstore._fetch_documents("580", ["c2", "missing", "c1"])
+    assert [doc.page_content for doc in docs] == ["체중 보정", "전극 청소"]
+    assert docs[0].metadata == {"model": "580"}
@@ -88,6 +88,12 @@ if user_input := st.chat_input("질문을 입력하세요"):
                     full_response += event.get("content", "")
                     response_placeholder.markdown(full_response + "\u258c")
 
+                elif event_type == "correction":
+                    # 가드레일이 응답을 수정 중 → 표시된 내용 폐기
+                    full_response = ""
+                    response_placeholder.markdown("안전 검증으로 응답을 다시 작성하고 있습니다...")
+                    status_container.update(label="응답 수정 중...", state="running")
+
                 elif event_type == "done":
                     full_response = event.get("response", full_response)
                     response_placeholder.markdown(full_response)